@@ -7,7 +7,7 @@ Licensed under the Apache License, Version 2.0
 """
 from panda3d.core import *
 import numpy as np
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, NamedTuple
 from enum import Enum
 from city_generator import ZoneType
 
@@ -24,6 +24,66 @@ class BuildingStyle(Enum):
     ART_DECO = 7
 
 
+class BuildingSpecs(NamedTuple):
+    """Building specifications"""
+    style: str
+    floors: int
+    height: float
+    width: float
+    depth: float
+    has_balconies: bool
+    has_fire_escape: bool
+    weathering: float
+
+
+def _make_unit_prism(name: str, sides: int, radius: float, phase: float, capped: bool) -> NodePath:
+    """
+    Build a prism of unit height (z in [0, 1]) with an open bottom.
+
+    Corners lie on a circle of the given radius, starting at `phase` degrees.
+    The result is meant to be shared via instanceTo() and sized with setScale().
+    """
+    vdata = GeomVertexData(name, GeomVertexFormat.getV3n3(), Geom.UHStatic)
+    vertex = GeomVertexWriter(vdata, "vertex")
+    normal = GeomVertexWriter(vdata, "normal")
+    tris = GeomTriangles(Geom.UHStatic)
+
+    step = 360.0 / sides
+    corners = np.radians(phase + np.arange(sides + 1) * step)
+    xs = radius * np.cos(corners)
+    ys = radius * np.sin(corners)
+    mids = np.radians(phase + (np.arange(sides) + 0.5) * step)
+
+    row = 0
+    for i in range(sides):
+        nx, ny = np.cos(mids[i]), np.sin(mids[i])
+        for vx, vy, vz in ((xs[i], ys[i], 0.0), (xs[i + 1], ys[i + 1], 0.0),
+                           (xs[i + 1], ys[i + 1], 1.0), (xs[i], ys[i], 1.0)):
+            vertex.addData3(vx, vy, vz)
+            normal.addData3(nx, ny, 0.0)
+        tris.addVertices(row, row + 1, row + 2)
+        tris.addVertices(row, row + 2, row + 3)
+        row += 4
+
+    if capped:
+        for i in range(sides):
+            vertex.addData3(xs[i], ys[i], 1.0)
+            normal.addData3(0.0, 0.0, 1.0)
+        for i in range(1, sides - 1):
+            tris.addVertices(row, row + i, row + i + 1)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(tris)
+    geom_node = GeomNode(name)
+    geom_node.addGeom(geom)
+    return NodePath(geom_node)
+
+
+# Shared rooftop primitives, sized per use with setScale()
+_UNIT_BOX = _make_unit_prism("unit_box", 4, 0.5 ** 0.5, 45.0, capped=True)  # x, y in [-0.5, 0.5]
+_UNIT_TANK = _make_unit_prism("unit_tank", 8, 1.0, 0.0, capped=False)       # octagon of radius 1
+
+
 class DetailedBuilding:
     """
     Extremely detailed building generator with realistic architecture.
@@ -41,6 +101,74 @@ class DetailedBuilding:
     - Window ledges and sills
     """
 
+    __slots__ = ('zone_type', 'seed', 'style', 'floors', 'width', 'depth',
+                 'base_color', 'accent_color', 'window_color', 'has_balconies',
+                 'has_fire_escape', 'has_rooftop_detail', 'weathering', '_specs')
+
+    FLOOR_HEIGHT = 3.2  # Slightly taller for realism
+
+    # Style candidates and cumulative weights per zone (fallback for other zones)
+    _STYLE_CUM = {
+        ZoneType.COMMERCIAL: (np.cumsum([0.5, 0.3, 0.2]),
+                              (BuildingStyle.MODERN_GLASS, BuildingStyle.OFFICE_TOWER,
+                               BuildingStyle.MIXED_USE)),
+        ZoneType.RESIDENTIAL: (np.cumsum([0.4, 0.3, 0.3]),
+                               (BuildingStyle.LUXURY_RESIDENTIAL, BuildingStyle.MODERN_CONCRETE,
+                                BuildingStyle.CLASSIC_BRICK)),
+        ZoneType.INDUSTRIAL: (np.cumsum([1.0]), (BuildingStyle.INDUSTRIAL_WAREHOUSE,)),
+    }
+    _DEFAULT_STYLE_CUM = (np.cumsum([0.7, 0.3]), (BuildingStyle.MODERN_GLASS, BuildingStyle.ART_DECO))
+
+    # Base material palettes per style
+    _BASE_COLORS = {
+        # Glass buildings - blue/green tinted glass
+        BuildingStyle.MODERN_GLASS: (
+            (0.45, 0.55, 0.65, 1.0),  # Blue glass
+            (0.50, 0.60, 0.70, 1.0),  # Light blue glass
+            (0.48, 0.58, 0.55, 1.0),  # Green-tinted glass
+        ),
+        # Modern concrete - light grays and whites
+        BuildingStyle.MODERN_CONCRETE: (
+            (0.88, 0.88, 0.92, 1.0),  # White concrete
+            (0.75, 0.75, 0.80, 1.0),  # Light gray concrete
+            (0.82, 0.85, 0.88, 1.0),  # Off-white
+        ),
+        # Brick buildings - warm reds and oranges
+        BuildingStyle.CLASSIC_BRICK: (
+            (0.65, 0.42, 0.35, 1.0),  # Red brick
+            (0.70, 0.50, 0.38, 1.0),  # Orange brick
+            (0.58, 0.38, 0.30, 1.0),  # Dark brick
+        ),
+        # Industrial - dark concrete and metal
+        BuildingStyle.INDUSTRIAL_WAREHOUSE: (
+            (0.45, 0.47, 0.50, 1.0),  # Industrial gray
+            (0.50, 0.52, 0.55, 1.0),  # Light industrial
+            (0.40, 0.42, 0.45, 1.0),  # Dark industrial
+        ),
+        # Upscale residences - creams and beiges
+        BuildingStyle.LUXURY_RESIDENTIAL: (
+            (0.92, 0.88, 0.80, 1.0),  # Cream
+            (0.88, 0.82, 0.72, 1.0),  # Beige
+            (0.95, 0.92, 0.88, 1.0),  # Ivory
+        ),
+        # Office towers - steel and glass
+        BuildingStyle.OFFICE_TOWER: (
+            (0.52, 0.58, 0.68, 1.0),  # Steel blue
+            (0.48, 0.52, 0.60, 1.0),  # Dark steel
+            (0.55, 0.60, 0.70, 1.0),  # Light steel
+        ),
+        # Art Deco - elegant tones
+        BuildingStyle.ART_DECO: (
+            (0.85, 0.80, 0.70, 1.0),  # Limestone
+            (0.75, 0.72, 0.65, 1.0),  # Sandstone
+            (0.70, 0.65, 0.58, 1.0),  # Tan stone
+        ),
+    }
+    _DEFAULT_BASE_COLORS = ((0.70, 0.70, 0.75, 1.0),)
+
+    # Window-pattern facade textures for distant buildings, keyed by (base, window) color
+    _FACADE_TEXTURES: Dict[Tuple, Texture] = {}
+
     def __init__(self, zone_type: ZoneType, seed: int = None):
         """Initialize detailed building"""
         self.zone_type = zone_type
@@ -52,7 +180,6 @@ class DetailedBuilding:
         self.floors = self._determine_floors()
         self.width = self._determine_width()
         self.depth = self._determine_depth()
-        self.floor_height = 3.2  # Slightly taller for realism
 
         # Visual parameters
         self.base_color = self._determine_base_color()
@@ -63,24 +190,16 @@ class DetailedBuilding:
         self.has_rooftop_detail = True  # Always have rooftop details
         self.weathering = np.random.uniform(0.0, 0.3)  # Weathering amount
 
+        self._specs = BuildingSpecs(self.style.name, self.floors, self.floors * self.FLOOR_HEIGHT,
+                                    self.width, self.depth, self.has_balconies,
+                                    self.has_fire_escape, self.weathering)
+
     def _determine_style(self) -> BuildingStyle:
         """Determine architectural style based on zone"""
-        if self.zone_type == ZoneType.COMMERCIAL:
-            styles = [BuildingStyle.MODERN_GLASS, BuildingStyle.OFFICE_TOWER,
-                     BuildingStyle.MIXED_USE]
-            weights = [0.5, 0.3, 0.2]
-        elif self.zone_type == ZoneType.RESIDENTIAL:
-            styles = [BuildingStyle.LUXURY_RESIDENTIAL, BuildingStyle.MODERN_CONCRETE,
-                     BuildingStyle.CLASSIC_BRICK]
-            weights = [0.4, 0.3, 0.3]
-        elif self.zone_type == ZoneType.INDUSTRIAL:
-            styles = [BuildingStyle.INDUSTRIAL_WAREHOUSE]
-            weights = [1.0]
-        else:
-            styles = [BuildingStyle.MODERN_GLASS, BuildingStyle.ART_DECO]
-            weights = [0.7, 0.3]
-
-        return np.random.choice(styles, p=weights)
+        cum, styles = self._STYLE_CUM.get(self.zone_type, self._DEFAULT_STYLE_CUM)
+        # Same draw as np.random.choice(styles, p=weights), without per-call validation
+        idx = int(cum.searchsorted(np.random.random(), side='right'))
+        return styles[min(idx, len(styles) - 1)]
 
     def _determine_floors(self) -> int:
         """Determine number of floors"""
@@ -115,64 +234,14 @@ class DetailedBuilding:
 
     def _determine_base_color(self) -> Tuple[float, float, float, float]:
         """Determine base color with realistic materials"""
-        if self.style == BuildingStyle.MODERN_GLASS:
-            # Glass buildings - blue/green tinted glass
-            colors = [
-                (0.45, 0.55, 0.65, 1.0),  # Blue glass
-                (0.50, 0.60, 0.70, 1.0),  # Light blue glass
-                (0.48, 0.58, 0.55, 1.0),  # Green-tinted glass
-            ]
-        elif self.style == BuildingStyle.MODERN_CONCRETE:
-            # Modern concrete - light grays and whites
-            colors = [
-                (0.88, 0.88, 0.92, 1.0),  # White concrete
-                (0.75, 0.75, 0.80, 1.0),  # Light gray concrete
-                (0.82, 0.85, 0.88, 1.0),  # Off-white
-            ]
-        elif self.style == BuildingStyle.CLASSIC_BRICK:
-            # Brick buildings - warm reds and oranges
-            colors = [
-                (0.65, 0.42, 0.35, 1.0),  # Red brick
-                (0.70, 0.50, 0.38, 1.0),  # Orange brick
-                (0.58, 0.38, 0.30, 1.0),  # Dark brick
-            ]
-        elif self.style == BuildingStyle.INDUSTRIAL_WAREHOUSE:
-            # Industrial - dark concrete and metal
-            colors = [
-                (0.45, 0.47, 0.50, 1.0),  # Industrial gray
-                (0.50, 0.52, 0.55, 1.0),  # Light industrial
-                (0.40, 0.42, 0.45, 1.0),  # Dark industrial
-            ]
-        elif self.style == BuildingStyle.LUXURY_RESIDENTIAL:
-            # Upscale residences - creams and beiges
-            colors = [
-                (0.92, 0.88, 0.80, 1.0),  # Cream
-                (0.88, 0.82, 0.72, 1.0),  # Beige
-                (0.95, 0.92, 0.88, 1.0),  # Ivory
-            ]
-        elif self.style == BuildingStyle.OFFICE_TOWER:
-            # Office towers - steel and glass
-            colors = [
-                (0.52, 0.58, 0.68, 1.0),  # Steel blue
-                (0.48, 0.52, 0.60, 1.0),  # Dark steel
-                (0.55, 0.60, 0.70, 1.0),  # Light steel
-            ]
-        elif self.style == BuildingStyle.ART_DECO:
-            # Art Deco - elegant tones
-            colors = [
-                (0.85, 0.80, 0.70, 1.0),  # Limestone
-                (0.75, 0.72, 0.65, 1.0),  # Sandstone
-                (0.70, 0.65, 0.58, 1.0),  # Tan stone
-            ]
-        else:
-            colors = [(0.70, 0.70, 0.75, 1.0)]
-
+        colors = self._BASE_COLORS.get(self.style, self._DEFAULT_BASE_COLORS)
         return colors[np.random.randint(0, len(colors))]
 
     def _determine_accent_color(self) -> Tuple[float, float, float, float]:
         """Determine accent color for trim"""
         # Accent color contrasts with base
-        base_bright = sum(self.base_color[:3]) / 3
+        r, g, b, _ = self.base_color
+        base_bright = (r + g + b) * (1.0 / 3.0)
         if base_bright > 0.65:
             # Dark accents for light buildings
             return (0.15, 0.15, 0.18, 1.0)
@@ -208,13 +277,27 @@ class DetailedBuilding:
         else:
             return False
 
-    def create_3d_model(self, parent_node: NodePath, position: Tuple[float, float, float]) -> NodePath:
-        """Create extremely detailed 3D building"""
-        height = self.floors * self.floor_height
+    def create_3d_model(self, parent_node: NodePath, position: Tuple[float, float, float],
+                        lod: int = 0) -> NodePath:
+        """
+        Create extremely detailed 3D building.
+
+        Args:
+            parent_node: Node to attach the building to
+            position: World position (x, y, z)
+            lod: Detail level (0 = full, 1 = no balconies/fire escape/wall details,
+                 2+ = shell only with a window-pattern texture instead of window geometry)
+        """
+        height = self.floors * self.FLOOR_HEIGHT
 
         building_node = parent_node.attachNewNode(f"detailed_building_{self.seed}")
         building_node.setPos(*position)
 
+        if lod >= 2:
+            # Distant building: textured shell only
+            self._create_main_structure(building_node, height, self._get_facade_texture())
+            return building_node
+
         # 1. Main structure
         self._create_main_structure(building_node, height)
 
@@ -222,7 +305,7 @@ class DetailedBuilding:
         self._create_detailed_windows(building_node, height)
 
         # 3. Balconies (if applicable)
-        if self.has_balconies:
+        if self.has_balconies and lod == 0:
             self._create_balconies(building_node, height)
 
         # 4. Building trim and molding
@@ -232,7 +315,7 @@ class DetailedBuilding:
         self._create_ground_floor_details(building_node)
 
         # 6. Fire escape (if applicable)
-        if self.has_fire_escape:
+        if self.has_fire_escape and lod == 0:
             self._create_fire_escape(building_node, height)
 
         # 7. Rooftop structures
@@ -242,16 +325,25 @@ class DetailedBuilding:
         self._create_entrance_canopy(building_node)
 
         # 9. Building details (AC units on walls, etc.)
-        self._create_wall_details(building_node, height)
+        if lod == 0:
+            self._create_wall_details(building_node, height)
 
         return building_node
 
-    def _create_main_structure(self, parent: NodePath, height: float):
-        """Create main building structure"""
+    def _create_main_structure(self, parent: NodePath, height: float, facade_texture: Texture = None):
+        """Create main building structure, optionally textured with a window pattern"""
         card_maker = CardMaker("building_main")
 
-        # Apply weathering to base color
-        weathered_color = self._apply_weathering(self.base_color)
+        if facade_texture is None:
+            # Apply weathering to base color
+            weathered_color = self._apply_weathering(self.base_color)
+        else:
+            # Texture already carries the base color; only darken for weathering
+            weathered_color = self._apply_weathering((1.0, 1.0, 1.0, 1.0))
+        bays_w = max(2, int(self.width / 3.5))
+        bays_d = max(2, int(self.depth / 3.5))
+
+        faces = []
 
         # Front face
         card_maker.setFrame(-self.width/2, self.width/2, 0, height)
@@ -259,6 +351,7 @@ class DetailedBuilding:
         front.setY(-self.depth/2)
         front.setColor(weathered_color)
         front.setTag("building_face", "front")
+        faces.append((front, bays_w))
 
         # Back face
         back = parent.attachNewNode(card_maker.generate())
@@ -266,6 +359,7 @@ class DetailedBuilding:
         back.setH(180)
         back.setColor(weathered_color)
         back.setTag("building_face", "back")
+        faces.append((back, bays_w))
 
         # Left face
         card_maker.setFrame(-self.depth/2, self.depth/2, 0, height)
@@ -274,6 +368,7 @@ class DetailedBuilding:
         left.setH(90)
         left.setColor(weathered_color)
         left.setTag("building_face", "left")
+        faces.append((left, bays_d))
 
         # Right face
         right = parent.attachNewNode(card_maker.generate())
@@ -281,10 +376,37 @@ class DetailedBuilding:
         right.setH(-90)
         right.setColor(weathered_color)
         right.setTag("building_face", "right")
+        faces.append((right, bays_d))
+
+        if facade_texture is not None:
+            # One texture tile per window bay and floor
+            for face, bays in faces:
+                face.setTexture(facade_texture)
+                face.setTexScale(TextureStage.getDefault(), bays, self.floors)
 
         # Roof
         self._create_detailed_roof(parent, height)
 
+    def _get_facade_texture(self) -> Texture:
+        """Get (or build once per color combination) the window-pattern facade texture"""
+        key = (self.base_color, self.window_color)
+        texture = self._FACADE_TEXTURES.get(key)
+        if texture is None:
+            # Single window bay: wall border around a centered pane
+            image = PNMImage(8, 8, 3)
+            image.fill(*self.base_color[:3])
+            wr, wg, wb, _ = self.window_color
+            for px in range(2, 6):
+                for py in range(2, 6):
+                    image.setXel(px, py, wr, wg, wb)
+
+            texture = Texture("facade")
+            texture.load(image)
+            texture.setWrapU(SamplerState.WMRepeat)
+            texture.setWrapV(SamplerState.WMRepeat)
+            self._FACADE_TEXTURES[key] = texture
+        return texture
+
     def _create_detailed_roof(self, parent: NodePath, height: float):
         """Create detailed roof with proper geometry"""
         card_maker = CardMaker("roof")
@@ -357,7 +479,7 @@ class DetailedBuilding:
         windows_per_floor_d = max(2, int(self.depth / 3.5))
 
         for floor in range(1, self.floors):
-            floor_z = floor * self.floor_height + self.floor_height * 0.4
+            floor_z = floor * self.FLOOR_HEIGHT + self.FLOOR_HEIGHT * 0.4
 
             # Front and back windows
             for i in range(windows_per_floor_w):
@@ -385,6 +507,8 @@ class DetailedBuilding:
                                    size: float, frame_width: float, sill_depth: float, heading: float):
         """Create detailed window with frame and sill"""
         card_maker = CardMaker("window")
+        # Frames sit just in front of the glass on the outward side
+        y_off = y - 0.01 if heading == 0 else y + 0.01
 
         # Window glass
         card_maker.setFrame(-size/2, size/2, -size/2, size/2)
@@ -400,7 +524,7 @@ class DetailedBuilding:
         # Top frame
         card_maker.setFrame(-size/2 - frame_width, size/2 + frame_width, size/2, size/2 + frame_width)
         top_frame = parent.attachNewNode(card_maker.generate())
-        top_frame.setPos(x, y - 0.01 if heading == 0 else y + 0.01, z)
+        top_frame.setPos(x, y_off, z)
         top_frame.setH(heading)
         top_frame.setColor(frame_color)
 
@@ -408,37 +532,41 @@ class DetailedBuilding:
         card_maker.setFrame(-size/2 - frame_width, size/2 + frame_width,
                            -size/2 - sill_depth, -size/2)
         sill = parent.attachNewNode(card_maker.generate())
-        sill.setPos(x, y - 0.01 if heading == 0 else y + 0.01, z)
+        sill.setPos(x, y_off, z)
         sill.setH(heading)
         sill.setColor(frame_color)
 
         # Left frame
         card_maker.setFrame(-size/2 - frame_width, -size/2, -size/2, size/2)
         left_frame = parent.attachNewNode(card_maker.generate())
-        left_frame.setPos(x, y - 0.01 if heading == 0 else y + 0.01, z)
+        left_frame.setPos(x, y_off, z)
         left_frame.setH(heading)
         left_frame.setColor(frame_color)
 
         # Right frame
         card_maker.setFrame(size/2, size/2 + frame_width, -size/2, size/2)
         right_frame = parent.attachNewNode(card_maker.generate())
-        right_frame.setPos(x, y - 0.01 if heading == 0 else y + 0.01, z)
+        right_frame.setPos(x, y_off, z)
         right_frame.setH(heading)
         right_frame.setColor(frame_color)
 
     def _create_balconies(self, parent: NodePath, height: float):
         """Create balconies with railings"""
         balcony_depth = 1.5
-        balcony_width = min(self.width * 0.4, 6.0)
+        balcony_width = self.width * 0.4
+        if balcony_width > 6.0:
+            balcony_width = 6.0
         balcony_height = 0.15
         railing_height = 1.0
 
         # Balconies on alternating floors
         for floor in range(2, self.floors, 2):
-            floor_z = floor * self.floor_height
+            floor_z = floor * self.FLOOR_HEIGHT
 
             # Front balconies (3-4 per floor)
-            num_balconies = min(4, int(self.width / 8))
+            num_balconies = int(self.width / 8)
+            if num_balconies > 4:
+                num_balconies = 4
             for i in range(num_balconies):
                 x_offset = -self.width/2 + (i + 0.5) * (self.width / num_balconies)
                 self._create_single_balcony(parent, x_offset, -self.depth/2, floor_z,
@@ -491,7 +619,7 @@ class DetailedBuilding:
             for floor in range(0, self.floors, 5):
                 if floor == 0:
                     continue
-                floor_z = floor * self.floor_height
+                floor_z = floor * self.FLOOR_HEIGHT
                 self._create_horizontal_trim(parent, floor_z, trim_height, trim_depth)
 
     def _create_horizontal_trim(self, parent: NodePath, z: float, trim_height: float, depth: float):
@@ -528,7 +656,9 @@ class DetailedBuilding:
         if self.zone_type == ZoneType.COMMERCIAL or self.style == BuildingStyle.MIXED_USE:
             # Storefront windows (larger than regular windows)
             storefront_height = 2.5
-            storefront_width = min(self.width * 0.8, 12.0)
+            storefront_width = self.width * 0.8
+            if storefront_width > 12.0:
+                storefront_width = 12.0
 
             card_maker = CardMaker("storefront")
             card_maker.setFrame(-storefront_width/2, storefront_width/2, 0.5, storefront_height)
@@ -552,7 +682,7 @@ class DetailedBuilding:
 
         # Vertical ladder/stairs
         for floor in range(1, self.floors - 1):
-            floor_z = floor * self.floor_height
+            floor_z = floor * self.FLOOR_HEIGHT
 
             # Platform
             card_maker = CardMaker("fire_escape_platform")
@@ -596,41 +726,15 @@ class DetailedBuilding:
 
     def _create_ac_unit(self, parent: NodePath, x: float, y: float, z: float, size: float):
         """Create air conditioning unit"""
-        card_maker = CardMaker("ac_unit")
         ac_color = (0.60, 0.62, 0.65, 1.0)  # Metal gray
         ac_height = size * 0.6
 
-        # AC box
-        # Front
-        card_maker.setFrame(-size/2, size/2, 0, ac_height)
-        front = parent.attachNewNode(card_maker.generate())
-        front.setPos(x, y - size/2, z)
-        front.setColor(ac_color)
-
-        # Back
-        back = parent.attachNewNode(card_maker.generate())
-        back.setPos(x, y + size/2, z)
-        back.setH(180)
-        back.setColor(ac_color)
-
-        # Sides
-        card_maker.setFrame(-size/2, size/2, 0, ac_height)
-        left = parent.attachNewNode(card_maker.generate())
-        left.setPos(x - size/2, y, z)
-        left.setH(90)
-        left.setColor(ac_color)
-
-        right = parent.attachNewNode(card_maker.generate())
-        right.setPos(x + size/2, y, z)
-        right.setH(-90)
-        right.setColor(ac_color)
-
-        # Top
-        card_maker.setFrame(-size/2, size/2, -size/2, size/2)
-        top = parent.attachNewNode(card_maker.generate())
-        top.setPos(x, y, z + ac_height)
-        top.setP(-90)
-        top.setColor(ac_color)
+        # AC box (shared unit cuboid, open at the bottom)
+        ac = parent.attachNewNode("ac_unit")
+        _UNIT_BOX.instanceTo(ac)
+        ac.setPos(x, y, z)
+        ac.setScale(size, size, ac_height)
+        ac.setColor(ac_color)
 
     def _create_water_tower(self, parent: NodePath, x: float, y: float, z: float):
         """Create water tower"""
@@ -638,27 +742,16 @@ class DetailedBuilding:
         tower_height = 4.0
         support_height = 3.0
 
-        # Cylindrical tank (represented as octagon)
-        card_maker = CardMaker("water_tower")
+        # Cylindrical tank (shared unit octagon)
         tower_color = (0.35, 0.30, 0.28, 1.0)  # Dark rusty metal
-
-        sides = 8
-        for i in range(sides):
-            angle1 = (i / sides) * 360
-            angle2 = ((i + 1) / sides) * 360
-
-            x1 = tower_radius * np.cos(np.radians(angle1))
-            y1 = tower_radius * np.sin(np.radians(angle1))
-            x2 = tower_radius * np.cos(np.radians(angle2))
-            y2 = tower_radius * np.sin(np.radians(angle2))
-
-            card_maker.setFrame(0, np.sqrt((x2-x1)**2 + (y2-y1)**2), 0, tower_height)
-            side = parent.attachNewNode(card_maker.generate())
-            side.setPos(x + x1, y + y1, z + support_height)
-            side.setH(angle1)
-            side.setColor(tower_color)
+        tank = parent.attachNewNode("water_tower")
+        _UNIT_TANK.instanceTo(tank)
+        tank.setPos(x, y, z + support_height)
+        tank.setScale(tower_radius, tower_radius, tower_height)
+        tank.setColor(tower_color)
 
         # Support legs
+        card_maker = CardMaker("water_tower_leg")
         leg_color = (0.25, 0.20, 0.18, 1.0)
         for i in range(4):
             angle = i * 90
@@ -693,7 +786,9 @@ class DetailedBuilding:
 
     def _create_entrance_canopy(self, parent: NodePath):
         """Create entrance canopy/awning"""
-        canopy_width = min(self.width * 0.5, 8.0)
+        canopy_width = self.width * 0.5
+        if canopy_width > 8.0:
+            canopy_width = 8.0
         canopy_depth = 2.5
         canopy_height = 0.2
 
@@ -724,7 +819,7 @@ class DetailedBuilding:
         num_units = np.random.randint(2, 5)
         for i in range(num_units):
             floor = np.random.randint(1, self.floors - 1)
-            floor_z = floor * self.floor_height + 1.5
+            floor_z = floor * self.FLOOR_HEIGHT + 1.5
             x_offset = np.random.uniform(-self.width/3, self.width/3)
 
             # Small wall AC unit
@@ -749,18 +844,9 @@ class DetailedBuilding:
             base_r, base_g, base_b, _ = self.base_color
             return (base_r * 0.6, base_g * 0.6, base_b * 0.6, 1.0)
 
-    def get_specs(self) -> Dict:
+    def get_specs(self) -> BuildingSpecs:
         """Get building specifications"""
-        return {
-            'style': self.style.name,
-            'floors': self.floors,
-            'height': self.floors * self.floor_height,
-            'width': self.width,
-            'depth': self.depth,
-            'has_balconies': self.has_balconies,
-            'has_fire_escape': self.has_fire_escape,
-            'weathering': self.weathering
-        }
+        return self._specs
 
 
 if __name__ == "__main__":
@@ -773,12 +859,12 @@ if __name__ == "__main__":
         specs = building.get_specs()
 
         print(f"\n{zone.name} Building:")
-        print(f"  Style: {specs['style']}")
-        print(f"  Floors: {specs['floors']}")
-        print(f"  Dimensions: {specs['width']:.1f}m x {specs['depth']:.1f}m x {specs['height']:.1f}m")
-        print(f"  Balconies: {specs['has_balconies']}")
-        print(f"  Fire Escape: {specs['has_fire_escape']}")
-        print(f"  Weathering: {specs['weathering']:.2f}")
+        print(f"  Style: {specs.style}")
+        print(f"  Floors: {specs.floors}")
+        print(f"  Dimensions: {specs.width:.1f}m x {specs.depth:.1f}m x {specs.height:.1f}m")
+        print(f"  Balconies: {specs.has_balconies}")
+        print(f"  Fire Escape: {specs.has_fire_escape}")
+        print(f"  Weathering: {specs.weathering:.2f}")
 
     print("\n" + "=" * 60)
     print("Extremely detailed buildings with realistic architecture!")
@@ -6,10 +6,24 @@ Copyright 2025 Intellegix
 Licensed under the Apache License, Version 2.0
 """
 from panda3d.core import *
+import functools
 import numpy as np
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, NamedTuple
 from enum import Enum
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback when Numba is missing: run the kernel as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 class CharacterType(Enum):
     """Character categories"""
@@ -28,6 +42,291 @@ class Gender(Enum):
     FEMALE = 1
 
 
+class CharacterSpecs(NamedTuple):
+    """Character specifications"""
+    type: str
+    gender: str
+    height: float
+    has_bag: bool
+    has_hat: bool
+    has_glasses: bool
+
+
+# Type-specific clothing palettes
+_BUSINESS_SHIRT_COLORS = (
+    (0.88, 0.88, 0.92, 1.0),   # White
+    (0.75, 0.82, 0.92, 1.0),   # Light blue
+    (0.82, 0.78, 0.85, 1.0),   # Light purple
+)
+_WORKER_SHIRT_COLORS = (
+    (0.95, 0.55, 0.12, 1.0),   # Orange
+    (0.95, 0.88, 0.18, 1.0),   # Yellow
+    (0.25, 0.45, 0.65, 1.0),   # Blue
+)
+_JOGGER_SHIRT_COLORS = (
+    (0.85, 0.15, 0.15, 1.0),   # Red
+    (0.15, 0.75, 0.25, 1.0),   # Green
+    (0.15, 0.35, 0.85, 1.0),   # Blue
+    (0.85, 0.45, 0.15, 1.0),   # Orange
+)
+_BUSINESS_PANTS_COLORS = (
+    (0.12, 0.12, 0.15, 1.0),   # Black
+    (0.25, 0.28, 0.35, 1.0),   # Charcoal
+    (0.20, 0.25, 0.42, 1.0),   # Navy
+)
+_JOGGER_PANTS_COLORS = (
+    (0.15, 0.15, 0.18, 1.0),   # Black athletic
+)
+_HARD_HAT_COLOR = (0.95, 0.75, 0.15, 1.0)  # Yellow
+
+# Fixed accessory colors baked into the template meshes
+_SHOE_COLOR = (0.12, 0.12, 0.15, 1.0)           # Black shoes
+_BRIEFCASE_COLOR = (0.15, 0.12, 0.10, 1.0)      # Dark brown
+_BACKPACK_COLOR = (0.25, 0.35, 0.65, 1.0)       # Blue
+_SHOULDER_BAG_COLOR = (0.55, 0.45, 0.35, 1.0)   # Brown
+_GLASSES_COLOR = (0.15, 0.15, 0.15, 1.0)        # Black frames
+_REGULAR_HAT_COLORS = (
+    (0.12, 0.12, 0.15, 1.0),   # Black
+    (0.25, 0.35, 0.55, 1.0),   # Blue
+    (0.55, 0.45, 0.35, 1.0),   # Brown
+)
+
+# Trait tables shared by the per-character and batch paths
+_CHAR_TYPES = np.array(list(CharacterType), dtype=object)
+_GENDERS = np.array(list(Gender), dtype=object)
+_CT_BUSINESS_PERSON = CharacterType.BUSINESS_PERSON.value
+_CT_STUDENT = CharacterType.STUDENT.value
+_CT_WORKER = CharacterType.WORKER.value
+_TYPE_WEIGHTS = np.array([0.25, 0.30, 0.15, 0.10, 0.10, 0.05, 0.05])  # By CharacterType.value
+_TYPE_HEIGHT_RANGES = {
+    CharacterType.ELDERLY: (1.55, 1.72),
+    CharacterType.STUDENT: (1.60, 1.75),
+}
+_GENDER_HEIGHT_RANGES = {
+    Gender.MALE: (1.68, 1.85),
+    Gender.FEMALE: (1.58, 1.72),
+}
+_TYPE_SHIRT_COLORS = {
+    CharacterType.BUSINESS_PERSON: _BUSINESS_SHIRT_COLORS,
+    CharacterType.WORKER: _WORKER_SHIRT_COLORS,
+    CharacterType.JOGGER: _JOGGER_SHIRT_COLORS,
+}
+_TYPE_PANTS_COLORS = {
+    CharacterType.BUSINESS_PERSON: _BUSINESS_PANTS_COLORS,
+    CharacterType.JOGGER: _JOGGER_PANTS_COLORS,
+}
+_BAG_PROBABILITY = {
+    CharacterType.BUSINESS_PERSON: 0.7,
+    CharacterType.SHOPPER: 0.9,
+    CharacterType.STUDENT: 0.8,
+}
+_HAT_PROBABILITY = {
+    CharacterType.WORKER: 0.6,    # Hard hats
+    CharacterType.ELDERLY: 0.4,
+}
+_DEFAULT_BAG_PROBABILITY = 0.3
+_DEFAULT_HAT_PROBABILITY = 0.2
+_GLASSES_PROBABILITY = 0.3
+
+
+def _to_rgba8(colors) -> np.ndarray:
+    """Quantize float RGBA colors in [0, 1] to packed uint8 RGBA"""
+    return np.round(np.asarray(colors, dtype=np.float32) * 255.0).astype(np.uint8)
+
+
+def _from_rgba8(color: np.ndarray) -> Tuple[float, float, float, float]:
+    """Expand one uint8 RGBA color back to a float tuple for geometry writes"""
+    return tuple((color * (1.0 / 255.0)).tolist())
+
+
+# Array forms of the type tables for batch_create()
+_REGULAR_HAT_ARR = np.array(_REGULAR_HAT_COLORS, dtype=np.float32)
+_REGULAR_HAT_ARR.setflags(write=False)
+_REGULAR_HAT_U8 = _to_rgba8(_REGULAR_HAT_ARR)
+_HARD_HAT_U8 = _to_rgba8(_HARD_HAT_COLOR)
+_BAG_PROB_ARR = np.array([_BAG_PROBABILITY.get(t, _DEFAULT_BAG_PROBABILITY) for t in CharacterType])
+_HAT_PROB_ARR = np.array([_HAT_PROBABILITY.get(t, _DEFAULT_HAT_PROBABILITY) for t in CharacterType])
+
+
+def _palette_table(type_palettes: Dict, default: Tuple) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack per-type palettes into a (num_types, max_palette, 4) float32 table.
+
+    Rows are padded by repeating the palette; the second array holds each
+    type's real palette length, so table[t, rng.integers(0, lengths[t])]
+    draws a color for type t without building a list.
+    """
+    palettes = [type_palettes.get(t, default) for t in CharacterType]
+    width = max(len(palette) for palette in palettes)
+    table = np.array([[palette[i % len(palette)] for i in range(width)] for palette in palettes],
+                     dtype=np.float32)
+    lengths = np.array([len(palette) for palette in palettes])
+    table.setflags(write=False)
+    lengths.setflags(write=False)
+    return table, lengths
+
+
+# Standard human proportions as fractions of total height
+_PROPORTION_NAMES = (
+    'head_height', 'neck_height', 'torso_height', 'leg_length',
+    'shoulder_width', 'waist_width', 'upper_arm_length', 'forearm_length',
+    'upper_leg_length', 'lower_leg_length',
+)
+_PROPORTION_RATIOS = np.array([0.13, 0.05, 0.32, 0.50,
+                               0.25, 0.18, 0.18, 0.16,
+                               0.52 * 0.50, 0.48 * 0.50], dtype=np.float32)
+
+# Walk-cycle sine lookup: index with int(walk_cycle * _SIN_LUT_SIZE) & _SIN_LUT_MASK
+_SIN_LUT_SIZE = 1024
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, _SIN_LUT_SIZE, endpoint=False)).astype(np.float32)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _advance_walk_kernel(walk_cycles, progress, walk_bins, swing):
+    """
+    Advance walk cycles in place and fill per-character walk bins and swing sines.
+
+    The swing is read from _SIN_LUT; leg swing is swing * 15 and arm swing is
+    -swing * 25 degrees, the right limbs mirroring the left.
+    """
+    for i in prange(walk_cycles.shape[0]):
+        walk = (walk_cycles[i] + progress[i]) % 1.0
+        walk_cycles[i] = walk
+        walk_bins[i] = int(walk * _WALK_BINS) % _WALK_BINS
+        swing[i] = _SIN_LUT[int(walk * _SIN_LUT_SIZE) & _SIN_LUT_MASK]
+
+
+def update_walk_cycles(walk_cycles: np.ndarray, progress: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Advance a crowd's (N,) walk cycles in one kernel pass.
+
+    Returns the new walk cycles (wrapped to [0, 1)) and their swing sine, so
+    leg swing is sine * 15 and arm swing is -sine * 25 degrees.
+    """
+    walk_cycles = np.array(walk_cycles, dtype=np.float64).ravel()
+    n = len(walk_cycles)
+    progress = np.ascontiguousarray(np.broadcast_to(progress, (n,)), dtype=np.float64)
+    swing = np.empty(n, dtype=np.float32)
+    _advance_walk_kernel(walk_cycles, progress, np.empty(n, dtype=np.int32), swing)
+    return walk_cycles, swing
+
+
+def _transform(pos: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+               h: float = 0.0, p: float = 0.0) -> np.ndarray:
+    """4x4 matrix equivalent to a NodePath with setPos(pos), setH(h), setP(p)"""
+    hr = np.radians(h)
+    pr = np.radians(p)
+    ch, sh = np.cos(hr), np.sin(hr)
+    cp, sp = np.cos(pr), np.sin(pr)
+    mat = np.identity(4)
+    # Panda3D applies pitch first, then heading
+    mat[:3, :3] = np.array([[ch, -sh, 0.0], [sh, ch, 0.0], [0.0, 0.0, 1.0]]) @ \
+        np.array([[1.0, 0.0, 0.0], [0.0, cp, -sp], [0.0, sp, cp]])
+    mat[:3, 3] = pos
+    return mat
+
+
+class _CharacterMesh:
+    """
+    Accumulates CardMaker-style cards into one vertex table.
+
+    Cards are grouped by color slot: a slot name (e.g. 'shirt_color') leaves the
+    vertices white so the color can be applied per instance as a geom state,
+    while an RGBA tuple is baked into the vertex colors.
+    """
+
+    def __init__(self):
+        self.vdata = GeomVertexData("character", GeomVertexFormat.getV3c4(), Geom.UHStatic)
+        self.vertex = GeomVertexWriter(self.vdata, "vertex")
+        self.color = GeomVertexWriter(self.vdata, "color")
+        self.triangles: Dict[str, GeomTriangles] = {}
+        self.num_vertices = 0
+
+    def add_card(self, left: float, right: float, bottom: float, top: float, mat: np.ndarray, color):
+        """Add a card spanning (left, right, bottom, top) in its local XZ plane, facing -Y"""
+        if isinstance(color, str):
+            slot, rgba = color, (1.0, 1.0, 1.0, 1.0)
+        else:
+            slot, rgba = None, color
+
+        corners = np.array([[left, 0.0, bottom, 1.0],
+                            [right, 0.0, bottom, 1.0],
+                            [right, 0.0, top, 1.0],
+                            [left, 0.0, top, 1.0]]) @ mat.T
+        for x, y, z, _ in corners:
+            self.vertex.addData3(x, y, z)
+            self.color.addData4(*rgba)
+
+        triangles = self.triangles.get(slot)
+        if triangles is None:
+            triangles = self.triangles[slot] = GeomTriangles(Geom.UHStatic)
+        row = self.num_vertices
+        triangles.addVertices(row, row + 1, row + 2)
+        triangles.addVertices(row, row + 2, row + 3)
+        self.num_vertices += 4
+
+    def finish(self) -> Tuple[GeomNode, Tuple]:
+        """Wrap the cards in a GeomNode with one Geom per slot; returns (node, slot per geom)"""
+        geom_node = GeomNode("character")
+        for triangles in self.triangles.values():
+            geom = Geom(self.vdata)
+            geom.addPrimitive(triangles)
+            geom_node.addGeom(geom)
+        return geom_node, tuple(self.triangles)
+
+
+@functools.lru_cache(maxsize=None)
+def _color_state(color: Tuple[float, float, float, float]) -> RenderState:
+    """Shared flat-color RenderState for a slot color"""
+    return RenderState.make(ColorAttrib.makeFlat(LColor(*color)))
+
+
+# Template quantization: characters sharing a bin share one mesh
+_HEIGHT_BIN_RANGE = (1.55, 1.85)
+_HEIGHT_BINS = 8
+_WALK_BINS = 32
+
+
+def _make_impostor_card() -> NodePath:
+    """Unit billboard card (x in [-0.5, 0.5], z in [0, 1]) shared by every impostor"""
+    card_maker = CardMaker("impostor_card")
+    card_maker.setFrame(-0.5, 0.5, 0, 1)
+    return NodePath(card_maker.generate())
+
+
+_IMPOSTOR_CARD = _make_impostor_card()
+
+
+# Sized to the whole key space (type x height bin x walk bin x 3 accessory
+# flags): update_crowd walks every shape through all walk bins
+@functools.lru_cache(maxsize=_WALK_BINS * _HEIGHT_BINS * len(CharacterType) * 8)
+def _character_template(shape: Tuple) -> Tuple[NodePath, Tuple]:
+    """
+    Build (once per shape key) an immutable character mesh to clone.
+
+    The key comes from DetailedCharacter._template_key(). Returns the template
+    NodePath and the color slot of each of its Geoms.
+    """
+    type_value, height_bin, walk_bin, has_bag, has_hat, has_glasses = shape
+
+    low, high = _HEIGHT_BIN_RANGE
+    template = DetailedCharacter.__new__(DetailedCharacter)
+    template.character_type = CharacterType(type_value)
+    template._tv = type_value
+    template.height = low + (height_bin + 0.5) * (high - low) / _HEIGHT_BINS
+    template.has_bag = has_bag
+    template.has_hat = has_hat
+    template.has_glasses = has_glasses
+    template.walk_cycle = walk_bin / _WALK_BINS
+    template._calculate_proportions()
+
+    mesh = _CharacterMesh()
+    template._build_mesh(mesh)
+    geom_node, slots = mesh.finish()
+    return NodePath(geom_node), slots
+
+
 class DetailedCharacter:
     """
     Detailed pedestrian character with realistic proportions.
@@ -41,8 +340,17 @@ class DetailedCharacter:
     - Walking animation support
     """
 
+    __slots__ = ('seed', '_rng', 'character_type', '_tv', 'gender', 'height',
+                 'skin_tone', 'hair_color', 'shirt_color', 'pants_color',
+                 'has_bag', 'has_hat', 'has_glasses', 'hat_color', '_specs',
+                 'head_height', 'neck_height', 'torso_height', 'leg_length',
+                 'shoulder_width', 'waist_width', 'head_width',
+                 'upper_arm_length', 'forearm_length', 'arm_thickness',
+                 'upper_leg_length', 'lower_leg_length', 'leg_thickness',
+                 'walk_cycle')
+
     # Clothing colors
-    SHIRT_COLORS = [
+    SHIRT_COLORS = (
         (0.15, 0.25, 0.55, 1.0),   # Dark blue
         (0.85, 0.85, 0.90, 1.0),   # White
         (0.12, 0.12, 0.15, 1.0),   # Black
@@ -51,26 +359,26 @@ class DetailedCharacter:
         (0.65, 0.55, 0.45, 1.0),   # Tan
         (0.55, 0.55, 0.60, 1.0),   # Gray
         (0.75, 0.60, 0.40, 1.0),   # Brown
-    ]
+    )
 
-    PANTS_COLORS = [
+    PANTS_COLORS = (
         (0.20, 0.25, 0.45, 1.0),   # Navy blue
         (0.15, 0.15, 0.18, 1.0),   # Black
         (0.40, 0.45, 0.55, 1.0),   # Gray
         (0.30, 0.35, 0.55, 1.0),   # Blue jeans
         (0.55, 0.45, 0.35, 1.0),   # Khaki
-    ]
+    )
 
-    SKIN_TONES = [
+    SKIN_TONES = (
         (0.98, 0.85, 0.75, 1.0),   # Light
         (0.92, 0.75, 0.62, 1.0),   # Light-medium
         (0.85, 0.68, 0.52, 1.0),   # Medium
         (0.72, 0.55, 0.42, 1.0),   # Medium-dark
         (0.60, 0.45, 0.35, 1.0),   # Dark
         (0.45, 0.32, 0.25, 1.0),   # Deep
-    ]
+    )
 
-    HAIR_COLORS = [
+    HAIR_COLORS = (
         (0.12, 0.10, 0.08, 1.0),   # Black
         (0.35, 0.25, 0.18, 1.0),   # Dark brown
         (0.55, 0.42, 0.28, 1.0),   # Brown
@@ -78,15 +386,29 @@ class DetailedCharacter:
         (0.85, 0.72, 0.45, 1.0),   # Blonde
         (0.65, 0.38, 0.28, 1.0),   # Auburn
         (0.60, 0.60, 0.62, 1.0),   # Gray
-    ]
+    )
+
+    # Beyond this camera distance characters are drawn as a single billboard
+    IMPOSTOR_DISTANCE = 30.0
+    _IMPOSTOR_TEXTURES: Dict[Tuple, Texture] = {}
+
+    # Array forms of the shared palettes for batch_create()
+    _SHIRT_TABLE, _SHIRT_LEN = _palette_table(_TYPE_SHIRT_COLORS, SHIRT_COLORS)
+    _PANTS_TABLE, _PANTS_LEN = _palette_table(_TYPE_PANTS_COLORS, PANTS_COLORS)
+    # uint8 RGBA forms used for the batch_create() color columns
+    _SHIRT_TABLE_U8 = _to_rgba8(_SHIRT_TABLE)
+    _PANTS_TABLE_U8 = _to_rgba8(_PANTS_TABLE)
+    _SKIN_TONES_U8 = _to_rgba8(SKIN_TONES)
+    _HAIR_COLORS_U8 = _to_rgba8(HAIR_COLORS)
 
     def __init__(self, character_type: CharacterType = None, seed: int = None):
         """Initialize detailed character"""
         self.seed = seed or np.random.randint(0, 1000000)
-        np.random.seed(self.seed)
+        self._rng = np.random.default_rng(self.seed)
 
         # Character attributes
         self.character_type = character_type or self._random_type()
+        self._tv = int(self.character_type.value)
         self.gender = self._random_gender()
 
         # Physical attributes
@@ -99,7 +421,9 @@ class DetailedCharacter:
         # Accessories
         self.has_bag = self._should_have_bag()
         self.has_hat = self._should_have_hat()
-        self.has_glasses = np.random.random() > 0.7
+        self.has_glasses = self._rng.random() < _GLASSES_PROBABILITY
+        self.hat_color = self._determine_hat_color() if self.has_hat else None
+        self._specs = self._make_specs()
 
         # Body proportions (based on height)
         self._calculate_proportions()
@@ -109,459 +433,470 @@ class DetailedCharacter:
 
     def _random_type(self) -> CharacterType:
         """Random character type"""
-        types = list(CharacterType)
-        weights = [0.25, 0.30, 0.15, 0.10, 0.10, 0.05, 0.05]
-        return np.random.choice(types, p=weights)
+        return self._rng.choice(_CHAR_TYPES, p=_TYPE_WEIGHTS)
 
     def _random_gender(self) -> Gender:
         """Random gender"""
-        return np.random.choice(list(Gender))
+        return self._rng.choice(_GENDERS)
 
     def _determine_height(self) -> float:
         """Determine character height"""
-        if self.character_type == CharacterType.ELDERLY:
-            return np.random.uniform(1.55, 1.72)
-        elif self.character_type == CharacterType.STUDENT:
-            return np.random.uniform(1.60, 1.75)
-        elif self.gender == Gender.FEMALE:
-            return np.random.uniform(1.58, 1.72)
-        else:  # Male
-            return np.random.uniform(1.68, 1.85)
+        low, high = _TYPE_HEIGHT_RANGES.get(self.character_type) or _GENDER_HEIGHT_RANGES[self.gender]
+        return self._rng.uniform(low, high)
 
     def _determine_shirt_color(self) -> Tuple[float, float, float, float]:
         """Determine shirt color based on character type"""
-        if self.character_type == CharacterType.BUSINESS_PERSON:
-            # Business clothes - whites, light blues
-            colors = [
-                (0.88, 0.88, 0.92, 1.0),   # White
-                (0.75, 0.82, 0.92, 1.0),   # Light blue
-                (0.82, 0.78, 0.85, 1.0),   # Light purple
-            ]
-            return self._random_choice(colors)
-        elif self.character_type == CharacterType.WORKER:
-            # Work clothes - oranges, yellows, hi-vis
-            colors = [
-                (0.95, 0.55, 0.12, 1.0),   # Orange
-                (0.95, 0.88, 0.18, 1.0),   # Yellow
-                (0.25, 0.45, 0.65, 1.0),   # Blue
-            ]
-            return self._random_choice(colors)
-        elif self.character_type == CharacterType.JOGGER:
-            # Athletic wear - bright colors
-            colors = [
-                (0.85, 0.15, 0.15, 1.0),   # Red
-                (0.15, 0.75, 0.25, 1.0),   # Green
-                (0.15, 0.35, 0.85, 1.0),   # Blue
-                (0.85, 0.45, 0.15, 1.0),   # Orange
-            ]
-            return self._random_choice(colors)
-        else:
-            return self._random_choice(self.SHIRT_COLORS)
+        idx = self._rng.integers(0, self._SHIRT_LEN[self._tv])
+        return tuple(self._SHIRT_TABLE[self._tv, idx].tolist())
 
     def _determine_pants_color(self) -> Tuple[float, float, float, float]:
         """Determine pants color"""
-        if self.character_type == CharacterType.BUSINESS_PERSON:
-            # Business pants - dark colors
-            colors = [
-                (0.12, 0.12, 0.15, 1.0),   # Black
-                (0.25, 0.28, 0.35, 1.0),   # Charcoal
-                (0.20, 0.25, 0.42, 1.0),   # Navy
-            ]
-            return self._random_choice(colors)
-        elif self.character_type == CharacterType.JOGGER:
-            # Athletic pants - dark or matching shirt
-            return (0.15, 0.15, 0.18, 1.0)  # Black athletic
-        else:
-            return self._random_choice(self.PANTS_COLORS)
+        idx = self._rng.integers(0, self._PANTS_LEN[self._tv])
+        return tuple(self._PANTS_TABLE[self._tv, idx].tolist())
 
     def _should_have_bag(self) -> bool:
         """Determine if character has bag"""
-        if self.character_type == CharacterType.BUSINESS_PERSON:
-            return np.random.random() > 0.3  # 70% have bags
-        elif self.character_type == CharacterType.SHOPPER:
-            return np.random.random() > 0.1  # 90% have bags
-        elif self.character_type == CharacterType.STUDENT:
-            return np.random.random() > 0.2  # 80% have bags
-        else:
-            return np.random.random() > 0.7  # 30% have bags
+        return self._rng.random() < _BAG_PROBABILITY.get(self.character_type, _DEFAULT_BAG_PROBABILITY)
 
     def _should_have_hat(self) -> bool:
         """Determine if character has hat"""
-        if self.character_type == CharacterType.WORKER:
-            return np.random.random() > 0.4  # 60% have hard hats
-        elif self.character_type == CharacterType.ELDERLY:
-            return np.random.random() > 0.6  # 40% have hats
-        else:
-            return np.random.random() > 0.8  # 20% have hats
+        return self._rng.random() < _HAT_PROBABILITY.get(self.character_type, _DEFAULT_HAT_PROBABILITY)
+
+    def _determine_hat_color(self) -> Tuple[float, float, float, float]:
+        """Determine hat color (hard hat for workers, regular cap otherwise)"""
+        if self._tv == _CT_WORKER:
+            return _HARD_HAT_COLOR
+        return tuple(_REGULAR_HAT_ARR[self._rng.integers(0, len(_REGULAR_HAT_ARR))].tolist())
 
     def _calculate_proportions(self):
         """Calculate body part proportions based on height"""
-        # Standard human proportions
-        self.head_height = self.height * 0.13
-        self.neck_height = self.height * 0.05
-        self.torso_height = self.height * 0.32
-        self.leg_length = self.height * 0.50
-
-        # Widths
-        self.shoulder_width = self.height * 0.25
-        self.waist_width = self.height * 0.18
-        self.head_width = self.head_height * 0.75
+        self._set_proportions((self.height * _PROPORTION_RATIOS).tolist())
 
-        # Arm proportions
-        self.upper_arm_length = self.height * 0.18
-        self.forearm_length = self.height * 0.16
-        self.arm_thickness = 0.08
+    def _set_proportions(self, lengths: List[float]):
+        """Assign one row of height-scaled lengths, ordered as _PROPORTION_NAMES"""
+        (self.head_height, self.neck_height, self.torso_height, self.leg_length,
+         self.shoulder_width, self.waist_width, self.upper_arm_length, self.forearm_length,
+         self.upper_leg_length, self.lower_leg_length) = lengths
 
-        # Leg proportions
-        self.upper_leg_length = self.leg_length * 0.52
-        self.lower_leg_length = self.leg_length * 0.48
+        self.head_width = self.head_height * 0.75
+        self.arm_thickness = 0.08
         self.leg_thickness = 0.12
 
     def _random_choice(self, choices: List) -> Tuple:
         """Random choice from list"""
-        return choices[np.random.randint(0, len(choices))]
+        return choices[self._rng.integers(0, len(choices))]
+
+    @classmethod
+    def batch_create(cls, n: int, seed: int = None) -> Dict[str, np.ndarray]:
+        """
+        Draw attributes for n characters at once in structure-of-arrays form.
+
+        Returns a dict of per-field NumPy arrays with one row per character.
+        Color columns are (n, 4) uint8 RGBA. Use from_batch() to materialize a
+        single character from a row.
+        """
+        rng = np.random.default_rng(seed)
+
+        types = rng.choice(len(_TYPE_WEIGHTS), size=n, p=_TYPE_WEIGHTS)
+        genders = rng.integers(0, len(Gender), n)
+
+        # Height ranges: per-gender defaults, overridden per type
+        low = np.empty(n)
+        high = np.empty(n)
+        for gender, (lo, hi) in _GENDER_HEIGHT_RANGES.items():
+            mask = genders == gender.value
+            low[mask] = lo
+            high[mask] = hi
+        for char_type, (lo, hi) in _TYPE_HEIGHT_RANGES.items():
+            mask = types == char_type.value
+            low[mask] = lo
+            high[mask] = hi
+        heights = rng.uniform(low, high)
+
+        skin_tones = cls._SKIN_TONES_U8[rng.integers(0, len(cls.SKIN_TONES), n)]
+        hair_colors = cls._HAIR_COLORS_U8[rng.integers(0, len(cls.HAIR_COLORS), n)]
+
+        shirt_colors = cls._SHIRT_TABLE_U8[types, rng.integers(0, cls._SHIRT_LEN[types])]
+        pants_colors = cls._PANTS_TABLE_U8[types, rng.integers(0, cls._PANTS_LEN[types])]
+
+        has_hat = rng.random(n) < _HAT_PROB_ARR[types]
+        hat_colors = _REGULAR_HAT_U8[rng.integers(0, len(_REGULAR_HAT_U8), n)]
+        hat_colors[types == _CT_WORKER] = _HARD_HAT_U8
+
+        # One outer product gives every body-part length for every character
+        proportions = heights[:, None] * _PROPORTION_RATIOS[None, :]
+
+        batch = {
+            'seed': rng.integers(0, 1000000, n),
+            'character_type': types,
+            'gender': genders,
+            'height': heights,
+            'skin_tone': skin_tones,
+            'hair_color': hair_colors,
+            'shirt_color': shirt_colors,
+            'pants_color': pants_colors,
+            'has_bag': rng.random(n) < _BAG_PROB_ARR[types],
+            'has_hat': has_hat,
+            'hat_color': hat_colors,
+            'has_glasses': rng.random(n) < _GLASSES_PROBABILITY,
+        }
+        for column, name in enumerate(_PROPORTION_NAMES):
+            batch[name] = proportions[:, column]
+        return batch
+
+    @classmethod
+    def from_batch(cls, batch: Dict[str, np.ndarray], i: int) -> 'DetailedCharacter':
+        """Create a character from row i of a batch_create() result"""
+        character = cls.__new__(cls)
+        character.seed = int(batch['seed'][i])
+        character._rng = np.random.default_rng(character.seed)
+        character._tv = int(batch['character_type'][i])
+        character.character_type = CharacterType(character._tv)
+        character.gender = Gender(int(batch['gender'][i]))
+        character.height = float(batch['height'][i])
+        character.skin_tone = _from_rgba8(batch['skin_tone'][i])
+        character.hair_color = _from_rgba8(batch['hair_color'][i])
+        character.shirt_color = _from_rgba8(batch['shirt_color'][i])
+        character.pants_color = _from_rgba8(batch['pants_color'][i])
+        character.has_bag = bool(batch['has_bag'][i])
+        character.has_hat = bool(batch['has_hat'][i])
+        character.has_glasses = bool(batch['has_glasses'][i])
+        character.hat_color = _from_rgba8(batch['hat_color'][i]) if character.has_hat else None
+        character._specs = character._make_specs()
+        character._set_proportions([float(batch[name][i]) for name in _PROPORTION_NAMES])
+        character.walk_cycle = 0.0
+        return character
+
+    @classmethod
+    def build_crowd(cls, parent_node: NodePath,
+                    placements: List[Tuple['DetailedCharacter', Tuple[float, float, float], float, float]],
+                    camera_pos: Tuple[float, float, float] = None) -> NodePath:
+        """
+        Build a static crowd and flatten it in one pass.
+
+        placements holds (character, position, heading, walk_progress) tuples.
+        Every character is built under a staging node which is flattened once,
+        so compatible Geoms merge across the whole crowd. The result cannot be
+        animated per character: keep the nearby characters that need update_crowd
+        as separate create_3d_model nodes and flatten only the rest.
+        """
+        staging = NodePath("crowd")
+        for character, position, heading, walk_progress in placements:
+            character.create_3d_model(staging, position, heading, walk_progress, camera_pos)
+
+        staging.clearModelNodes()
+        staging.flattenStrong()
+        staging.reparentTo(parent_node)
+        return staging
 
     def create_3d_model(self, parent_node: NodePath, position: Tuple[float, float, float],
-                       heading: float = 0, walk_progress: float = 0.0) -> NodePath:
-        """Create detailed 3D character"""
+                       heading: float = 0, walk_progress: float = 0.0,
+                       camera_pos: Tuple[float, float, float] = None) -> NodePath:
+        """
+        Create detailed 3D character.
+
+        The mesh is cloned from a shared template keyed by type, accessories,
+        height bin and walk-cycle phase; clothing, skin and hair colors are
+        applied to the clone as per-geom states. When camera_pos is given and
+        the character is beyond IMPOSTOR_DISTANCE, a textured billboard is
+        used instead.
+        """
         char_node = parent_node.attachNewNode(f"character_{self.character_type.name}_{self.seed}")
         char_node.setPos(*position)
         char_node.setH(heading)
 
         self.walk_cycle = walk_progress
+        if camera_pos is not None:
+            dx = position[0] - camera_pos[0]
+            dy = position[1] - camera_pos[1]
+            dz = position[2] - camera_pos[2]
+            if dx * dx + dy * dy + dz * dz > self.IMPOSTOR_DISTANCE * self.IMPOSTOR_DISTANCE:
+                self._attach_impostor(char_node)
+                return char_node
+
+        self._attach_model(char_node)
+        return char_node
 
+    def _attach_impostor(self, char_node: NodePath):
+        """Attach a camera-facing textured card sized to the character"""
+        impostor = char_node.attachNewNode("impostor")
+        impostor.setScale(self.shoulder_width + 2 * self.arm_thickness, 1, self.height)
+        impostor.setBillboardAxis()
+        impostor.setTexture(self._get_impostor_texture())
+        impostor.setTransparency(TransparencyAttrib.MBinary)
+        _IMPOSTOR_CARD.instanceTo(impostor)
+        char_node.setTag("impostor", "1")
+
+    def _get_impostor_texture(self) -> Texture:
+        """Get (or paint once per color combination) the front-view silhouette texture"""
+        key = (self.shirt_color, self.pants_color, self.skin_tone, self.hair_color, self.hat_color)
+        texture = self._IMPOSTOR_TEXTURES.get(key)
+        if texture is None:
+            # 8x16 silhouette; row 0 is the top of the head
+            image = PNMImage(8, 16, 4)
+            image.fill(0, 0, 0)
+            image.alphaFill(0)
+
+            def paint(color, columns, rows):
+                for px in columns:
+                    for py in rows:
+                        image.setXelA(px, py, *color)
+
+            paint(self.hat_color or self.hair_color, range(3, 5), range(0, 1))
+            paint(self.skin_tone, range(3, 5), range(1, 3))         # Face and neck
+            paint(self.shirt_color, range(1, 7), range(3, 8))       # Torso
+            paint(self.shirt_color, (0, 7), range(3, 7))            # Arms
+            paint(self.skin_tone, (0, 7), range(7, 8))              # Hands
+            paint(self.pants_color, (2, 3, 4, 5), range(8, 15))     # Legs
+            paint(_SHOE_COLOR, (2, 3, 4, 5), range(15, 16))
+
+            texture = Texture("impostor")
+            texture.load(image)
+            texture.setMagfilter(SamplerState.FTNearest)
+            self._IMPOSTOR_TEXTURES[key] = texture
+        return texture
+
+    def _attach_model(self, char_node: NodePath):
+        """Clone this character's shared template under char_node and apply its colors"""
+        template, slots = _character_template(self._template_key())
+
+        # copyTo shares the Geoms; only the per-geom color states differ
+        model = template.copyTo(char_node)
+        geom_node = model.node()
+        for i, slot in enumerate(slots):
+            if slot is not None:
+                geom_node.setGeomState(i, _color_state(getattr(self, slot)))
+
+    def _template_key(self) -> Tuple:
+        """Shape key identifying this character's shared template mesh"""
+        low, high = _HEIGHT_BIN_RANGE
+        height_bin = int((self.height - low) / (high - low) * _HEIGHT_BINS)
+        height_bin = 0 if height_bin < 0 else _HEIGHT_BINS - 1 if height_bin >= _HEIGHT_BINS else height_bin
+        walk_bin = int(self.walk_cycle * _WALK_BINS) % _WALK_BINS
+        return (self._tv, height_bin, walk_bin, self.has_bag, self.has_hat, self.has_glasses)
+
+    def _build_mesh(self, mesh: _CharacterMesh):
+        """Write all body parts and accessories into the mesh"""
         # Build character from bottom up
         # 1. Legs
-        self._create_legs(char_node)
+        self._create_legs(mesh)
 
         # 2. Torso
-        self._create_torso(char_node)
+        self._create_torso(mesh)
 
         # 3. Arms
-        self._create_arms(char_node)
+        self._create_arms(mesh)
 
         # 4. Head and neck
-        self._create_head(char_node)
+        self._create_head(mesh)
 
         # 5. Accessories
         if self.has_bag:
-            self._create_bag(char_node)
+            self._create_bag(mesh)
         if self.has_hat:
-            self._create_hat(char_node)
+            self._create_hat(mesh)
         if self.has_glasses:
-            self._create_glasses(char_node)
+            self._create_glasses(mesh)
 
-        return char_node
-
-    def _create_legs(self, parent: NodePath):
+    def _create_legs(self, mesh: _CharacterMesh):
         """Create legs with walking animation"""
-        card_maker = CardMaker("leg")
-
         # Walking animation - swing legs
-        left_swing = np.sin(self.walk_cycle * np.pi * 2) * 15  # degrees
+        left_swing = float(_SIN_LUT[int(self.walk_cycle * _SIN_LUT_SIZE) & _SIN_LUT_MASK]) * 15.0  # degrees
         right_swing = -left_swing
 
-        # Left leg
-        # Upper leg
-        card_maker.setFrame(-self.leg_thickness/2, self.leg_thickness/2,
-                           0, self.upper_leg_length)
-        left_upper = parent.attachNewNode(card_maker.generate())
-        left_upper.setPos(-self.waist_width/4, 0, 0)
-        left_upper.setP(left_swing)
-        left_upper.setColor(self.pants_color)
-
-        # Lower leg
-        card_maker.setFrame(-self.leg_thickness/2, self.leg_thickness/2,
-                           0, self.lower_leg_length)
-        left_lower = left_upper.attachNewNode(card_maker.generate())
-        left_lower.setZ(self.upper_leg_length)
-        left_lower.setP(-abs(left_swing) * 0.5)  # Knee bends
-        left_lower.setColor(self.pants_color)
-
-        # Foot
-        shoe_color = (0.12, 0.12, 0.15, 1.0)  # Black shoes
-        card_maker.setFrame(-self.leg_thickness/2, self.leg_thickness/2,
-                           0, 0.25)
-        left_foot = left_lower.attachNewNode(card_maker.generate())
-        left_foot.setZ(self.lower_leg_length)
-        left_foot.setP(-90)
-        left_foot.setColor(shoe_color)
-
-        # Right leg (mirror of left)
-        card_maker.setFrame(-self.leg_thickness/2, self.leg_thickness/2,
-                           0, self.upper_leg_length)
-        right_upper = parent.attachNewNode(card_maker.generate())
-        right_upper.setPos(self.waist_width/4, 0, 0)
-        right_upper.setP(right_swing)
-        right_upper.setColor(self.pants_color)
-
-        card_maker.setFrame(-self.leg_thickness/2, self.leg_thickness/2,
-                           0, self.lower_leg_length)
-        right_lower = right_upper.attachNewNode(card_maker.generate())
-        right_lower.setZ(self.upper_leg_length)
-        right_lower.setP(-abs(right_swing) * 0.5)
-        right_lower.setColor(self.pants_color)
-
-        card_maker.setFrame(-self.leg_thickness/2, self.leg_thickness/2,
-                           0, 0.25)
-        right_foot = right_lower.attachNewNode(card_maker.generate())
-        right_foot.setZ(self.lower_leg_length)
-        right_foot.setP(-90)
-        right_foot.setColor(shoe_color)
-
-    def _create_torso(self, parent: NodePath):
-        """Create torso"""
-        card_maker = CardMaker("torso")
-        torso_z = self.leg_length
+        half = self.leg_thickness / 2
 
-        # Main torso body
-        card_maker.setFrame(-self.shoulder_width/2, self.shoulder_width/2,
-                           0, self.torso_height)
+        # Right leg mirrors the left
+        for hip_x, swing in ((-self.waist_width/4, left_swing), (self.waist_width/4, right_swing)):
+            # Upper leg
+            upper = _transform((hip_x, 0, 0), p=swing)
+            mesh.add_card(-half, half, 0, self.upper_leg_length, upper, 'pants_color')
 
-        # Front
-        front = parent.attachNewNode(card_maker.generate())
-        front.setPos(0, -self.shoulder_width/4, torso_z)
-        front.setColor(self.shirt_color)
+            # Lower leg - knee bends
+            lower = upper @ _transform((0, 0, self.upper_leg_length), p=-abs(swing) * 0.5)
+            mesh.add_card(-half, half, 0, self.lower_leg_length, lower, 'pants_color')
 
-        # Back
-        back = parent.attachNewNode(card_maker.generate())
-        back.setPos(0, self.shoulder_width/4, torso_z)
-        back.setH(180)
-        back.setColor(self.shirt_color)
+            # Foot
+            foot = lower @ _transform((0, 0, self.lower_leg_length), p=-90)
+            mesh.add_card(-half, half, 0, 0.25, foot, _SHOE_COLOR)
 
-        # Sides
-        card_maker.setFrame(-self.shoulder_width/4, self.shoulder_width/4,
-                           0, self.torso_height)
+    def _create_torso(self, mesh: _CharacterMesh):
+        """Create torso"""
+        torso_z = self.leg_length
 
-        left = parent.attachNewNode(card_maker.generate())
-        left.setPos(-self.shoulder_width/2, 0, torso_z)
-        left.setH(90)
-        left.setColor(self.shirt_color)
+        # Main torso body - front and back
+        mesh.add_card(-self.shoulder_width/2, self.shoulder_width/2, 0, self.torso_height,
+                      _transform((0, -self.shoulder_width/4, torso_z)), 'shirt_color')
+        mesh.add_card(-self.shoulder_width/2, self.shoulder_width/2, 0, self.torso_height,
+                      _transform((0, self.shoulder_width/4, torso_z), h=180), 'shirt_color')
 
-        right = parent.attachNewNode(card_maker.generate())
-        right.setPos(self.shoulder_width/2, 0, torso_z)
-        right.setH(-90)
-        right.setColor(self.shirt_color)
+        # Sides
+        mesh.add_card(-self.shoulder_width/4, self.shoulder_width/4, 0, self.torso_height,
+                      _transform((-self.shoulder_width/2, 0, torso_z), h=90), 'shirt_color')
+        mesh.add_card(-self.shoulder_width/4, self.shoulder_width/4, 0, self.torso_height,
+                      _transform((self.shoulder_width/2, 0, torso_z), h=-90), 'shirt_color')
 
-    def _create_arms(self, parent: NodePath):
+    def _create_arms(self, mesh: _CharacterMesh):
         """Create arms with walking animation"""
-        card_maker = CardMaker("arm")
         shoulder_z = self.leg_length + self.torso_height * 0.85
 
         # Arms swing opposite to legs
-        left_arm_swing = -np.sin(self.walk_cycle * np.pi * 2) * 25
+        left_arm_swing = -float(_SIN_LUT[int(self.walk_cycle * _SIN_LUT_SIZE) & _SIN_LUT_MASK]) * 25.0
         right_arm_swing = -left_arm_swing
 
-        # Left arm
-        # Upper arm
-        card_maker.setFrame(-self.arm_thickness/2, self.arm_thickness/2,
-                           -self.upper_arm_length, 0)
-        left_upper = parent.attachNewNode(card_maker.generate())
-        left_upper.setPos(-self.shoulder_width/2 - self.arm_thickness/2, 0, shoulder_z)
-        left_upper.setP(-left_arm_swing)
-        left_upper.setColor(self.shirt_color)
-
-        # Forearm
-        card_maker.setFrame(-self.arm_thickness/2, self.arm_thickness/2,
-                           -self.forearm_length, 0)
-        left_forearm = left_upper.attachNewNode(card_maker.generate())
-        left_forearm.setZ(-self.upper_arm_length)
-        left_forearm.setColor(self.skin_tone)  # Exposed forearm
-
-        # Hand
-        hand_color = self.skin_tone
-        card_maker.setFrame(-self.arm_thickness/2, self.arm_thickness/2,
-                           -0.12, 0)
-        left_hand = left_forearm.attachNewNode(card_maker.generate())
-        left_hand.setZ(-self.forearm_length)
-        left_hand.setColor(hand_color)
-
-        # Right arm
-        card_maker.setFrame(-self.arm_thickness/2, self.arm_thickness/2,
-                           -self.upper_arm_length, 0)
-        right_upper = parent.attachNewNode(card_maker.generate())
-        right_upper.setPos(self.shoulder_width/2 + self.arm_thickness/2, 0, shoulder_z)
-        right_upper.setP(-right_arm_swing)
-        right_upper.setColor(self.shirt_color)
-
-        card_maker.setFrame(-self.arm_thickness/2, self.arm_thickness/2,
-                           -self.forearm_length, 0)
-        right_forearm = right_upper.attachNewNode(card_maker.generate())
-        right_forearm.setZ(-self.upper_arm_length)
-        right_forearm.setColor(self.skin_tone)
-
-        card_maker.setFrame(-self.arm_thickness/2, self.arm_thickness/2,
-                           -0.12, 0)
-        right_hand = right_forearm.attachNewNode(card_maker.generate())
-        right_hand.setZ(-self.forearm_length)
-        right_hand.setColor(hand_color)
-
-    def _create_head(self, parent: NodePath):
+        half = self.arm_thickness / 2
+        shoulder_x = self.shoulder_width/2 + half
+
+        for side_x, swing in ((-shoulder_x, left_arm_swing), (shoulder_x, right_arm_swing)):
+            # Upper arm
+            upper = _transform((side_x, 0, shoulder_z), p=-swing)
+            mesh.add_card(-half, half, -self.upper_arm_length, 0, upper, 'shirt_color')
+
+            # Forearm (exposed)
+            forearm = upper @ _transform((0, 0, -self.upper_arm_length))
+            mesh.add_card(-half, half, -self.forearm_length, 0, forearm, 'skin_tone')
+
+            # Hand
+            hand = forearm @ _transform((0, 0, -self.forearm_length))
+            mesh.add_card(-half, half, -0.12, 0, hand, 'skin_tone')
+
+    def _create_head(self, mesh: _CharacterMesh):
         """Create head and neck"""
-        card_maker = CardMaker("head")
         neck_z = self.leg_length + self.torso_height
 
         # Neck
-        card_maker.setFrame(-self.neck_height/2, self.neck_height/2,
-                           0, self.neck_height)
-        neck = parent.attachNewNode(card_maker.generate())
-        neck.setZ(neck_z)
-        neck.setColor(self.skin_tone)
+        mesh.add_card(-self.neck_height/2, self.neck_height/2, 0, self.neck_height,
+                      _transform((0, 0, neck_z)), 'skin_tone')
 
         # Head (simplified as box)
         head_z = neck_z + self.neck_height
+        half = self.head_width / 2
 
-        # Front face
-        card_maker.setFrame(-self.head_width/2, self.head_width/2,
-                           0, self.head_height)
-        face = parent.attachNewNode(card_maker.generate())
-        face.setPos(0, -self.head_width/2, head_z)
-        face.setColor(self.skin_tone)
-
-        # Back of head
-        back = parent.attachNewNode(card_maker.generate())
-        back.setPos(0, self.head_width/2, head_z)
-        back.setH(180)
-        back.setColor(self.skin_tone)
+        # Front face and back of head
+        mesh.add_card(-half, half, 0, self.head_height, _transform((0, -half, head_z)), 'skin_tone')
+        mesh.add_card(-half, half, 0, self.head_height, _transform((0, half, head_z), h=180),
+                      'skin_tone')
 
         # Sides
-        card_maker.setFrame(-self.head_width/2, self.head_width/2,
-                           0, self.head_height)
-
-        left = parent.attachNewNode(card_maker.generate())
-        left.setPos(-self.head_width/2, 0, head_z)
-        left.setH(90)
-        left.setColor(self.skin_tone)
-
-        right = parent.attachNewNode(card_maker.generate())
-        right.setPos(self.head_width/2, 0, head_z)
-        right.setH(-90)
-        right.setColor(self.skin_tone)
+        mesh.add_card(-half, half, 0, self.head_height, _transform((-half, 0, head_z), h=90),
+                      'skin_tone')
+        mesh.add_card(-half, half, 0, self.head_height, _transform((half, 0, head_z), h=-90),
+                      'skin_tone')
 
         # Top of head (hair)
-        card_maker.setFrame(-self.head_width/2, self.head_width/2,
-                           -self.head_width/2, self.head_width/2)
-        top = parent.attachNewNode(card_maker.generate())
-        top.setZ(head_z + self.head_height)
-        top.setP(-90)
-        top.setColor(self.hair_color)
-
-    def _create_bag(self, parent: NodePath):
+        mesh.add_card(-half, half, -half, half, _transform((0, 0, head_z + self.head_height), p=-90),
+                      'hair_color')
+
+    def _create_bag(self, mesh: _CharacterMesh):
         """Create bag/briefcase/backpack"""
-        card_maker = CardMaker("bag")
-
-        if self.character_type == CharacterType.BUSINESS_PERSON:
-            # Briefcase (in hand)
-            bag_color = (0.15, 0.12, 0.10, 1.0)  # Dark brown
-            bag_size = 0.35
-            bag_z = self.leg_length + self.torso_height * 0.5
-
-            card_maker.setFrame(-bag_size/2, bag_size/2, -bag_size, 0)
-            bag = parent.attachNewNode(card_maker.generate())
-            bag.setPos(self.shoulder_width/2 + 0.15, 0, bag_z)
-            bag.setColor(bag_color)
-
-        elif self.character_type == CharacterType.STUDENT:
-            # Backpack (on back)
-            bag_color = (0.25, 0.35, 0.65, 1.0)  # Blue
-            bag_width = self.shoulder_width * 0.7
-            bag_height = self.torso_height * 0.6
-            bag_z = self.leg_length + self.torso_height * 0.3
-
-            card_maker.setFrame(-bag_width/2, bag_width/2, 0, bag_height)
-            bag = parent.attachNewNode(card_maker.generate())
-            bag.setPos(0, self.shoulder_width/4 + 0.15, bag_z)
-            bag.setH(180)
-            bag.setColor(bag_color)
+        self._BAG_BUILDERS.get(self._tv, DetailedCharacter._create_shoulder_bag)(self, mesh)
 
-        else:
-            # Shoulder bag
-            bag_color = (0.55, 0.45, 0.35, 1.0)  # Brown
-            bag_size = 0.30
-            bag_z = self.leg_length + self.torso_height * 0.4
-
-            card_maker.setFrame(-bag_size, bag_size, -bag_size/2, bag_size/2)
-            bag = parent.attachNewNode(card_maker.generate())
-            bag.setPos(-self.shoulder_width/2 - 0.1, 0, bag_z)
-            bag.setH(90)
-            bag.setColor(bag_color)
-
-    def _create_hat(self, parent: NodePath):
+    def _create_briefcase(self, mesh: _CharacterMesh):
+        """Briefcase (in hand)"""
+        bag_size = 0.35
+        bag_z = self.leg_length + self.torso_height * 0.5
+
+        mesh.add_card(-bag_size/2, bag_size/2, -bag_size, 0,
+                      _transform((self.shoulder_width/2 + 0.15, 0, bag_z)), _BRIEFCASE_COLOR)
+
+    def _create_backpack(self, mesh: _CharacterMesh):
+        """Backpack (on back)"""
+        bag_width = self.shoulder_width * 0.7
+        bag_height = self.torso_height * 0.6
+        bag_z = self.leg_length + self.torso_height * 0.3
+
+        mesh.add_card(-bag_width/2, bag_width/2, 0, bag_height,
+                      _transform((0, self.shoulder_width/4 + 0.15, bag_z), h=180), _BACKPACK_COLOR)
+
+    def _create_shoulder_bag(self, mesh: _CharacterMesh):
+        """Shoulder bag (default)"""
+        bag_size = 0.30
+        bag_z = self.leg_length + self.torso_height * 0.4
+
+        mesh.add_card(-bag_size, bag_size, -bag_size/2, bag_size/2,
+                      _transform((-self.shoulder_width/2 - 0.1, 0, bag_z), h=90), _SHOULDER_BAG_COLOR)
+
+    # Bag builder per CharacterType value; other types carry a shoulder bag
+    _BAG_BUILDERS = {
+        _CT_BUSINESS_PERSON: _create_briefcase,
+        _CT_STUDENT: _create_backpack,
+    }
+
+    def _create_hat(self, mesh: _CharacterMesh):
         """Create hat"""
-        card_maker = CardMaker("hat")
         hat_z = self.leg_length + self.torso_height + self.neck_height + self.head_height
+        half = self.head_width / 2
 
-        if self.character_type == CharacterType.WORKER:
+        if self._tv == _CT_WORKER:
             # Hard hat
-            hat_color = (0.95, 0.75, 0.15, 1.0)  # Yellow
             hat_height = 0.15
 
-            card_maker.setFrame(-self.head_width/2, self.head_width/2,
-                               -self.head_width/2, self.head_width/2)
-            hat_top = parent.attachNewNode(card_maker.generate())
-            hat_top.setZ(hat_z + hat_height)
-            hat_top.setP(-90)
-            hat_top.setColor(hat_color)
+            mesh.add_card(-half, half, -half, half, _transform((0, 0, hat_z + hat_height), p=-90),
+                          'hat_color')
 
             # Brim
-            card_maker.setFrame(-self.head_width/2 - 0.08, self.head_width/2 + 0.08,
-                               -self.head_width/2 - 0.08, self.head_width/2 + 0.08)
-            brim = parent.attachNewNode(card_maker.generate())
-            brim.setZ(hat_z + 0.02)
-            brim.setP(-90)
-            brim.setColor(hat_color)
+            brim = half + 0.08
+            mesh.add_card(-brim, brim, -brim, brim, _transform((0, 0, hat_z + 0.02), p=-90), 'hat_color')
 
         else:
             # Regular hat/cap
-            hat_color = self._random_choice([
-                (0.12, 0.12, 0.15, 1.0),   # Black
-                (0.25, 0.35, 0.55, 1.0),   # Blue
-                (0.55, 0.45, 0.35, 1.0),   # Brown
-            ])
             hat_height = 0.12
 
-            card_maker.setFrame(-self.head_width/2, self.head_width/2,
-                               -self.head_width/2, self.head_width/2)
-            hat = parent.attachNewNode(card_maker.generate())
-            hat.setZ(hat_z + hat_height)
-            hat.setP(-90)
-            hat.setColor(hat_color)
+            mesh.add_card(-half, half, -half, half, _transform((0, 0, hat_z + hat_height), p=-90),
+                          'hat_color')
 
-    def _create_glasses(self, parent: NodePath):
+    def _create_glasses(self, mesh: _CharacterMesh):
         """Create glasses"""
-        card_maker = CardMaker("glasses")
         glasses_z = self.leg_length + self.torso_height + self.neck_height + self.head_height * 0.65
-        glasses_color = (0.15, 0.15, 0.15, 1.0)  # Black frames
+        glasses_y = -self.head_width/2 - 0.02
 
         lens_size = 0.06
 
-        # Left lens
-        card_maker.setFrame(-lens_size, lens_size, -lens_size/1.5, lens_size/1.5)
-        left_lens = parent.attachNewNode(card_maker.generate())
-        left_lens.setPos(-self.head_width/4, -self.head_width/2 - 0.02, glasses_z)
-        left_lens.setColor(glasses_color)
-
-        # Right lens
-        right_lens = parent.attachNewNode(card_maker.generate())
-        right_lens.setPos(self.head_width/4, -self.head_width/2 - 0.02, glasses_z)
-        right_lens.setColor(glasses_color)
+        # Left and right lens
+        for lens_x in (-self.head_width/4, self.head_width/4):
+            mesh.add_card(-lens_size, lens_size, -lens_size/1.5, lens_size/1.5,
+                          _transform((lens_x, glasses_y, glasses_z)), _GLASSES_COLOR)
 
         # Bridge
-        card_maker.setFrame(-self.head_width/8, self.head_width/8, -0.01, 0.01)
-        bridge = parent.attachNewNode(card_maker.generate())
-        bridge.setPos(0, -self.head_width/2 - 0.02, glasses_z)
-        bridge.setColor(glasses_color)
+        mesh.add_card(-self.head_width/8, self.head_width/8, -0.01, 0.01,
+                      _transform((0, glasses_y, glasses_z)), _GLASSES_COLOR)
+
+    def _make_specs(self) -> CharacterSpecs:
+        """Snapshot the (immutable) character attributes"""
+        return CharacterSpecs(self.character_type.name, self.gender.name, self.height,
+                              self.has_bag, self.has_hat, self.has_glasses)
 
-    def get_specs(self) -> Dict:
+    def get_specs(self) -> CharacterSpecs:
         """Get character specifications"""
-        return {
-            'type': self.character_type.name,
-            'gender': self.gender.name,
-            'height': self.height,
-            'has_bag': self.has_bag,
-            'has_hat': self.has_hat,
-            'has_glasses': self.has_glasses,
-        }
+        return self._specs
+
+
+def update_crowd(characters: List[DetailedCharacter], char_nodes: List[NodePath],
+                 progress: np.ndarray) -> np.ndarray:
+    """
+    Advance the walk cycle of a whole crowd by per-character progress.
+
+    char_nodes are the nodes returned by create_3d_model. Characters whose pose
+    moves into a new walk bin get their model re-cloned from the matching
+    template; impostors keep their billboard. Returns the (N,) swing sines
+    from the walk kernel.
+    """
+    n = len(characters)
+    walk_cycles = np.fromiter((c.walk_cycle for c in characters), dtype=np.float64, count=n)
+    old_bins = (walk_cycles * _WALK_BINS).astype(np.int32) % _WALK_BINS
+    walk_bins = np.empty(n, dtype=np.int32)
+    swing = np.empty(n, dtype=np.float32)
+
+    progress = np.ascontiguousarray(np.broadcast_to(progress, (n,)), dtype=np.float64)
+    _advance_walk_kernel(walk_cycles, progress, walk_bins, swing)
+
+    for i, character in enumerate(characters):
+        character.walk_cycle = float(walk_cycles[i])
+        if walk_bins[i] != old_bins[i] and not char_nodes[i].hasTag("impostor"):
+            char_nodes[i].getChildren().detach()
+            character._attach_model(char_nodes[i])
+
+    return swing
 
 
 if __name__ == "__main__":
@@ -574,10 +909,10 @@ if __name__ == "__main__":
         specs = char.get_specs()
 
         print(f"\n{char_type.name}:")
-        print(f"  Gender: {specs['gender']}")
-        print(f"  Height: {specs['height']:.2f}m")
-        print(f"  Accessories: Bag={specs['has_bag']}, "
-              f"Hat={specs['has_hat']}, Glasses={specs['has_glasses']}")
+        print(f"  Gender: {specs.gender}")
+        print(f"  Height: {specs.height:.2f}m")
+        print(f"  Accessories: Bag={specs.has_bag}, "
+              f"Hat={specs.has_hat}, Glasses={specs.has_glasses}")
 
     print("\n" + "=" * 70)
     print("Detailed characters with realistic proportions and clothing!")
@@ -6,10 +6,23 @@ Copyright 2025 Intellegix
 Licensed under the Apache License, Version 2.0
 """
 from panda3d.core import *
+import math
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Set, Callable
 from enum import Enum
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when Numba is missing: run the kernel as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 class VehicleType(Enum):
     """Vehicle categories"""
@@ -27,6 +40,129 @@ class VehicleType(Enum):
     DELIVERY_TRUCK = 11
 
 
+@njit(cache=True, fastmath=True)
+def _bake_quads(rows):
+    """
+    Expand quad rows into vertex positions and normals.
+
+    Each input row is (left, right, bottom, top, x, y, z, h, p, ...): a card in
+    its local XZ plane facing -Y, placed like a NodePath with setPos, setH and
+    setP. Output rows are (x, y, z, nx, ny, nz), four per quad in lower-left,
+    lower-right, upper-right, upper-left order.
+    """
+    n = rows.shape[0]
+    out = np.empty((n * 4, 6), dtype=np.float32)
+    for i in range(n):
+        left, right, bottom, top = rows[i, 0], rows[i, 1], rows[i, 2], rows[i, 3]
+        px, py, pz = rows[i, 4], rows[i, 5], rows[i, 6]
+        h = rows[i, 7] * (math.pi / 180.0)
+        p = rows[i, 8] * (math.pi / 180.0)
+        ch, sh = math.cos(h), math.sin(h)
+        cp, sp = math.cos(p), math.sin(p)
+
+        # Panda3D applies pitch first, then heading
+        for k in range(4):
+            x = left if k == 0 or k == 3 else right
+            z = bottom if k < 2 else top
+            row = i * 4 + k
+            out[row, 0] = ch * x + sh * sp * z + px
+            out[row, 1] = sh * x - ch * sp * z + py
+            out[row, 2] = cp * z + pz
+            out[row, 3] = sh * cp
+            out[row, 4] = -ch * cp
+            out[row, 5] = -sp
+    return out
+
+
+def _make_vertex_format() -> GeomVertexFormat:
+    """float32 position and normal plus packed 8-bit RGBA color, matching _VERTEX_DTYPE"""
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NTFloat32, Geom.CPoint)
+    array_format.addColumn(InternalName.getNormal(), 3, Geom.NTFloat32, Geom.CNormal)
+    array_format.addColumn(InternalName.getColor(), 4, Geom.NTUint8, Geom.CColor)
+    return GeomVertexFormat.registerFormat(array_format)
+
+
+_VERTEX_FORMAT = _make_vertex_format()
+_VERTEX_DTYPE = np.dtype([("vertex", np.float32, 3), ("normal", np.float32, 3), ("color", np.uint8, 4)])
+_QUAD_INDICES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+
+# Shared by every translucent (window) Geom; its color comes from the vertices
+_WINDOW_STATE = RenderState.make(TransparencyAttrib.make(TransparencyAttrib.MAlpha))
+
+
+class VehicleMeshBuilder:
+    """
+    Accumulates CardMaker-style quads for one vehicle into a shared vertex table.
+
+    Quads are recorded as rows and baked in one pass by _bake_quads; finish()
+    emits one Geom per color, alpha-blending the translucent ones.
+    """
+
+    def __init__(self):
+        self.rows: List[Tuple] = []
+
+    def add_quad(self, left: float, right: float, bottom: float, top: float,
+                 pos: Tuple[float, float, float], color: Tuple[float, float, float, float],
+                 h: float = 0.0, p: float = 0.0):
+        """Add a quad spanning (left, right, bottom, top) in its local XZ plane, facing -Y"""
+        self.rows.append((left, right, bottom, top, pos[0], pos[1], pos[2], h, p) + tuple(color))
+
+    def add_quads(self, frames: np.ndarray, positions: np.ndarray, colors: np.ndarray,
+                  h: np.ndarray = 0.0, p: np.ndarray = 0.0):
+        """
+        Add n quads at once from arrays.
+
+        frames is (n, 4) (left, right, bottom, top) and positions is (n, 3);
+        colors, h and p may be per-quad arrays or single values broadcast to
+        every quad.
+        """
+        n = len(positions)
+        rows = np.empty((n, 13))
+        rows[:, 0:4] = frames
+        rows[:, 4:7] = positions
+        rows[:, 7] = h
+        rows[:, 8] = p
+        rows[:, 9:13] = colors
+        self.rows.extend(map(tuple, rows.tolist()))
+
+    def finish(self, name: str = "vehicle") -> GeomNode:
+        """Bake the quads and wrap them in a GeomNode holding one Geom per color"""
+        rows = np.array(self.rows, dtype=np.float64)
+        baked = _bake_quads(rows)
+
+        vertices = np.empty(len(baked), dtype=_VERTEX_DTYPE)
+        vertices["vertex"] = baked[:, 0:3]
+        vertices["normal"] = baked[:, 3:6]
+        vertices["color"] = np.repeat(np.rint(rows[:, 9:13] * 255).astype(np.uint8), 4, axis=0)
+
+        vdata = GeomVertexData("vehicle", _VERTEX_FORMAT, Geom.UHStatic)
+        vdata.uncleanSetNumRows(len(vertices))
+        vdata.modifyArrayHandle(0).copyDataFrom(vertices)
+
+        # Quad indices grouped by color, in first-seen color order
+        buckets: Dict[Tuple, List[int]] = {}
+        for quad, row in enumerate(self.rows):
+            buckets.setdefault(row[9:], []).append(quad)
+
+        geom_node = GeomNode(name)
+        for color, quads in buckets.items():
+            indices = (np.array(quads, dtype=np.uint32)[:, None] * 4 + _QUAD_INDICES).ravel()
+            triangles = GeomTriangles(Geom.UHStatic)
+            triangles.setIndexType(Geom.NTUint32)
+            index_array = triangles.modifyVertices()
+            index_array.uncleanSetNumRows(len(indices))
+            index_array.modifyHandle().copyDataFrom(indices)
+
+            geom = Geom(vdata)
+            geom.addPrimitive(triangles)
+            if color[3] < 1.0:
+                geom_node.addGeom(geom, _WINDOW_STATE)
+            else:
+                geom_node.addGeom(geom)
+        return geom_node
+
+
 class DetailedVehicle:
     """
     Photorealistic vehicle generator with detailed geometry.
@@ -45,29 +181,58 @@ class DetailedVehicle:
     - Grill and bumpers
     """
 
-    STANDARD_COLORS = [
-        (0.08, 0.08, 0.08, 1.0),     # Black
-        (0.95, 0.95, 0.95, 1.0),     # White
-        (0.50, 0.50, 0.52, 1.0),     # Gray
-        (0.75, 0.08, 0.08, 1.0),     # Red
-        (0.08, 0.20, 0.65, 1.0),     # Blue
-        (0.15, 0.55, 0.20, 1.0),     # Green
-        (0.85, 0.75, 0.10, 1.0),     # Yellow
-        (0.65, 0.35, 0.12, 1.0),     # Brown
-        (0.72, 0.72, 0.78, 1.0),     # Silver
-        (0.12, 0.18, 0.28, 1.0),     # Dark blue
-        (0.55, 0.10, 0.10, 1.0),     # Maroon
-        (0.08, 0.45, 0.52, 1.0),     # Teal
-        (0.20, 0.55, 0.75, 1.0),     # Light blue
-        (0.85, 0.45, 0.12, 1.0),     # Orange
-        (0.45, 0.12, 0.58, 1.0),     # Purple
-    ]
+    STANDARD_COLORS = np.array([
+        [0.08, 0.08, 0.08, 1.0],     # Black
+        [0.95, 0.95, 0.95, 1.0],     # White
+        [0.50, 0.50, 0.52, 1.0],     # Gray
+        [0.75, 0.08, 0.08, 1.0],     # Red
+        [0.08, 0.20, 0.65, 1.0],     # Blue
+        [0.15, 0.55, 0.20, 1.0],     # Green
+        [0.85, 0.75, 0.10, 1.0],     # Yellow
+        [0.65, 0.35, 0.12, 1.0],     # Brown
+        [0.72, 0.72, 0.78, 1.0],     # Silver
+        [0.12, 0.18, 0.28, 1.0],     # Dark blue
+        [0.55, 0.10, 0.10, 1.0],     # Maroon
+        [0.08, 0.45, 0.52, 1.0],     # Teal
+        [0.20, 0.55, 0.75, 1.0],     # Light blue
+        [0.85, 0.45, 0.12, 1.0],     # Orange
+        [0.45, 0.12, 0.58, 1.0],     # Purple
+    ], dtype=np.float32)
+
+    # Length x width x height per type (meters)
+    _DIMS = {
+        VehicleType.SEDAN: (4.7, 1.8, 1.45),
+        VehicleType.SUV: (4.9, 2.0, 1.85),
+        VehicleType.TRUCK: (5.8, 2.2, 1.95),
+        VehicleType.VAN: (5.2, 2.0, 2.3),
+        VehicleType.BUS: (12.0, 2.55, 3.2),
+        VehicleType.TAXI: (4.7, 1.8, 1.45),
+        VehicleType.POLICE: (4.8, 1.9, 1.5),
+        VehicleType.AMBULANCE: (5.8, 2.2, 2.5),
+        VehicleType.SPORTS_CAR: (4.3, 1.95, 1.15),
+        VehicleType.VINTAGE: (4.2, 1.75, 1.65),
+        VehicleType.HATCHBACK: (4.0, 1.75, 1.5),
+        VehicleType.DELIVERY_TRUCK: (6.5, 2.3, 2.8),
+    }
+
+    # Hood, cabin, trunk fractions of length (fallback: sedan, SUV, etc.)
+    _PROPS_RATIOS = {
+        VehicleType.SPORTS_CAR: (0.45, 0.35, 0.20),
+        VehicleType.BUS: (0.20, 0.80, 0.0),
+        VehicleType.VAN: (0.20, 0.80, 0.0),
+        VehicleType.DELIVERY_TRUCK: (0.20, 0.80, 0.0),
+        VehicleType.TRUCK: (0.35, 0.35, 0.30),  # Trunk is the bed
+    }
+    _DEFAULT_PROPS_RATIOS = (0.35, 0.40, 0.25)
+
+    # Flattened model per (type, body color); every vehicle with that look instances it
+    _prototype_cache: Dict[Tuple[VehicleType, Tuple], NodePath] = {}
 
     def __init__(self, vehicle_type: VehicleType, seed: int = None):
         """Initialize detailed vehicle"""
         self.vehicle_type = vehicle_type
         self.seed = seed or np.random.randint(0, 1000000)
-        np.random.seed(self.seed)
+        self._rng = np.random.default_rng(self.seed)
 
         # Get dimensions
         self.length, self.width, self.height = self._get_dimensions()
@@ -77,46 +242,26 @@ class DetailedVehicle:
         self.window_color = (0.15, 0.20, 0.30, 0.6)  # Dark tinted glass
         self.chrome_color = (0.85, 0.87, 0.90, 1.0)  # Chrome/metal
 
+        # Darker shades of the body color
+        br, bg, bb, _ = self.body_color
+        self.door_outline_color = (br * 0.85, bg * 0.85, bb * 0.85, 1.0)
+        self.pillar_color = (br * 0.7, bg * 0.7, bb * 0.7, 1.0)
+
         # Body proportions
         self._calculate_proportions()
 
     def _get_dimensions(self) -> Tuple[float, float, float]:
         """Get vehicle dimensions"""
-        dims = {
-            VehicleType.SEDAN: (4.7, 1.8, 1.45),
-            VehicleType.SUV: (4.9, 2.0, 1.85),
-            VehicleType.TRUCK: (5.8, 2.2, 1.95),
-            VehicleType.VAN: (5.2, 2.0, 2.3),
-            VehicleType.BUS: (12.0, 2.55, 3.2),
-            VehicleType.TAXI: (4.7, 1.8, 1.45),
-            VehicleType.POLICE: (4.8, 1.9, 1.5),
-            VehicleType.AMBULANCE: (5.8, 2.2, 2.5),
-            VehicleType.SPORTS_CAR: (4.3, 1.95, 1.15),
-            VehicleType.VINTAGE: (4.2, 1.75, 1.65),
-            VehicleType.HATCHBACK: (4.0, 1.75, 1.5),
-            VehicleType.DELIVERY_TRUCK: (6.5, 2.3, 2.8),
-        }
-        return dims[self.vehicle_type]
+        return self._DIMS[self.vehicle_type]
 
     def _calculate_proportions(self):
         """Calculate vehicle body proportions"""
         # Hood, cabin, trunk proportions
-        if self.vehicle_type == VehicleType.SPORTS_CAR:
-            self.hood_length = self.length * 0.45
-            self.cabin_length = self.length * 0.35
-            self.trunk_length = self.length * 0.20
-        elif self.vehicle_type in [VehicleType.BUS, VehicleType.VAN, VehicleType.DELIVERY_TRUCK]:
-            self.hood_length = self.length * 0.20
-            self.cabin_length = self.length * 0.80
-            self.trunk_length = 0
-        elif self.vehicle_type == VehicleType.TRUCK:
-            self.hood_length = self.length * 0.35
-            self.cabin_length = self.length * 0.35
-            self.trunk_length = self.length * 0.30  # Bed
-        else:  # Sedan, SUV, etc.
-            self.hood_length = self.length * 0.35
-            self.cabin_length = self.length * 0.40
-            self.trunk_length = self.length * 0.25
+        hood_ratio, cabin_ratio, trunk_ratio = self._PROPS_RATIOS.get(self.vehicle_type,
+                                                                     self._DEFAULT_PROPS_RATIOS)
+        self.hood_length = self.length * hood_ratio
+        self.cabin_length = self.length * cabin_ratio
+        self.trunk_length = self.length * trunk_ratio
 
         # Heights
         self.body_height = self.height * 0.6  # Lower body
@@ -137,56 +282,68 @@ class DetailedVehicle:
         elif self.vehicle_type == VehicleType.DELIVERY_TRUCK:
             return (0.88, 0.88, 0.90, 1.0)  # White/light gray
         else:
-            return self.STANDARD_COLORS[np.random.randint(0, len(self.STANDARD_COLORS))]
+            return tuple(self.STANDARD_COLORS[self._rng.integers(0, len(self.STANDARD_COLORS))].tolist())
 
     def create_3d_model(self, parent_node: NodePath, position: Tuple[float, float, float],
                        heading: float = 0) -> NodePath:
         """Create detailed 3D vehicle"""
-        vehicle_node = parent_node.attachNewNode(f"vehicle_{self.vehicle_type.name}_{self.seed}")
+        vehicle_node = parent_node.attachNewNode("vehicle")
+        vehicle_node.setPythonTag("seed", self.seed)
         vehicle_node.setPos(*position)
         vehicle_node.setH(heading)
 
+        self._get_prototype().instanceTo(vehicle_node)
+        return vehicle_node
+
+    def _get_prototype(self) -> NodePath:
+        """Get (or build and flatten once) the shared model for this type and color"""
+        key = (self.vehicle_type, self.body_color)
+        prototype = self._prototype_cache.get(key)
+        if prototype is not None:
+            return prototype
+
+        builder = VehicleMeshBuilder()
+
         # 1. Undercarriage (chassis)
-        self._create_undercarriage(vehicle_node)
+        self._create_undercarriage(builder)
 
         # 2. Lower body (hood, trunk, sides)
-        self._create_lower_body(vehicle_node)
+        self._create_lower_body(builder)
 
         # 3. Upper cabin (windshield, roof, windows)
-        self._create_upper_cabin(vehicle_node)
+        self._create_upper_cabin(builder)
 
         # 4. Detailed wheels with rims
-        self._create_detailed_wheels(vehicle_node)
+        self._create_detailed_wheels(builder)
 
         # 5. Lights (headlights, taillights)
-        self._create_lights(vehicle_node)
+        self._create_lights(builder)
 
         # 6. Details (mirrors, door handles, grill)
-        self._create_details(vehicle_node)
+        self._create_details(builder)
 
         # 7. Special markings
-        if self.vehicle_type in [VehicleType.POLICE, VehicleType.AMBULANCE, VehicleType.TAXI]:
-            self._add_special_markings(vehicle_node)
+        add_markings = self._MARKING_FN.get(self.vehicle_type)
+        if add_markings:
+            add_markings(self, builder)
 
-        return vehicle_node
+        # Merge the per-color Geoms that share a render state
+        prototype = NodePath(builder.finish(f"vehicle_proto_{self.vehicle_type.name}"))
+        prototype.flattenStrong()
+        self._prototype_cache[key] = prototype
+        return prototype
 
-    def _create_undercarriage(self, parent: NodePath):
+    def _create_undercarriage(self, builder: VehicleMeshBuilder):
         """Create vehicle undercarriage/chassis"""
-        card_maker = CardMaker("chassis")
         chassis_color = (0.15, 0.15, 0.15, 1.0)  # Dark gray/black
         chassis_height = 0.25
 
         # Bottom plate
-        card_maker.setFrame(-self.width/2 + 0.2, self.width/2 - 0.2,
-                           -self.length/2 + 0.3, self.length/2 - 0.3)
-        chassis = parent.attachNewNode(card_maker.generate())
-        chassis.setZ(chassis_height)
-        chassis.setP(-90)
-        chassis.setColor(chassis_color)
-
-    def _create_lower_body(self, parent: NodePath):
+        builder.add_quad(-self.width/2 + 0.2, self.width/2 - 0.2, -self.length/2 + 0.3,
+                         self.length/2 - 0.3, (0, 0, chassis_height), chassis_color, p=-90)
+
+    def _create_lower_body(self, builder: VehicleMeshBuilder):
         """Create lower body (hood, sides, trunk)"""
-        card_maker = CardMaker("body")
         body_z = self.wheel_radius + 0.1
 
         # Hood section
@@ -194,17 +351,12 @@ class DetailedVehicle:
         hood_end = self.length/2 - self.hood_length
 
         # Front (hood/bumper)
-        card_maker.setFrame(-self.width/2, self.width/2, 0, self.body_height)
-        front = parent.attachNewNode(card_maker.generate())
-        front.setPos(0, hood_start, body_z)
-        front.setColor(self.body_color)
+        builder.add_quad(-self.width/2, self.width/2, 0, self.body_height, (0, hood_start, body_z),
+                         self.body_color)
 
         # Hood top (slopes slightly)
-        card_maker.setFrame(-self.width/2, self.width/2, hood_end, hood_start)
-        hood_top = parent.attachNewNode(card_maker.generate())
-        hood_top.setZ(body_z + self.body_height)
-        hood_top.setP(-85)  # Slight slope
-        hood_top.setColor(self.body_color)
+        builder.add_quad(-self.width/2, self.width/2, hood_end, hood_start,
+                         (0, 0, body_z + self.body_height), self.body_color, p=-85)
 
         # Trunk section
         trunk_start = hood_end - self.cabin_length
@@ -212,364 +364,240 @@ class DetailedVehicle:
 
         if self.trunk_length > 0:
             # Rear (trunk/bumper)
-            card_maker.setFrame(-self.width/2, self.width/2, 0, self.body_height)
-            rear = parent.attachNewNode(card_maker.generate())
-            rear.setPos(0, trunk_end, body_z)
-            rear.setH(180)
-            rear.setColor(self.body_color)
+            builder.add_quad(-self.width/2, self.width/2, 0, self.body_height,
+                             (0, trunk_end, body_z), self.body_color, h=180)
 
             # Trunk top (slopes slightly)
-            card_maker.setFrame(-self.width/2, self.width/2, trunk_end, trunk_start)
-            trunk_top = parent.attachNewNode(card_maker.generate())
-            trunk_top.setZ(body_z + self.body_height)
-            trunk_top.setP(-95)  # Slight slope
-            trunk_top.setColor(self.body_color)
-
-        # Side panels
-        card_maker.setFrame(-self.length/2, self.length/2, 0, self.body_height)
-
-        # Left side
-        left = parent.attachNewNode(card_maker.generate())
-        left.setPos(-self.width/2, 0, body_z)
-        left.setH(90)
-        left.setColor(self.body_color)
-
-        # Right side
-        right = parent.attachNewNode(card_maker.generate())
-        right.setPos(self.width/2, 0, body_z)
-        right.setH(-90)
-        right.setColor(self.body_color)
+            builder.add_quad(-self.width/2, self.width/2, trunk_end, trunk_start,
+                             (0, 0, body_z + self.body_height), self.body_color, p=-95)
+
+        # Side panels (left, right)
+        for side_x, heading in ((-self.width/2, 90), (self.width/2, -90)):
+            builder.add_quad(-self.length/2, self.length/2, 0, self.body_height,
+                             (side_x, 0, body_z), self.body_color, h=heading)
 
         # Add door panels and handles
-        self._create_doors(parent, body_z)
+        self._create_doors(builder, body_z)
 
-    def _create_doors(self, parent: NodePath, body_z: float):
+    def _create_doors(self, builder: VehicleMeshBuilder, body_z: float):
         """Create door panels with handles"""
-        card_maker = CardMaker("door")
         door_height = self.body_height * 0.8
         door_length = self.cabin_length * 0.45
         door_z = body_z + self.body_height * 0.1
 
-        # Door outline (slightly darker)
-        door_outline_color = (self.body_color[0] * 0.85, self.body_color[1] * 0.85,
-                              self.body_color[2] * 0.85, 1.0)
-
-        # Left front door
-        card_maker.setFrame(-door_length/2, door_length/2, 0, door_height)
-        left_front = parent.attachNewNode(card_maker.generate())
-        left_front.setPos(-self.width/2 - 0.02, self.cabin_length/4, door_z)
-        left_front.setH(90)
-        left_front.setColor(door_outline_color)
-
-        # Right front door
-        right_front = parent.attachNewNode(card_maker.generate())
-        right_front.setPos(self.width/2 + 0.02, self.cabin_length/4, door_z)
-        right_front.setH(-90)
-        right_front.setColor(door_outline_color)
+        # Left and right front doors
+        for side_x, heading in ((-self.width/2 - 0.02, 90), (self.width/2 + 0.02, -90)):
+            builder.add_quad(-door_length/2, door_length/2, 0, door_height,
+                             (side_x, self.cabin_length/4, door_z), self.door_outline_color, h=heading)
 
         # Door handles (chrome)
         handle_size = 0.15
         handle_z = door_z + door_height * 0.5
 
         for side_x, heading in [(-self.width/2 - 0.03, 90), (self.width/2 + 0.03, -90)]:
-            card_maker.setFrame(-handle_size, handle_size, -handle_size/2, handle_size/2)
-            handle = parent.attachNewNode(card_maker.generate())
-            handle.setPos(side_x, self.cabin_length/4, handle_z)
-            handle.setH(heading)
-            handle.setColor(self.chrome_color)
+            builder.add_quad(-handle_size, handle_size, -handle_size/2, handle_size/2,
+                             (side_x, self.cabin_length/4, handle_z), self.chrome_color, h=heading)
 
-    def _create_upper_cabin(self, parent: NodePath):
+    def _create_upper_cabin(self, builder: VehicleMeshBuilder):
         """Create upper cabin with windshield and windows"""
-        card_maker = CardMaker("cabin")
         cabin_z = self.wheel_radius + 0.1 + self.body_height
         cabin_start = self.length/2 - self.hood_length
         cabin_end = cabin_start - self.cabin_length
 
-        # Windshield (front, angled)
+        # Windshield (front, angled back)
         windshield_height = self.cabin_height * 0.9
-        card_maker.setFrame(-self.width/2 + 0.15, self.width/2 - 0.15, 0, windshield_height)
-        windshield = parent.attachNewNode(card_maker.generate())
-        windshield.setPos(0, cabin_start - 0.1, cabin_z)
-        windshield.setP(25)  # Angled back
-        windshield.setColor(self.window_color)
-        windshield.setTransparency(TransparencyAttrib.MAlpha)
+        builder.add_quad(-self.width/2 + 0.15, self.width/2 - 0.15, 0, windshield_height,
+                         (0, cabin_start - 0.1, cabin_z), self.window_color, p=25)
 
         # Rear window (angled)
         if self.trunk_length > 0:
-            card_maker.setFrame(-self.width/2 + 0.15, self.width/2 - 0.15, 0, windshield_height * 0.8)
-            rear_window = parent.attachNewNode(card_maker.generate())
-            rear_window.setPos(0, cabin_end + 0.1, cabin_z)
-            rear_window.setP(-25)  # Angled back
-            rear_window.setH(180)
-            rear_window.setColor(self.window_color)
-            rear_window.setTransparency(TransparencyAttrib.MAlpha)
-
-        # Side windows
-        window_height = self.cabin_height * 0.7
-        window_length = self.cabin_length * 0.85
+            builder.add_quad(-self.width/2 + 0.15, self.width/2 - 0.15, 0, windshield_height * 0.8,
+                             (0, cabin_end + 0.1, cabin_z), self.window_color, h=180, p=-25)
 
-        card_maker.setFrame(cabin_end + 0.2, cabin_start - 0.2, 0, window_height)
-
-        # Left windows
-        left_windows = parent.attachNewNode(card_maker.generate())
-        left_windows.setPos(-self.width/2 - 0.02, 0, cabin_z + 0.1)
-        left_windows.setH(90)
-        left_windows.setColor(self.window_color)
-        left_windows.setTransparency(TransparencyAttrib.MAlpha)
+        # Side windows (left, right)
+        window_height = self.cabin_height * 0.7
 
-        # Right windows
-        right_windows = parent.attachNewNode(card_maker.generate())
-        right_windows.setPos(self.width/2 + 0.02, 0, cabin_z + 0.1)
-        right_windows.setH(-90)
-        right_windows.setColor(self.window_color)
-        right_windows.setTransparency(TransparencyAttrib.MAlpha)
+        for side_x, heading in ((-self.width/2 - 0.02, 90), (self.width/2 + 0.02, -90)):
+            builder.add_quad(cabin_end + 0.2, cabin_start - 0.2, 0, window_height,
+                             (side_x, 0, cabin_z + 0.1), self.window_color, h=heading)
 
         # Roof
-        card_maker.setFrame(-self.width/2, self.width/2, cabin_end, cabin_start)
-        roof = parent.attachNewNode(card_maker.generate())
-        roof.setZ(cabin_z + self.cabin_height)
-        roof.setP(-90)
-        roof.setColor(self.body_color)
+        builder.add_quad(-self.width/2, self.width/2, cabin_end, cabin_start,
+                         (0, 0, cabin_z + self.cabin_height), self.body_color, p=-90)
 
         # Roof pillars (A, B, C pillars)
-        self._create_roof_pillars(parent, cabin_z, cabin_start, cabin_end)
+        self._create_roof_pillars(builder, cabin_z, cabin_start, cabin_end)
 
-    def _create_roof_pillars(self, parent: NodePath, cabin_z: float, front_y: float, rear_y: float):
+    def _create_roof_pillars(self, builder: VehicleMeshBuilder, cabin_z: float, front_y: float, rear_y: float):
         """Create roof support pillars"""
         pillar_width = 0.12
-        pillar_color = (self.body_color[0] * 0.7, self.body_color[1] * 0.7,
-                       self.body_color[2] * 0.7, 1.0)
-
-        card_maker = CardMaker("pillar")
-        card_maker.setFrame(-pillar_width/2, pillar_width/2, 0, self.cabin_height)
-
-        # A-pillars (front)
-        for x in [-self.width/2 + 0.15, self.width/2 - 0.15]:
-            pillar = parent.attachNewNode(card_maker.generate())
-            pillar.setPos(x, front_y - 0.2, cabin_z)
-            pillar.setColor(pillar_color)
-
-        # B-pillars (middle)
-        mid_y = (front_y + rear_y) / 2
-        for x in [-self.width/2 + 0.15, self.width/2 - 0.15]:
-            pillar = parent.attachNewNode(card_maker.generate())
-            pillar.setPos(x, mid_y, cabin_z)
-            pillar.setColor(pillar_color)
-
-        # C-pillars (rear) - if has trunk
+
+        # A-pillars (front), B-pillars (middle), C-pillars (rear) if has trunk
+        pillar_ys = [front_y - 0.2, (front_y + rear_y) / 2]
         if self.trunk_length > 0:
+            pillar_ys.append(rear_y + 0.2)
+
+        for y in pillar_ys:
             for x in [-self.width/2 + 0.15, self.width/2 - 0.15]:
-                pillar = parent.attachNewNode(card_maker.generate())
-                pillar.setPos(x, rear_y + 0.2, cabin_z)
-                pillar.setColor(pillar_color)
+                builder.add_quad(-pillar_width/2, pillar_width/2, 0, self.cabin_height,
+                                 (x, y, cabin_z), self.pillar_color)
 
-    def _create_detailed_wheels(self, parent: NodePath):
+    def _create_detailed_wheels(self, builder: VehicleMeshBuilder):
         """Create detailed wheels with rims and tires"""
         # Wheel positions
         if self.vehicle_type == VehicleType.BUS:
             # Bus has more wheels
-            positions = [
-                (-self.width/2 - 0.15, self.length/2 - 1.5, self.wheel_radius),  # Front left
-                (self.width/2 + 0.15, self.length/2 - 1.5, self.wheel_radius),   # Front right
-                (-self.width/2 - 0.15, -self.length/2 + 2.5, self.wheel_radius), # Rear left 1
-                (self.width/2 + 0.15, -self.length/2 + 2.5, self.wheel_radius),  # Rear right 1
-                (-self.width/2 - 0.15, -self.length/2 + 1.0, self.wheel_radius), # Rear left 2
-                (self.width/2 + 0.15, -self.length/2 + 1.0, self.wheel_radius),  # Rear right 2
-            ]
+            positions = np.array([
+                [-self.width/2 - 0.15, self.length/2 - 1.5, self.wheel_radius],  # Front left
+                [self.width/2 + 0.15, self.length/2 - 1.5, self.wheel_radius],   # Front right
+                [-self.width/2 - 0.15, -self.length/2 + 2.5, self.wheel_radius], # Rear left 1
+                [self.width/2 + 0.15, -self.length/2 + 2.5, self.wheel_radius],  # Rear right 1
+                [-self.width/2 - 0.15, -self.length/2 + 1.0, self.wheel_radius], # Rear left 2
+                [self.width/2 + 0.15, -self.length/2 + 1.0, self.wheel_radius],  # Rear right 2
+            ])
         else:
             front_offset = self.length/2 - self.hood_length * 0.8
             rear_offset = -self.length/2 + self.trunk_length * 0.5 if self.trunk_length > 0 else -self.length/2 + 0.8
 
-            positions = [
-                (-self.width/2 - 0.1, front_offset, self.wheel_radius),  # Front left
-                (self.width/2 + 0.1, front_offset, self.wheel_radius),   # Front right
-                (-self.width/2 - 0.1, rear_offset, self.wheel_radius),   # Rear left
-                (self.width/2 + 0.1, rear_offset, self.wheel_radius),    # Rear right
-            ]
-
-        for i, pos in enumerate(positions):
-            self._create_single_wheel(parent, pos, i % 2 == 0)
-
-    def _create_single_wheel(self, parent: NodePath, pos: Tuple[float, float, float], is_left: bool):
-        """Create single detailed wheel with tire and rim"""
-        card_maker = CardMaker("wheel")
-
-        # Tire (black, outer part)
-        tire_color = (0.08, 0.08, 0.08, 1.0)
-        card_maker.setFrame(-self.wheel_radius, self.wheel_radius,
-                           -self.wheel_radius, self.wheel_radius)
-        tire = parent.attachNewNode(card_maker.generate())
-        tire.setPos(*pos)
-        tire.setH(90 if is_left else -90)
-        tire.setColor(tire_color)
-
-        # Rim (chrome/silver, inner part)
+            positions = np.array([
+                [-self.width/2 - 0.1, front_offset, self.wheel_radius],  # Front left
+                [self.width/2 + 0.1, front_offset, self.wheel_radius],   # Front right
+                [-self.width/2 - 0.1, rear_offset, self.wheel_radius],   # Rear left
+                [self.width/2 + 0.1, rear_offset, self.wheel_radius],    # Rear right
+            ])
+
+        # Left wheels are the even rows and face -X; right wheels mirror them
+        n = len(positions)
+        side = np.where(np.arange(n) % 2 == 0, 1.0, -1.0)
+        headings = 90.0 * side
+        step = np.zeros((n, 3))
+        step[:, 0] = side
+
+        # One row per wheel part, emitted for every wheel in a single call:
+        # tire (black, outer part), rim (chrome, inner part), brake disc (visible
+        # through rim) and a curved fender over the wheel
         rim_radius = self.wheel_radius * 0.65
-        card_maker.setFrame(-rim_radius, rim_radius, -rim_radius, rim_radius)
-        rim = parent.attachNewNode(card_maker.generate())
-        rim.setPos(pos[0] + (0.01 if is_left else -0.01), pos[1], pos[2])
-        rim.setH(90 if is_left else -90)
-        rim.setColor(self.chrome_color)
-
-        # Brake disc (visible through rim)
         brake_radius = rim_radius * 0.75
-        brake_color = (0.35, 0.32, 0.30, 1.0)  # Dark metal
-        card_maker.setFrame(-brake_radius, brake_radius, -brake_radius, brake_radius)
-        brake = parent.attachNewNode(card_maker.generate())
-        brake.setPos(pos[0] + (0.02 if is_left else -0.02), pos[1], pos[2])
-        brake.setH(90 if is_left else -90)
-        brake.setColor(brake_color)
-
-        # Wheel well/fender
-        self._create_wheel_well(parent, pos, is_left)
-
-    def _create_wheel_well(self, parent: NodePath, wheel_pos: Tuple[float, float, float], is_left: bool):
-        """Create wheel well/fender around wheel"""
-        card_maker = CardMaker("fender")
-        fender_color = self.body_color
-
-        # Curved fender over wheel
         fender_width = self.wheel_radius * 2.2
         fender_height = self.wheel_radius * 0.5
-
-        card_maker.setFrame(-fender_width/2, fender_width/2, 0, fender_height)
-        fender = parent.attachNewNode(card_maker.generate())
-        fender.setPos(wheel_pos[0], wheel_pos[1], wheel_pos[2] + self.wheel_radius)
-        fender.setP(-90)
-        fender.setH(90 if is_left else -90)
-        fender.setColor(fender_color)
-
-    def _create_lights(self, parent: NodePath):
+        part_frames = np.array([
+            [-self.wheel_radius, self.wheel_radius, -self.wheel_radius, self.wheel_radius],
+            [-rim_radius, rim_radius, -rim_radius, rim_radius],
+            [-brake_radius, brake_radius, -brake_radius, brake_radius],
+            [-fender_width/2, fender_width/2, 0, fender_height],
+        ])
+        part_offsets = np.array([0.0, 0.01, 0.02, 0.0])  # Outward, along each wheel's side
+        part_lifts = np.array([0.0, 0.0, 0.0, self.wheel_radius])
+        part_colors = np.array([
+            (0.08, 0.08, 0.08, 1.0),
+            self.chrome_color,
+            (0.35, 0.32, 0.30, 1.0),  # Dark metal
+            self.body_color,
+        ])
+        part_pitches = np.array([0.0, 0.0, 0.0, -90.0])
+
+        num_parts = len(part_frames)
+        part_positions = (positions[None, :, :] + part_offsets[:, None, None] * step[None, :, :])
+        part_positions[:, :, 2] += part_lifts[:, None]
+        builder.add_quads(np.repeat(part_frames, n, axis=0), part_positions.reshape(-1, 3),
+                          np.repeat(part_colors, n, axis=0), h=np.tile(headings, num_parts),
+                          p=np.repeat(part_pitches, n))
+
+    def _create_lights(self, builder: VehicleMeshBuilder):
         """Create headlights and taillights"""
-        card_maker = CardMaker("light")
-
         # Headlights (front, white/yellow)
         headlight_color = (0.95, 0.95, 0.88, 1.0)  # Warm white
         headlight_size = 0.25
 
         for x in [-self.width/2 + 0.4, self.width/2 - 0.4]:
-            # Main headlight
-            card_maker.setFrame(-headlight_size, headlight_size,
-                               -headlight_size, headlight_size)
-            headlight = parent.attachNewNode(card_maker.generate())
-            headlight.setPos(x, self.length/2 + 0.02, self.wheel_radius + self.body_height * 0.5)
-            headlight.setColor(headlight_color)
+            builder.add_quad(-headlight_size, headlight_size, -headlight_size, headlight_size,
+                             (x, self.length/2 + 0.02, self.wheel_radius + self.body_height * 0.5),
+                             headlight_color)
 
         # Taillights (rear, red)
         taillight_color = (0.85, 0.08, 0.08, 1.0)  # Bright red
 
         for x in [-self.width/2 + 0.4, self.width/2 - 0.4]:
-            card_maker.setFrame(-headlight_size, headlight_size,
-                               -headlight_size * 0.8, headlight_size * 0.8)
-            taillight = parent.attachNewNode(card_maker.generate())
-            taillight.setPos(x, -self.length/2 - 0.02, self.wheel_radius + self.body_height * 0.4)
-            taillight.setH(180)
-            taillight.setColor(taillight_color)
+            builder.add_quad(-headlight_size, headlight_size, -headlight_size * 0.8,
+                             headlight_size * 0.8,
+                             (x, -self.length/2 - 0.02, self.wheel_radius + self.body_height * 0.4),
+                             taillight_color, h=180)
 
         # Brake lights (center rear)
-        card_maker.setFrame(-self.width * 0.15, self.width * 0.15,
-                           -headlight_size/2, headlight_size/2)
-        brake_light = parent.attachNewNode(card_maker.generate())
-        brake_light.setPos(0, -self.length/2 - 0.02, self.wheel_radius + self.body_height * 0.7)
-        brake_light.setH(180)
-        brake_light.setColor(taillight_color)
-
-    def _create_details(self, parent: NodePath):
+        builder.add_quad(-self.width * 0.15, self.width * 0.15, -headlight_size/2,
+                         headlight_size/2,
+                         (0, -self.length/2 - 0.02, self.wheel_radius + self.body_height * 0.7),
+                         taillight_color, h=180)
+
+    def _create_details(self, builder: VehicleMeshBuilder):
         """Create additional details (mirrors, grill, etc.)"""
         # Side mirrors
-        self._create_side_mirrors(parent)
+        self._create_side_mirrors(builder)
 
         # Front grill
-        self._create_front_grill(parent)
+        self._create_front_grill(builder)
 
         # License plates
-        self._create_license_plates(parent)
+        self._create_license_plates(builder)
 
         # Windshield wipers
         if self.vehicle_type not in [VehicleType.BUS, VehicleType.DELIVERY_TRUCK]:
-            self._create_wipers(parent)
+            self._create_wipers(builder)
 
         # Exhaust pipe
-        self._create_exhaust(parent)
+        self._create_exhaust(builder)
 
-    def _create_side_mirrors(self, parent: NodePath):
+    def _create_side_mirrors(self, builder: VehicleMeshBuilder):
         """Create side mirrors"""
-        card_maker = CardMaker("mirror")
         mirror_size = 0.18
         mirror_z = self.wheel_radius + self.body_height + self.cabin_height * 0.5
 
-        # Mirror housing (body color)
-        card_maker.setFrame(-mirror_size, mirror_size, -mirror_size/2, mirror_size/2)
-
-        # Left mirror
-        left_mirror = parent.attachNewNode(card_maker.generate())
-        left_mirror.setPos(-self.width/2 - 0.25, self.cabin_length/2, mirror_z)
-        left_mirror.setH(90)
-        left_mirror.setColor(self.body_color)
+        for side, heading in ((-1.0, 90), (1.0, -90)):
+            # Mirror housing (body color)
+            builder.add_quad(-mirror_size, mirror_size, -mirror_size/2, mirror_size/2,
+                             (side * (self.width/2 + 0.25), self.cabin_length/2, mirror_z),
+                             self.body_color, h=heading)
 
-        # Right mirror
-        right_mirror = parent.attachNewNode(card_maker.generate())
-        right_mirror.setPos(self.width/2 + 0.25, self.cabin_length/2, mirror_z)
-        right_mirror.setH(-90)
-        right_mirror.setColor(self.body_color)
+            # Mirror glass (reflective, slightly smaller)
+            builder.add_quad(-mirror_size * 0.8, mirror_size * 0.8, -mirror_size/2 * 0.8,
+                             mirror_size/2 * 0.8,
+                             (side * (self.width/2 + 0.26), self.cabin_length/2, mirror_z),
+                             self.chrome_color, h=heading)
 
-        # Mirror glass (reflective, slightly smaller)
-        card_maker.setFrame(-mirror_size * 0.8, mirror_size * 0.8,
-                           -mirror_size/2 * 0.8, mirror_size/2 * 0.8)
-
-        left_glass = parent.attachNewNode(card_maker.generate())
-        left_glass.setPos(-self.width/2 - 0.26, self.cabin_length/2, mirror_z)
-        left_glass.setH(90)
-        left_glass.setColor(self.chrome_color)
-
-        right_glass = parent.attachNewNode(card_maker.generate())
-        right_glass.setPos(self.width/2 + 0.26, self.cabin_length/2, mirror_z)
-        right_glass.setH(-90)
-        right_glass.setColor(self.chrome_color)
-
-    def _create_front_grill(self, parent: NodePath):
+    def _create_front_grill(self, builder: VehicleMeshBuilder):
         """Create front grill"""
-        card_maker = CardMaker("grill")
         grill_width = self.width * 0.6
         grill_height = self.body_height * 0.3
         grill_color = (0.10, 0.10, 0.12, 1.0)  # Dark grill
+        grill_z = self.wheel_radius + self.body_height * 0.25
 
-        card_maker.setFrame(-grill_width/2, grill_width/2, 0, grill_height)
-        grill = parent.attachNewNode(card_maker.generate())
-        grill.setPos(0, self.length/2 + 0.01, self.wheel_radius + self.body_height * 0.25)
-        grill.setColor(grill_color)
+        builder.add_quad(-grill_width/2, grill_width/2, 0, grill_height,
+                         (0, self.length/2 + 0.01, grill_z), grill_color)
 
-        # Grill bars (chrome)
+        # Grill bars (chrome), evenly spaced across the grill
         num_bars = 5
-        for i in range(num_bars):
-            bar_y = grill_height * (i + 1) / (num_bars + 1)
-            card_maker.setFrame(-grill_width/2, grill_width/2, -0.03, 0.03)
-            bar = parent.attachNewNode(card_maker.generate())
-            bar.setPos(0, self.length/2 + 0.02, self.wheel_radius + self.body_height * 0.25 + bar_y)
-            bar.setColor(self.chrome_color)
-
-    def _create_license_plates(self, parent: NodePath):
+        bar_z = grill_z + grill_height * np.arange(1, num_bars + 1) / (num_bars + 1)
+        positions = np.zeros((num_bars, 3))
+        positions[:, 1] = self.length/2 + 0.02
+        positions[:, 2] = bar_z
+        builder.add_quads((-grill_width/2, grill_width/2, -0.03, 0.03), positions, self.chrome_color)
+
+    def _create_license_plates(self, builder: VehicleMeshBuilder):
         """Create license plates"""
-        card_maker = CardMaker("license_plate")
         plate_width = 0.5
         plate_height = 0.15
         plate_color = (0.95, 0.95, 0.88, 1.0)  # Off-white
 
         # Front plate
-        card_maker.setFrame(-plate_width/2, plate_width/2, -plate_height/2, plate_height/2)
-        front_plate = parent.attachNewNode(card_maker.generate())
-        front_plate.setPos(0, self.length/2 + 0.03, self.wheel_radius + 0.3)
-        front_plate.setColor(plate_color)
+        builder.add_quad(-plate_width/2, plate_width/2, -plate_height/2, plate_height/2,
+                         (0, self.length/2 + 0.03, self.wheel_radius + 0.3), plate_color)
 
         # Rear plate
-        rear_plate = parent.attachNewNode(card_maker.generate())
-        rear_plate.setPos(0, -self.length/2 - 0.03, self.wheel_radius + 0.3)
-        rear_plate.setH(180)
-        rear_plate.setColor(plate_color)
+        builder.add_quad(-plate_width/2, plate_width/2, -plate_height/2, plate_height/2,
+                         (0, -self.length/2 - 0.03, self.wheel_radius + 0.3), plate_color, h=180)
 
-    def _create_wipers(self, parent: NodePath):
+    def _create_wipers(self, builder: VehicleMeshBuilder):
         """Create windshield wipers"""
-        card_maker = CardMaker("wiper")
         wiper_length = self.width * 0.35
         wiper_thickness = 0.03
         wiper_color = (0.08, 0.08, 0.08, 1.0)
@@ -577,97 +605,124 @@ class DetailedVehicle:
         windshield_base_z = self.wheel_radius + self.body_height + 0.1
 
         # Driver side wiper
-        card_maker.setFrame(0, wiper_length, -wiper_thickness/2, wiper_thickness/2)
-        wiper = parent.attachNewNode(card_maker.generate())
-        wiper.setPos(-self.width/4, self.length/2 - self.hood_length - 0.2, windshield_base_z)
-        wiper.setP(-90)
-        wiper.setColor(wiper_color)
+        builder.add_quad(0, wiper_length, -wiper_thickness/2, wiper_thickness/2,
+                         (-self.width/4, self.length/2 - self.hood_length - 0.2, windshield_base_z),
+                         wiper_color, p=-90)
 
-    def _create_exhaust(self, parent: NodePath):
+    def _create_exhaust(self, builder: VehicleMeshBuilder):
         """Create exhaust pipe"""
-        card_maker = CardMaker("exhaust")
         exhaust_radius = 0.08
         exhaust_color = (0.25, 0.25, 0.28, 1.0)  # Dark metal
 
         # Single or dual exhaust based on vehicle type
         if self.vehicle_type in [VehicleType.SPORTS_CAR, VehicleType.TRUCK]:
-            # Dual exhaust
-            for x in [-self.width/3, self.width/3]:
-                card_maker.setFrame(-exhaust_radius, exhaust_radius,
-                                   -exhaust_radius, exhaust_radius)
-                exhaust = parent.attachNewNode(card_maker.generate())
-                exhaust.setPos(x, -self.length/2 - 0.05, self.wheel_radius + 0.2)
-                exhaust.setH(180)
-                exhaust.setColor(exhaust_color)
+            exhaust_xs = [-self.width/3, self.width/3]  # Dual exhaust
         else:
-            # Single exhaust (right side)
-            card_maker.setFrame(-exhaust_radius, exhaust_radius,
-                               -exhaust_radius, exhaust_radius)
-            exhaust = parent.attachNewNode(card_maker.generate())
-            exhaust.setPos(self.width/3, -self.length/2 - 0.05, self.wheel_radius + 0.2)
-            exhaust.setH(180)
-            exhaust.setColor(exhaust_color)
-
-    def _add_special_markings(self, parent: NodePath):
-        """Add special vehicle markings"""
-        card_maker = CardMaker("marking")
-
-        if self.vehicle_type == VehicleType.POLICE:
-            # Police stripes and lightbar
-            stripe_color = (0.10, 0.35, 0.95, 1.0)  # Blue
-
-            # Side stripes
-            card_maker.setFrame(-self.length/2 + 1, self.length/2 - 1, 0, 0.25)
-            for x in [-self.width/2 - 0.01, self.width/2 + 0.01]:
-                stripe = parent.attachNewNode(card_maker.generate())
-                stripe.setPos(x, 0, self.wheel_radius + self.body_height * 0.55)
-                stripe.setH(90 if x < 0 else -90)
-                stripe.setColor(stripe_color)
-
-            # Roof lightbar
-            lightbar_color = (0.85, 0.10, 0.10, 1.0)  # Red
-            card_maker.setFrame(-self.width * 0.4, self.width * 0.4, -0.15, 0.15)
-            lightbar = parent.attachNewNode(card_maker.generate())
-            lightbar.setZ(self.wheel_radius + self.body_height + self.cabin_height + 0.15)
-            lightbar.setP(-90)
-            lightbar.setColor(lightbar_color)
+            exhaust_xs = [self.width/3]  # Single exhaust (right side)
+
+        for x in exhaust_xs:
+            builder.add_quad(-exhaust_radius, exhaust_radius, -exhaust_radius, exhaust_radius,
+                             (x, -self.length/2 - 0.05, self.wheel_radius + 0.2), exhaust_color,
+                             h=180)
+
+    def _roof_z(self) -> float:
+        """Height of the roof-mounted markings"""
+        return self.wheel_radius + self.body_height + self.cabin_height + 0.15
+
+    def _add_police_markings(self, builder: VehicleMeshBuilder):
+        """Add police stripes and lightbar"""
+        stripe_color = (0.10, 0.35, 0.95, 1.0)  # Blue
+
+        # Side stripes
+        for x in [-self.width/2 - 0.01, self.width/2 + 0.01]:
+            builder.add_quad(-self.length/2 + 1, self.length/2 - 1, 0, 0.25,
+                             (x, 0, self.wheel_radius + self.body_height * 0.55), stripe_color,
+                             h=90 if x < 0 else -90)
+
+        # Roof lightbar
+        lightbar_color = (0.85, 0.10, 0.10, 1.0)  # Red
+        builder.add_quad(-self.width * 0.4, self.width * 0.4, -0.15, 0.15, (0, 0, self._roof_z()),
+                         lightbar_color, p=-90)
+
+    def _add_ambulance_markings(self, builder: VehicleMeshBuilder):
+        """Add red crosses and lightbar"""
+        cross_color = (0.95, 0.08, 0.08, 1.0)
+        cross_size = 0.6
+
+        # Side crosses
+        for x in [-self.width/2 - 0.03, self.width/2 + 0.03]:
+            builder.add_quad(-cross_size/2, cross_size/2, -cross_size/2, cross_size/2,
+                             (x, 0, self.wheel_radius + self.body_height + self.cabin_height * 0.5),
+                             cross_color, h=90 if x < 0 else -90)
+
+        # Roof lightbar
+        lightbar_color = (0.10, 0.35, 0.95, 1.0)  # Blue
+        builder.add_quad(-self.width * 0.4, self.width * 0.4, -0.15, 0.15, (0, 0, self._roof_z()),
+                         lightbar_color, p=-90)
+
+    def _add_taxi_markings(self, builder: VehicleMeshBuilder):
+        """Add roof taxi sign"""
+        sign_color = (1.0, 0.92, 0.10, 1.0)  # Yellow
+        builder.add_quad(-0.6, 0.6, -0.25, 0.25, (0, 0, self._roof_z()), sign_color, p=-90)
+
+    # Marking builder per vehicle type (types without an entry get none)
+    _MARKING_FN: Dict[VehicleType, Callable] = {
+        VehicleType.POLICE: _add_police_markings,
+        VehicleType.AMBULANCE: _add_ambulance_markings,
+        VehicleType.TAXI: _add_taxi_markings,
+    }
+
+
+class VehiclePool:
+    """
+    Recycles vehicle nodes so traffic can despawn and respawn without rebuilding.
 
-        elif self.vehicle_type == VehicleType.AMBULANCE:
-            # Red cross on sides and rear
-            cross_color = (0.95, 0.08, 0.08, 1.0)
-            cross_size = 0.6
-
-            # Side crosses
-            card_maker.setFrame(-cross_size/2, cross_size/2, -cross_size/2, cross_size/2)
-            for x in [-self.width/2 - 0.03, self.width/2 + 0.03]:
-                cross = parent.attachNewNode(card_maker.generate())
-                cross.setPos(x, 0, self.wheel_radius + self.body_height + self.cabin_height * 0.5)
-                cross.setH(90 if x < 0 else -90)
-                cross.setColor(cross_color)
-
-            # Roof lightbar
-            lightbar_color = (0.10, 0.35, 0.95, 1.0)  # Blue
-            card_maker.setFrame(-self.width * 0.4, self.width * 0.4, -0.15, 0.15)
-            lightbar = parent.attachNewNode(card_maker.generate())
-            lightbar.setZ(self.wheel_radius + self.body_height + self.cabin_height + 0.15)
-            lightbar.setP(-90)
-            lightbar.setColor(lightbar_color)
-
-        elif self.vehicle_type == VehicleType.TAXI:
-            # Roof taxi sign
-            sign_color = (1.0, 0.92, 0.10, 1.0)  # Yellow
-            card_maker.setFrame(-0.6, 0.6, -0.25, 0.25)
-            sign = parent.attachNewNode(card_maker.generate())
-            sign.setZ(self.wheel_radius + self.body_height + self.cabin_height + 0.15)
-            sign.setP(-90)
-            sign.setColor(sign_color)
+    release() detaches a node but keeps it alive; get() hands back a pooled node
+    with the same type and body color as the requested seed would build,
+    re-placed and re-tagged, before building a new one.
+    """
+
+    def __init__(self):
+        """Initialize empty pool"""
+        # Free nodes per (vehicle type, body color), i.e. per shared prototype
+        self.pool: Dict[Tuple[VehicleType, Tuple], List[NodePath]] = {}
+        self.active: Set[NodePath] = set()
+
+    def get(self, vehicle_type: VehicleType, parent_node: NodePath,
+            position: Tuple[float, float, float], heading: float = 0,
+            seed: int = None) -> NodePath:
+        """Take a pooled vehicle matching this type and seed (or build one) and place it"""
+        vehicle = DetailedVehicle(vehicle_type, seed)
+        key = (vehicle_type, vehicle.body_color)
+        free = self.pool.get(key)
+        if free:
+            vehicle_node = free.pop()
+            vehicle_node.reparentTo(parent_node)
+            vehicle_node.setPythonTag("seed", vehicle.seed)
+            vehicle_node.setPos(*position)
+            vehicle_node.setH(heading)
+        else:
+            vehicle_node = vehicle.create_3d_model(parent_node, position, heading)
+            vehicle_node.setPythonTag("pool_key", key)
+
+        self.active.add(vehicle_node)
+        return vehicle_node
+
+    def release(self, vehicle_node: NodePath):
+        """Return an active vehicle to the pool"""
+        if vehicle_node not in self.active:
+            return
+        self.active.remove(vehicle_node)
+        vehicle_node.detachNode()
+        self.pool.setdefault(vehicle_node.getPythonTag("pool_key"), []).append(vehicle_node)
 
 
 class DetailedVehicleSpawner:
     """Spawner for detailed vehicles"""
 
-    def __init__(self):
+    def __init__(self, seed: int = None):
         """Initialize spawner"""
+        self._rng = np.random.default_rng(seed)
         self.spawn_weights = {
             VehicleType.SEDAN: 0.28,
             VehicleType.SUV: 0.18,
@@ -683,39 +738,84 @@ class DetailedVehicleSpawner:
             VehicleType.VINTAGE: 0.01,
         }
 
+        # Type table and cumulative weights for sampling without per-call validation
+        self._types = np.array(list(self.spawn_weights.keys()), dtype=object)
+        self._cum = np.cumsum(list(self.spawn_weights.values()))
+        self._cum /= self._cum[-1]
+
+        # Despawned vehicles are recycled through the pool
+        self.pool = VehiclePool()
+
+        # Build one prototype per type up front so the first spawns of each type
+        # only instance; other body colors of palette-colored types build on demand
+        for vehicle_type in VehicleType:
+            DetailedVehicle(vehicle_type, seed=vehicle_type.value + 1)._get_prototype()
+
     def spawn_random_vehicle(self, parent_node: NodePath,
                            position: Tuple[float, float, float],
                            heading: float = 0) -> NodePath:
         """Spawn random detailed vehicle"""
-        vehicle_type = np.random.choice(
-            list(self.spawn_weights.keys()),
-            p=list(self.spawn_weights.values())
-        )
-
-        vehicle = DetailedVehicle(vehicle_type)
-        return vehicle.create_3d_model(parent_node, position, heading)
+        # Same draw as choice(types, p=weights), without per-call validation
+        idx = int(self._cum.searchsorted(self._rng.random(), side='right'))
+        vehicle_type = self._types[min(idx, len(self._types) - 1)]
+
+        return self.pool.get(vehicle_type, parent_node, position, heading, self._new_seed())
+
+    def _new_seed(self) -> int:
+        """Draw a vehicle seed from the spawner's generator"""
+        return int(self._rng.integers(1, 1000000))
+
+    def sample_types(self, n: int) -> np.ndarray:
+        """Sample n vehicle types in one vectorized lookup"""
+        idx = self._cum.searchsorted(self._rng.random(n), side='right')
+        return self._types[np.minimum(idx, len(self._types) - 1)]
+
+    def spawn_batch(self, parent_node: NodePath, positions: np.ndarray,
+                    headings: np.ndarray) -> List[NodePath]:
+        """
+        Spawn one random vehicle per row of positions (n, 3) with headings (n,).
+
+        Types and seeds for the whole batch are drawn up front, so the loop
+        only fetches (or builds) each vehicle and places it.
+        """
+        n = len(positions)
+        vehicle_types = self.sample_types(n)
+        seeds = self._rng.integers(1, 1000000, n).tolist()
+        positions = np.asarray(positions, dtype=np.float64).tolist()
+        headings = np.broadcast_to(np.asarray(headings, dtype=np.float64), (n,)).tolist()
+
+        get = self.pool.get
+        return [get(vehicle_type, parent_node, position, heading, seed)
+                for vehicle_type, seed, position, heading
+                in zip(vehicle_types, seeds, positions, headings)]
 
     def spawn_specific_vehicle(self, vehicle_type: VehicleType, parent_node: NodePath,
                               position: Tuple[float, float, float],
                               heading: float = 0) -> NodePath:
         """Spawn specific vehicle type"""
-        vehicle = DetailedVehicle(vehicle_type)
-        return vehicle.create_3d_model(parent_node, position, heading)
+        return self.pool.get(vehicle_type, parent_node, position, heading, self._new_seed())
+
+    def despawn_vehicle(self, vehicle_node: NodePath):
+        """Remove a spawned vehicle from the scene and keep it for reuse"""
+        self.pool.release(vehicle_node)
 
 
 if __name__ == "__main__":
-    """Test detailed vehicle system"""
+    """Test detailed vehicle system (pass --verbose for per-type details)"""
+    import sys
+
     print("Detailed Vehicle System Test")
     print("=" * 70)
 
-    for vtype in VehicleType:
-        vehicle = DetailedVehicle(vtype, seed=42)
-        print(f"\n{vtype.name}:")
-        print(f"  Dimensions: {vehicle.length:.2f}m x {vehicle.width:.2f}m x {vehicle.height:.2f}m")
-        print(f"  Body proportions: Hood={vehicle.hood_length:.2f}m, "
-              f"Cabin={vehicle.cabin_length:.2f}m, Trunk={vehicle.trunk_length:.2f}m")
-        print(f"  Color: RGB{tuple(round(c, 2) for c in vehicle.body_color[:3])}")
+    if "--verbose" in sys.argv:
+        for vtype in VehicleType:
+            vehicle = DetailedVehicle(vtype, seed=42)
+            print(f"\n{vtype.name}:")
+            print(f"  Dimensions: {vehicle.length:.2f}m x {vehicle.width:.2f}m x {vehicle.height:.2f}m")
+            print(f"  Body proportions: Hood={vehicle.hood_length:.2f}m, "
+                  f"Cabin={vehicle.cabin_length:.2f}m, Trunk={vehicle.trunk_length:.2f}m")
+            print(f"  Color: RGB{tuple(round(c, 2) for c in vehicle.body_color[:3])}")
 
-    print("\n" + "=" * 70)
+        print("\n" + "=" * 70)
     print(f"Total vehicle types: {len(VehicleType)}")
     print("Photorealistic vehicles with detailed geometry!")
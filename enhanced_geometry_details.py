@@ -7,7 +7,222 @@ Licensed under the Apache License, Version 2.0
 """
 from panda3d.core import *
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Optional
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback when Numba is missing: run the kernel as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Shared generator for cosmetic randomness (trash overflow)
+_rng = np.random.default_rng()
+
+
+def set_seed(seed: Optional[int] = None):
+    """Reseed the shared cosmetic RNG so generated details are reproducible"""
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+
+# Shared card colors, built once instead of per setColor call
+_COL_METAL_DARK = LColor(0.20, 0.20, 0.22, 1.0)
+_COL_METAL = LColor(0.25, 0.25, 0.28, 1.0)
+_COL_POLE = LColor(0.50, 0.50, 0.52, 1.0)
+_COL_RUBBER = LColor(0.10, 0.10, 0.12, 1.0)
+_COL_BRASS = LColor(0.75, 0.65, 0.20, 1.0)
+_COL_AMBER_LED = LColor(1.0, 0.6, 0.1, 1.0)
+# Overflow trash (white paper, brown bags, etc.)
+_TRASH_COLORS = (LColor(0.95, 0.95, 0.98, 1.0), LColor(0.65, 0.55, 0.45, 1.0), LColor(0.85, 0.85, 0.88, 1.0))
+
+# One CardMaker reused for every card: setFrame() then generate() gives a fresh node
+_CARD = CardMaker("detail")
+
+
+def _transform(pos: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+               h: float = 0.0, p: float = 0.0) -> np.ndarray:
+    """4x4 matrix for a node placed with setPos(pos), setH(h) and setP(p)"""
+    hr = np.radians(h)
+    pr = np.radians(p)
+    ch, sh = np.cos(hr), np.sin(hr)
+    cp, sp = np.cos(pr), np.sin(pr)
+    mat = np.identity(4)
+    # Pitch is applied first, then heading
+    mat[:3, :3] = np.array([[ch, -sh, 0.0], [sh, ch, 0.0], [0.0, 0.0, 1.0]]) @ \
+        np.array([[1.0, 0.0, 0.0], [0.0, cp, -sp], [0.0, sp, cp]])
+    mat[:3, 3] = pos
+    return mat
+
+
+def _translations(offsets: np.ndarray) -> np.ndarray:
+    """(n, 4, 4) stack of translation matrices, one per row of offsets"""
+    mats = np.tile(np.identity(4), (len(offsets), 1, 1))
+    mats[:, :3, 3] = offsets
+    return mats
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _bake_cards(frames, mats):
+    """
+    Place card corners.
+
+    frames is (n, 4) (left, right, bottom, top) in each card's local XZ plane
+    and mats is (n, 4, 4). Output rows are (x, y, z), four per card in
+    lower-left, lower-right, upper-right, upper-left order. Cards are
+    independent, so they are split across threads.
+    """
+    n = frames.shape[0]
+    out = np.empty((n * 4, 3), dtype=np.float32)
+    for i in prange(n):
+        for k in range(4):
+            x = frames[i, 0] if k == 0 or k == 3 else frames[i, 1]
+            z = frames[i, 2] if k < 2 else frames[i, 3]
+            row = i * 4 + k
+            for c in range(3):
+                out[row, c] = mats[i, c, 0] * x + mats[i, c, 2] * z + mats[i, c, 3]
+    return out
+
+
+# Matches GeomVertexFormat.getV3c4(): float32 position and 8-bit RGBA. Detail
+# cards are flat-colored and only ambient-lit, so they carry no normals
+_VERTEX_DTYPE = np.dtype([("vertex", np.float32, 3), ("color", np.uint8, 4)])
+_QUAD_INDICES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+
+
+class DetailBatchBuilder:
+    """
+    Collects detail cards into a single Geom.
+
+    Pass one builder to several BuildingDetailEnhancer calls for the same
+    building, then call finalize() once: every card ends up in one GeomNode
+    (one draw call) instead of a NodePath per card. Card positions are
+    relative to the node passed to finalize().
+    """
+
+    def __init__(self):
+        self.frames: List[np.ndarray] = []
+        self.mats: List[np.ndarray] = []
+        self.colors: List[np.ndarray] = []
+
+    def add_quad(self, left: float, right: float, bottom: float, top: float,
+                 mat: np.ndarray, color: Tuple[float, float, float, float]):
+        """Add a card spanning (left, right, bottom, top) in its local XZ plane, facing -Y"""
+        self.add_quads(left, right, bottom, top, mat[None], color)
+
+    def add_quads(self, left: float, right: float, bottom: float, top: float,
+                  mats: np.ndarray, color: Tuple[float, float, float, float]):
+        """Add one same-size, same-color card per (4, 4) matrix in mats"""
+        n = len(mats)
+        self.frames.append(np.broadcast_to(np.array((left, right, bottom, top)), (n, 4)))
+        self.mats.append(mats)
+        self.colors.append(np.broadcast_to(np.array(color), (n, 4)))
+
+    def finalize(self, parent: NodePath, name: str = "details") -> NodePath:
+        """
+        Bake every collected card and attach them to parent as one GeomNode.
+
+        Attaches nothing and returns an empty NodePath if no cards were added.
+        """
+        num_cards = sum(len(frames) for frames in self.frames)
+        if num_cards == 0:
+            return NodePath()
+
+        baked = _bake_cards(np.concatenate(self.frames), np.concatenate(self.mats))
+
+        vertices = np.empty(len(baked), dtype=_VERTEX_DTYPE)
+        vertices["vertex"] = baked
+        vertices["color"] = np.repeat(np.rint(np.concatenate(self.colors) * 255).astype(np.uint8), 4, axis=0)
+
+        vdata = GeomVertexData("details", GeomVertexFormat.getV3c4(), Geom.UHStatic)
+        vdata.uncleanSetNumRows(len(vertices))
+        vdata.modifyArrayHandle(0).copyDataFrom(vertices)
+
+        indices = (np.arange(num_cards, dtype=np.uint32)[:, None] * 4 + _QUAD_INDICES).ravel()
+        triangles = GeomTriangles(Geom.UHStatic)
+        triangles.setIndexType(Geom.NTUint32)
+        index_array = triangles.modifyVertices()
+        index_array.uncleanSetNumRows(len(indices))
+        index_array.modifyHandle().copyDataFrom(indices)
+
+        geom = Geom(vdata)
+        geom.addPrimitive(triangles)
+        geom_node = GeomNode(name)
+        geom_node.addGeom(geom)
+        return parent.attachNewNode(geom_node)
+
+
+def _build_disk_geom(segments: int) -> NodePath:
+    """Unit disk in the XZ plane facing -Y (like a CardMaker card), as a triangle fan"""
+    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    points = np.zeros((segments + 1, 3), dtype=np.float32)
+    points[1:, 0] = np.cos(angles)
+    points[1:, 2] = np.sin(angles)
+
+    vdata = GeomVertexData("disk", GeomVertexFormat.getV3(), Geom.UHStatic)
+    vdata.uncleanSetNumRows(len(points))
+    vdata.modifyArrayHandle(0).copyDataFrom(points)
+
+    rim = np.arange(1, segments + 1, dtype=np.uint16)
+    indices = np.column_stack((np.zeros(segments, dtype=np.uint16), rim, np.roll(rim, -1))).ravel()
+    triangles = GeomTriangles(Geom.UHStatic)
+    triangles.setIndexType(Geom.NTUint16)
+    index_array = triangles.modifyVertices()
+    index_array.uncleanSetNumRows(len(indices))
+    index_array.modifyHandle().copyDataFrom(indices)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(triangles)
+    geom_node = GeomNode("disk")
+    geom_node.addGeom(geom)
+    return NodePath(geom_node)
+
+
+# Shared round shape for dishes and caps; scale an instance by the radius
+_DISK_GEOM = _build_disk_geom(16)
+
+
+def _wrap_lod(parent: NodePath, max_dist: float,
+              center: Tuple[float, float, float] = (0.0, 0.0, 0.0)) -> NodePath:
+    """
+    Group node for micro-details that should disappear beyond max_dist.
+
+    Returns the only child of a FadeLODNode under parent; anything attached to
+    it is skipped by cull (after a short fade) once the camera is farther than
+    max_dist from center.
+    """
+    lod = FadeLODNode("detail_lod")
+    lod.addSwitch(max_dist, 0)
+    lod.setCenter(Point3(*center))
+    return parent.attachNewNode(lod).attachNewNode("detail")
+
+
+_TREAD_GEOM_CACHE: Dict[float, NodePath] = {}
+
+
+def _tread_template(wheel_radius: float) -> NodePath:
+    """Twelve tread grooves (simplified as lines) around the wheel axis, built once per radius"""
+    template = _TREAD_GEOM_CACHE.get(wheel_radius)
+    if template is None:
+        angles = np.linspace(0, 2 * np.pi, 12, endpoint=False)
+        cs, sn = np.cos(angles), np.sin(angles)
+        mats = np.tile(np.identity(4), (len(angles), 1, 1))
+        mats[:, 0, 0] = cs
+        mats[:, 0, 1] = -sn
+        mats[:, 1, 0] = sn
+        mats[:, 1, 1] = cs
+
+        builder = DetailBatchBuilder()
+        builder.add_quads(-0.01, 0.01, 0, wheel_radius * 0.2, mats, (0.08, 0.08, 0.10, 1.0))
+        template = builder.finalize(NodePath("tread_template"), "tread")
+        _TREAD_GEOM_CACHE[wheel_radius] = template
+    return template
 
 
 class BuildingDetailEnhancer:
@@ -29,87 +244,66 @@ class BuildingDetailEnhancer:
 
     @staticmethod
     def add_window_shutters(parent: NodePath, window_pos: Tuple[float, float, float],
-                           window_size: Tuple[float, float], color: Tuple[float, float, float, float]):
+                           window_size: Tuple[float, float], color: Tuple[float, float, float, float],
+                           builder: DetailBatchBuilder = None):
         """Add detailed window shutters"""
-        card = CardMaker("shutter")
+        own_builder = builder is None
+        if own_builder:
+            builder = DetailBatchBuilder()
+
         x, y, z = window_pos
         w, h = window_size
 
         shutter_width = w * 0.55
         shutter_offset = w * 0.60
+        slat_color = (color[0] * 0.8, color[1] * 0.8, color[2] * 0.8, 1.0)
+        slat_offsets = np.zeros((5, 3))
+        slat_offsets[:, 2] = h * (np.arange(5) / 5.0 + 0.1)
+        slat_mats = _translations(slat_offsets)
+
+        # Left and right shutters are mirror images along x
+        for side in (-1, 1):
+            shutter = _transform((x + side * shutter_offset, y - 0.02, z), p=-90)
+            builder.add_quad(-shutter_width/2, shutter_width/2, 0, h, shutter, color)
+
+            # Slats (horizontal lines)
+            builder.add_quads(-shutter_width/2, shutter_width/2, 0, 0.02,
+                              shutter @ slat_mats, slat_color)
 
-        # Left shutter
-        card.setFrame(-shutter_width/2, shutter_width/2, 0, h)
-        left_shutter = parent.attachNewNode(card.generate())
-        left_shutter.setPos(x - shutter_offset, y - 0.02, z)
-        left_shutter.setP(-90)
-        left_shutter.setColor(*color)
-
-        # Add slats (horizontal lines)
-        for i in range(5):
-            slat_y = h * (i / 5.0 + 0.1)
-            slat = CardMaker(f"slat_{i}")
-            slat.setFrame(-shutter_width/2, shutter_width/2, 0, 0.02)
-            slat_node = left_shutter.attachNewNode(slat.generate())
-            slat_node.setPos(0, 0, slat_y)
-            slat_node.setColor(color[0] * 0.8, color[1] * 0.8, color[2] * 0.8, 1.0)
-
-        # Right shutter (mirror)
-        card.setFrame(-shutter_width/2, shutter_width/2, 0, h)
-        right_shutter = parent.attachNewNode(card.generate())
-        right_shutter.setPos(x + shutter_offset, y - 0.02, z)
-        right_shutter.setP(-90)
-        right_shutter.setColor(*color)
-
-        # Add slats to right shutter
-        for i in range(5):
-            slat_y = h * (i / 5.0 + 0.1)
-            slat = CardMaker(f"slat_{i}")
-            slat.setFrame(-shutter_width/2, shutter_width/2, 0, 0.02)
-            slat_node = right_shutter.attachNewNode(slat.generate())
-            slat_node.setPos(0, 0, slat_y)
-            slat_node.setColor(color[0] * 0.8, color[1] * 0.8, color[2] * 0.8, 1.0)
+        if own_builder:
+            builder.finalize(_wrap_lod(parent, 40.0, window_pos), "shutters")
 
     @staticmethod
     def add_detailed_ac_unit(parent: NodePath, position: Tuple[float, float, float],
-                            heading: float = 0):
+                            heading: float = 0, builder: DetailBatchBuilder = None):
         """Add detailed rooftop AC unit"""
+        own_builder = builder is None
+        if own_builder:
+            builder = DetailBatchBuilder()
+
         x, y, z = position
 
         # Main AC body
-        card = CardMaker("ac_body")
-        card.setFrame(-1.2, 1.2, 0, 0.8)
-        ac_body = parent.attachNewNode(card.generate())
-        ac_body.setPos(x, y, z)
-        ac_body.setP(-90)
-        ac_body.setH(heading)
-        ac_body.setColor(0.75, 0.75, 0.78, 1.0)
+        ac_body = _transform((x, y, z), heading, -90)
+        builder.add_quad(-1.2, 1.2, 0, 0.8, ac_body, (0.75, 0.75, 0.78, 1.0))
 
         # Vents (front grille)
-        for i in range(8):
-            vent = CardMaker(f"vent_{i}")
-            vent_y = 0.1 * i + 0.05
-            vent.setFrame(-1.0, 1.0, 0, 0.02)
-            vent_node = ac_body.attachNewNode(vent.generate())
-            vent_node.setPos(0, 0, vent_y)
-            vent_node.setColor(0.25, 0.25, 0.28, 1.0)
+        vent_offsets = np.zeros((8, 3))
+        vent_offsets[:, 2] = 0.1 * np.arange(8) + 0.05
+        builder.add_quads(-1.0, 1.0, 0, 0.02, ac_body @ _translations(vent_offsets),
+                          (0.25, 0.25, 0.28, 1.0))
 
         # Fan housing (cylindrical section)
-        fan_housing = CardMaker("fan_housing")
-        fan_housing.setFrame(-0.4, 0.4, 0, 0.4)
-        fan_node = ac_body.attachNewNode(fan_housing.generate())
-        fan_node.setPos(0, -0.15, 0.4)
-        fan_node.setP(-90)
-        fan_node.setColor(0.20, 0.20, 0.22, 1.0)
+        builder.add_quad(-0.4, 0.4, 0, 0.4, ac_body @ _transform((0, -0.15, 0.4), p=-90),
+                         (0.20, 0.20, 0.22, 1.0))
 
         # Support legs
-        for offset in [(-0.9, -0.9), (0.9, -0.9), (-0.9, 0.9), (0.9, 0.9)]:
-            leg = CardMaker("leg")
-            leg.setFrame(-0.05, 0.05, -0.3, 0)
-            leg_node = parent.attachNewNode(leg.generate())
-            leg_node.setPos(x + offset[0], y + offset[1], z)
-            leg_node.setP(-90)
-            leg_node.setColor(0.45, 0.45, 0.48, 1.0)
+        leg_offsets = np.array([(-0.9, -0.9, 0), (0.9, -0.9, 0), (-0.9, 0.9, 0), (0.9, 0.9, 0)]) + (x, y, z)
+        builder.add_quads(-0.05, 0.05, -0.3, 0, _translations(leg_offsets) @ _transform(p=-90),
+                          (0.45, 0.45, 0.48, 1.0))
+
+        if own_builder:
+            builder.finalize(parent, "ac_unit")
 
     @staticmethod
     def add_satellite_dish(parent: NodePath, position: Tuple[float, float, float],
@@ -118,114 +312,111 @@ class BuildingDetailEnhancer:
         x, y, z = position
 
         # Dish mounting pole
-        pole = CardMaker("dish_pole")
-        pole.setFrame(-0.05, 0.05, 0, 1.5)
-        pole_node = parent.attachNewNode(pole.generate())
+        _CARD.setFrame(-0.05, 0.05, 0, 1.5)
+        pole_node = parent.attachNewNode(_CARD.generate())
+        pole_node.node().setFinal(True)
         pole_node.setPos(x, y, z)
-        pole_node.setColor(0.50, 0.50, 0.52, 1.0)
+        pole_node.setColor(_COL_POLE)
 
-        # Dish (circular approximation with card)
-        dish = CardMaker("dish")
+        # Dish (instanced disk, scaled on its own node so the LNB placement is unaffected)
         dish_radius = 0.6
-        dish.setFrame(-dish_radius, dish_radius, -dish_radius, dish_radius)
-        dish_node = pole_node.attachNewNode(dish.generate())
-        dish_node.setPos(0, 0, 1.2)
-        dish_node.setP(45)  # Angled up
-        dish_node.setH(heading)
+        dish_node = pole_node.attachNewNode("dish")
+        dish_node.setTransform(TransformState.makePosHpr((0, 0, 1.2), (heading, 45, 0)))  # Angled up
         dish_node.setColor(0.88, 0.88, 0.90, 1.0)
+        disk = dish_node.attachNewNode("dish_disk")
+        disk.setScale(dish_radius)
+        _DISK_GEOM.instanceTo(disk)
 
         # LNB (feed horn)
-        lnb = CardMaker("lnb")
-        lnb.setFrame(-0.08, 0.08, 0, 0.3)
-        lnb_node = dish_node.attachNewNode(lnb.generate())
-        lnb_node.setPos(0, 0.4, 0)
-        lnb_node.setP(-45)
-        lnb_node.setColor(0.25, 0.25, 0.28, 1.0)
+        _CARD.setFrame(-0.08, 0.08, 0, 0.3)
+        lnb_node = dish_node.attachNewNode(_CARD.generate())
+        lnb_node.setTransform(TransformState.makePosHpr((0, 0.4, 0), (0, -45, 0)))
+        lnb_node.setColor(_COL_METAL)
 
     @staticmethod
-    def add_antenna_array(parent: NodePath, position: Tuple[float, float, float]):
+    def add_antenna_array(parent: NodePath, position: Tuple[float, float, float],
+                          builder: DetailBatchBuilder = None):
         """Add communication antenna array"""
+        own_builder = builder is None
+        if own_builder:
+            builder = DetailBatchBuilder()
+
         x, y, z = position
 
         # Main tower
-        tower = CardMaker("antenna_tower")
-        tower.setFrame(-0.15, 0.15, 0, 4.0)
-        tower_node = parent.attachNewNode(tower.generate())
-        tower_node.setPos(x, y, z)
-        tower_node.setColor(0.75, 0.25, 0.20, 1.0)  # Red/white tower
+        tower = _transform((x, y, z))
+        builder.add_quad(-0.15, 0.15, 0, 4.0, tower, (0.75, 0.25, 0.20, 1.0))  # Red/white tower
 
-        # Crossbars
+        # Crossbars, each carrying four antennas
+        antenna_offsets = _translations([(-0.6, 0, 0), (-0.2, 0, 0), (0.2, 0, 0), (0.6, 0, 0)])
         for height in [1.0, 2.0, 3.0]:
-            crossbar = CardMaker(f"crossbar_{height}")
-            crossbar.setFrame(-0.8, 0.8, -0.05, 0.05)
-            cross_node = tower_node.attachNewNode(crossbar.generate())
-            cross_node.setPos(0, 0, height)
-            cross_node.setP(-90)
-            cross_node.setColor(0.85, 0.85, 0.88, 1.0)
+            crossbar = tower @ _transform((0, 0, height), p=-90)
+            builder.add_quad(-0.8, 0.8, -0.05, 0.05, crossbar, (0.85, 0.85, 0.88, 1.0))
 
             # Antennas on crossbar
-            for antenna_pos in [-0.6, -0.2, 0.2, 0.6]:
-                antenna = CardMaker("antenna")
-                antenna.setFrame(-0.02, 0.02, 0, 0.4)
-                ant_node = cross_node.attachNewNode(antenna.generate())
-                ant_node.setPos(antenna_pos, 0, 0)
-                ant_node.setColor(0.60, 0.60, 0.62, 1.0)
+            builder.add_quads(-0.02, 0.02, 0, 0.4, crossbar @ antenna_offsets,
+                              (0.60, 0.60, 0.62, 1.0))
 
         # Blinking light on top
-        light_top = CardMaker("warning_light")
-        light_top.setFrame(-0.1, 0.1, -0.1, 0.1)
-        light_node = tower_node.attachNewNode(light_top.generate())
-        light_node.setPos(0, 0, 4.2)
-        light_node.setP(-90)
-        light_node.setColor(1.0, 0.1, 0.1, 1.0)
+        builder.add_quad(-0.1, 0.1, -0.1, 0.1, tower @ _transform((0, 0, 4.2), p=-90),
+                         (1.0, 0.1, 0.1, 1.0))
+
+        if own_builder:
+            builder.finalize(parent, "antenna_array")
 
     @staticmethod
     def add_drain_pipes(parent: NodePath, building_height: float,
-                       pipe_positions: List[Tuple[float, float]]):
+                       pipe_positions: List[Tuple[float, float]],
+                       builder: DetailBatchBuilder = None):
         """Add building drain pipes"""
+        own_builder = builder is None
+        if own_builder:
+            builder = DetailBatchBuilder()
+
+        # Bracket placements (every 3m from 2m up) are the same on every pipe;
+        # there are only a handful, so plain Python beats an np.arange here
+        num_brackets = int((building_height - 2.0) / 3.0) + 1
+        bracket_offsets = [(0.0, -0.05, 2.0 + 3.0 * i) for i in range(num_brackets)
+                           if 2.0 + 3.0 * i < building_height]
+        bracket_mats = _translations(np.array(bracket_offsets).reshape(-1, 3)) @ _transform(p=-90)
+
         for x, y in pipe_positions:
             # Main vertical pipe
-            pipe = CardMaker("drain_pipe")
-            pipe.setFrame(-0.08, 0.08, 0, building_height)
-            pipe_node = parent.attachNewNode(pipe.generate())
-            pipe_node.setPos(x, y, 0)
-            pipe_node.setColor(0.45, 0.45, 0.48, 1.0)
+            pipe = _transform((x, y, 0))
+            builder.add_quad(-0.08, 0.08, 0, building_height, pipe, (0.45, 0.45, 0.48, 1.0))
 
             # Pipe brackets every few meters
-            for bracket_z in np.arange(2.0, building_height, 3.0):
-                bracket = CardMaker("bracket")
-                bracket.setFrame(-0.12, 0.12, -0.05, 0.05)
-                bracket_node = pipe_node.attachNewNode(bracket.generate())
-                bracket_node.setPos(0, -0.05, bracket_z)
-                bracket_node.setP(-90)
-                bracket_node.setColor(0.35, 0.35, 0.38, 1.0)
+            builder.add_quads(-0.12, 0.12, -0.05, 0.05, pipe @ bracket_mats, (0.35, 0.35, 0.38, 1.0))
+
+        if own_builder:
+            builder.finalize(parent, "drain_pipes")
 
     @staticmethod
     def add_window_planter(parent: NodePath, window_pos: Tuple[float, float, float],
-                          window_width: float):
+                          window_width: float, builder: DetailBatchBuilder = None):
         """Add window planter box with flowers"""
+        own_builder = builder is None
+        if own_builder:
+            builder = DetailBatchBuilder()
+
         x, y, z = window_pos
 
         # Planter box
-        planter = CardMaker("planter")
         planter_width = window_width * 0.9
-        planter.setFrame(-planter_width/2, planter_width/2, 0, 0.25)
-        planter_node = parent.attachNewNode(planter.generate())
-        planter_node.setPos(x, y - 0.05, z - 0.15)
-        planter_node.setP(-90)
-        planter_node.setColor(0.45, 0.30, 0.25, 1.0)  # Brown/terracotta
+        planter = _transform((x, y - 0.05, z - 0.15), p=-90)
+        builder.add_quad(-planter_width/2, planter_width/2, 0, 0.25, planter,
+                         (0.45, 0.30, 0.25, 1.0))  # Brown/terracotta
 
         # Add simple flowers (colored squares)
+        colors = [(1.0, 0.2, 0.2, 1.0), (1.0, 0.8, 0.2, 1.0),
+                  (0.8, 0.2, 1.0, 1.0), (1.0, 0.4, 0.6, 1.0)]
         for i in range(4):
             flower_x = (i - 1.5) * (planter_width / 5)
-            flower = CardMaker(f"flower_{i}")
-            flower.setFrame(-0.05, 0.05, 0, 0.15)
-            flower_node = planter_node.attachNewNode(flower.generate())
-            flower_node.setPos(flower_x, 0, 0.10)
-            # Random flower colors
-            colors = [(1.0, 0.2, 0.2, 1.0), (1.0, 0.8, 0.2, 1.0),
-                     (0.8, 0.2, 1.0, 1.0), (1.0, 0.4, 0.6, 1.0)]
-            flower_node.setColor(*colors[i % len(colors)])
+            builder.add_quad(-0.05, 0.05, 0, 0.15, planter @ _transform((flower_x, 0, 0.10)),
+                             colors[i % len(colors)])
+
+        if own_builder:
+            builder.finalize(parent, "planter")
 
 
 class VehicleDetailEnhancer:
@@ -252,24 +443,21 @@ class VehicleDetailEnhancer:
         x, y, z = position
 
         # Handle base
-        handle_base = CardMaker("handle_base")
-        handle_base.setFrame(-0.08, 0.08, 0, 0.03)
-        handle_node = parent.attachNewNode(handle_base.generate())
-        handle_node.setPos(x, y, z)
-        handle_node.setP(-90)
-        handle_node.setColor(0.20, 0.20, 0.22, 1.0)
+        _CARD.setFrame(-0.08, 0.08, 0, 0.03)
+        handle_node = parent.attachNewNode(_CARD.generate())
+        handle_node.node().setFinal(True)
+        handle_node.setTransform(TransformState.makePosHpr((x, y, z), (0, -90, 0)))
+        handle_node.setColor(_COL_METAL_DARK)
 
         # Handle grip
-        grip = CardMaker("handle_grip")
-        grip.setFrame(-0.05, 0.05, 0, 0.15)
-        grip_node = handle_node.attachNewNode(grip.generate())
+        _CARD.setFrame(-0.05, 0.05, 0, 0.15)
+        grip_node = handle_node.attachNewNode(_CARD.generate())
         grip_node.setPos(0, 0.05, 0)
-        grip_node.setColor(0.25, 0.25, 0.28, 1.0)
+        grip_node.setColor(_COL_METAL)
 
         # Keyhole
-        keyhole = CardMaker("keyhole")
-        keyhole.setFrame(-0.01, 0.01, -0.01, 0.01)
-        keyhole_node = handle_node.attachNewNode(keyhole.generate())
+        _CARD.setFrame(-0.01, 0.01, -0.01, 0.01)
+        keyhole_node = handle_node.attachNewNode(_CARD.generate())
         keyhole_node.setPos(0, 0, -0.05)
         keyhole_node.setColor(0.05, 0.05, 0.08, 1.0)
 
@@ -280,34 +468,29 @@ class VehicleDetailEnhancer:
         x, y, z = position
 
         # Mirror mount arm
-        arm = CardMaker("mirror_arm")
-        arm.setFrame(-0.03, 0.03, 0, 0.15)
-        arm_node = parent.attachNewNode(arm.generate())
-        arm_node.setPos(x, y, z)
-        arm_node.setH(45 if side == "left" else -45)
-        arm_node.setP(-90)
-        arm_node.setColor(0.20, 0.20, 0.22, 1.0)
+        _CARD.setFrame(-0.03, 0.03, 0, 0.15)
+        arm_node = parent.attachNewNode(_CARD.generate())
+        arm_node.node().setFinal(True)
+        arm_node.setTransform(TransformState.makePosHpr((x, y, z), (45 if side == "left" else -45, -90, 0)))
+        arm_node.setColor(_COL_METAL_DARK)
 
         # Mirror housing
-        housing = CardMaker("mirror_housing")
-        housing.setFrame(-0.15, 0.15, -0.10, 0.10)
-        housing_node = arm_node.attachNewNode(housing.generate())
+        _CARD.setFrame(-0.15, 0.15, -0.10, 0.10)
+        housing_node = arm_node.attachNewNode(_CARD.generate())
         housing_node.setPos(0, 0.15, 0)
-        housing_node.setColor(0.25, 0.25, 0.28, 1.0)
+        housing_node.setColor(_COL_METAL)
 
         # Mirror glass (reflective)
-        glass = CardMaker("mirror_glass")
-        glass.setFrame(-0.12, 0.12, -0.08, 0.08)
-        glass_node = housing_node.attachNewNode(glass.generate())
+        _CARD.setFrame(-0.12, 0.12, -0.08, 0.08)
+        glass_node = housing_node.attachNewNode(_CARD.generate())
         glass_node.setPos(0, 0.02, 0)
         glass_node.setColor(0.70, 0.75, 0.80, 1.0)  # Slightly blue reflective
 
         # Turn signal indicator (LED)
-        led = CardMaker("turn_signal")
-        led.setFrame(-0.03, 0.03, -0.02, 0.02)
-        led_node = housing_node.attachNewNode(led.generate())
+        _CARD.setFrame(-0.03, 0.03, -0.02, 0.02)
+        led_node = housing_node.attachNewNode(_CARD.generate())
         led_node.setPos(0, -0.08, 0)
-        led_node.setColor(1.0, 0.6, 0.1, 1.0)  # Amber
+        led_node.setColor(_COL_AMBER_LED)
 
     @staticmethod
     def add_windshield_wiper(parent: NodePath, position: Tuple[float, float, float],
@@ -316,19 +499,17 @@ class VehicleDetailEnhancer:
         x, y, z = position
 
         # Wiper arm (metal)
-        arm = CardMaker("wiper_arm")
-        arm.setFrame(-0.02, 0.02, 0, length)
-        arm_node = parent.attachNewNode(arm.generate())
-        arm_node.setPos(x, y, z)
-        arm_node.setH(15)  # Slight angle
-        arm_node.setColor(0.20, 0.20, 0.22, 1.0)
+        _CARD.setFrame(-0.02, 0.02, 0, length)
+        arm_node = _wrap_lod(parent, 30.0, position).attachNewNode(_CARD.generate())
+        arm_node.node().setFinal(True)
+        arm_node.setTransform(TransformState.makePosHpr((x, y, z), (15, 0, 0)))  # Slight angle
+        arm_node.setColor(_COL_METAL_DARK)
 
         # Rubber blade
-        blade = CardMaker("wiper_blade")
-        blade.setFrame(-0.01, 0.01, 0, length * 0.9)
-        blade_node = arm_node.attachNewNode(blade.generate())
+        _CARD.setFrame(-0.01, 0.01, 0, length * 0.9)
+        blade_node = arm_node.attachNewNode(_CARD.generate())
         blade_node.setPos(0, 0, length * 0.05)
-        blade_node.setColor(0.10, 0.10, 0.12, 1.0)
+        blade_node.setColor(_COL_RUBBER)
 
     @staticmethod
     def add_license_plate(parent: NodePath, position: Tuple[float, float, float],
@@ -337,45 +518,34 @@ class VehicleDetailEnhancer:
         x, y, z = position
 
         # Plate background
-        plate = CardMaker("license_plate")
-        plate.setFrame(-0.25, 0.25, -0.10, 0.10)
-        plate_node = parent.attachNewNode(plate.generate())
-        plate_node.setPos(x, y, z)
-        plate_node.setP(-90)
+        _CARD.setFrame(-0.25, 0.25, -0.10, 0.10)
+        plate_node = parent.attachNewNode(_CARD.generate())
+        plate_node.node().setFinal(True)
+        plate_node.setTransform(TransformState.makePosHpr((x, y, z), (0, -90, 0)))
         plate_node.setColor(1.0, 1.0, 1.0, 1.0)  # White plate
 
         # Plate border
-        border = CardMaker("plate_border")
-        border.setFrame(-0.26, 0.26, -0.11, 0.11)
-        border_node = parent.attachNewNode(border.generate())
-        border_node.setPos(x, y - 0.01, z)
-        border_node.setP(-90)
+        _CARD.setFrame(-0.26, 0.26, -0.11, 0.11)
+        border_node = parent.attachNewNode(_CARD.generate())
+        border_node.setTransform(TransformState.makePosHpr((x, y - 0.01, z), (0, -90, 0)))
         border_node.setColor(0.15, 0.15, 0.18, 1.0)  # Black border
 
         # Note: Actual text would require TextNode
         # For now, adding colored strips to represent text area
-        text_area = CardMaker("text_area")
-        text_area.setFrame(-0.20, 0.20, -0.06, 0.06)
-        text_node = plate_node.attachNewNode(text_area.generate())
+        _CARD.setFrame(-0.20, 0.20, -0.06, 0.06)
+        text_node = plate_node.attachNewNode(_CARD.generate())
         text_node.setPos(0, 0.01, 0)
-        text_node.setColor(0.10, 0.10, 0.12, 1.0)
+        text_node.setColor(_COL_RUBBER)
 
     @staticmethod
     def add_tire_tread(parent: NodePath, wheel_pos: Tuple[float, float, float],
                       wheel_radius: float):
         """Add tire tread detail"""
-        # Tread pattern is added to tire surface
-        x, y, z = wheel_pos
-
-        # Create tread grooves (simplified as lines)
-        for i in range(12):
-            angle = (i / 12.0) * 360
-            tread = CardMaker(f"tread_{i}")
-            tread.setFrame(-0.01, 0.01, 0, wheel_radius * 0.2)
-            tread_node = parent.attachNewNode(tread.generate())
-            tread_node.setPos(x, y, z)
-            tread_node.setH(angle)
-            tread_node.setColor(0.08, 0.08, 0.10, 1.0)
+        # Tread pattern is added to tire surface; every wheel of this radius
+        # instances the same prebuilt grooves
+        tread = _wrap_lod(parent, 20.0, wheel_pos)
+        tread.setPos(*wheel_pos)
+        _tread_template(wheel_radius).instanceTo(tread)
 
     @staticmethod
     def add_exhaust_tip(parent: NodePath, position: Tuple[float, float, float],
@@ -384,29 +554,122 @@ class VehicleDetailEnhancer:
         x, y, z = position
 
         # Outer pipe
-        outer_pipe = CardMaker("exhaust_outer")
-        outer_pipe.setFrame(-diameter, diameter, -diameter, diameter)
-        outer_node = parent.attachNewNode(outer_pipe.generate())
-        outer_node.setPos(x, y, z)
-        outer_node.setP(-90)
+        _CARD.setFrame(-diameter, diameter, -diameter, diameter)
+        outer_node = parent.attachNewNode(_CARD.generate())
+        outer_node.node().setFinal(True)
+        outer_node.setTransform(TransformState.makePosHpr((x, y, z), (0, -90, 0)))
         outer_node.setColor(0.35, 0.35, 0.38, 1.0)  # Chrome-ish
 
         # Inner pipe (darker)
-        inner_pipe = CardMaker("exhaust_inner")
         inner_diameter = diameter * 0.7
-        inner_pipe.setFrame(-inner_diameter, inner_diameter, -inner_diameter, inner_diameter)
-        inner_node = outer_node.attachNewNode(inner_pipe.generate())
+        _CARD.setFrame(-inner_diameter, inner_diameter, -inner_diameter, inner_diameter)
+        inner_node = outer_node.attachNewNode(_CARD.generate())
         inner_node.setPos(0, 0.02, 0)
-        inner_node.setColor(0.10, 0.10, 0.12, 1.0)  # Dark/sooty interior
+        inner_node.setColor(_COL_RUBBER)  # Dark/sooty interior
 
         # Soot/carbon buildup around tip
-        soot = CardMaker("exhaust_soot")
-        soot.setFrame(-diameter*1.2, diameter*1.2, -diameter*1.2, diameter*1.2)
-        soot_node = outer_node.attachNewNode(soot.generate())
+        _CARD.setFrame(-diameter*1.2, diameter*1.2, -diameter*1.2, diameter*1.2)
+        soot_node = outer_node.attachNewNode(_CARD.generate())
         soot_node.setPos(0, 0.01, 0)
         soot_node.setColor(0.08, 0.08, 0.10, 0.5)  # Semi-transparent dark
 
 
+# Flattened prop models, built on first use and instanced for every placement
+_PROP_CACHE: Dict[str, NodePath] = {}
+
+
+def _prop_template(name: str, build) -> NodePath:
+    """Cached prop model, built by build() the first time name is requested"""
+    template = _PROP_CACHE.get(name)
+    if template is None:
+        template = _PROP_CACHE[name] = build()
+    return template
+
+
+def _build_street_sign_template() -> NodePath:
+    """Street sign with post at the origin, flattened into one node"""
+    sign_root = NodePath("street_sign")
+    sign_root.node().setFinal(True)
+
+    # Sign post
+    _CARD.setFrame(-0.05, 0.05, 0, 3.0)
+    post_node = sign_root.attachNewNode(_CARD.generate())
+    post_node.setColor(_COL_POLE)
+
+    # Sign board (green background typical for street signs)
+    _CARD.setFrame(-0.6, 0.6, -0.15, 0.15)
+    board_node = post_node.attachNewNode(_CARD.generate())
+    board_node.setTransform(TransformState.makePosHpr((0, 0, 2.5), (0, -90, 0)))
+    board_node.setColor(0.15, 0.55, 0.25, 1.0)  # Green
+
+    # Reflective border
+    _CARD.setFrame(-0.62, 0.62, -0.17, 0.17)
+    border_node = post_node.attachNewNode(_CARD.generate())
+    border_node.setTransform(TransformState.makePosHpr((0, -0.01, 2.5), (0, -90, 0)))
+    border_node.setColor(0.95, 0.95, 0.98, 1.0)  # Reflective white
+
+    # Mounting brackets
+    for bracket_z in [2.35, 2.65]:
+        _CARD.setFrame(-0.08, 0.08, -0.03, 0.03)
+        bracket_node = post_node.attachNewNode(_CARD.generate())
+        bracket_node.setTransform(TransformState.makePosHpr((0, 0, bracket_z), (0, -90, 0)))
+        bracket_node.setColor(_COL_METAL)
+
+    sign_root.flattenStrong()
+    return sign_root
+
+
+def _build_hydrant_template() -> NodePath:
+    """Fire hydrant with chains at the origin, flattened apart from its chain LOD group"""
+    # The chains hang off a distance-culled group of their own
+    hydrant_root = NodePath("hydrant")
+    hydrant_root.node().setFinal(True)
+    chains = _wrap_lod(hydrant_root, 20.0)
+
+    # Main body
+    _CARD.setFrame(-0.15, 0.15, 0, 0.6)
+    body_node = hydrant_root.attachNewNode(_CARD.generate())
+    body_node.setP(-90)
+    body_node.setColor(0.85, 0.20, 0.15, 1.0)  # Fire engine red
+
+    # Top cap (round)
+    cap_node = body_node.attachNewNode("cap")
+    cap_node.setPos(0, 0, 0.65)
+    cap_node.setScale(0.12)
+    cap_node.setColor(0.75, 0.18, 0.13, 1.0)
+    _DISK_GEOM.instanceTo(cap_node)
+
+    # Side nozzles (2)
+    for side in [-1, 1]:
+        _CARD.setFrame(-0.06, 0.06, 0, 0.15)
+        nozzle_node = body_node.attachNewNode(_CARD.generate())
+        nozzle_node.setTransform(TransformState.makePosHpr((side * 0.15, 0, 0.35), (side * 90, -90, 0)))
+        nozzle_node.setColor(_COL_METAL_DARK)  # Metal nozzle
+
+        # Nozzle cap with chain
+        _CARD.setFrame(-0.07, 0.07, -0.07, 0.07)
+        cap_nozzle_node = nozzle_node.attachNewNode(_CARD.generate())
+        cap_nozzle_node.setPos(0, 0, 0.16)
+        cap_nozzle_node.setColor(_COL_BRASS)
+
+        # Chain link (simplified)
+        _CARD.setFrame(-0.02, 0.02, 0, 0.12)
+        chain_node = cap_nozzle_node.attachNewNode(_CARD.generate())
+        chain_node.setTransform(TransformState.makePosHpr((0, 0.08, -0.08), (0, -45, 0)))
+        chain_node.setColor(0.60, 0.60, 0.62, 1.0)
+        chain_node.wrtReparentTo(chains)
+
+    # Base pentagonal nuts (realistic hydrant feature)
+    for nut_z in [0.15, 0.45]:
+        _CARD.setFrame(-0.18, 0.18, -0.05, 0.05)
+        nut_node = body_node.attachNewNode(_CARD.generate())
+        nut_node.setTransform(TransformState.makePosHpr((0, 0, nut_z), (0, -90, 0)))
+        nut_node.setColor(_COL_METAL_DARK)
+
+    hydrant_root.flattenStrong()
+    return hydrant_root
+
+
 class EnvironmentalDetailEnhancer:
     """
     Adds ultra-detailed features to environmental props.
@@ -424,39 +687,9 @@ class EnvironmentalDetailEnhancer:
     def add_detailed_street_sign(parent: NodePath, position: Tuple[float, float, float],
                                 sign_text: str = "MAIN ST"):
         """Add detailed street sign with post"""
-        x, y, z = position
-
-        # Sign post
-        post = CardMaker("sign_post")
-        post.setFrame(-0.05, 0.05, 0, 3.0)
-        post_node = parent.attachNewNode(post.generate())
-        post_node.setPos(x, y, z)
-        post_node.setColor(0.50, 0.50, 0.52, 1.0)
-
-        # Sign board (green background typical for street signs)
-        sign_board = CardMaker("sign_board")
-        sign_board.setFrame(-0.6, 0.6, -0.15, 0.15)
-        board_node = post_node.attachNewNode(sign_board.generate())
-        board_node.setPos(0, 0, 2.5)
-        board_node.setP(-90)
-        board_node.setColor(0.15, 0.55, 0.25, 1.0)  # Green
-
-        # Reflective border
-        border = CardMaker("sign_border")
-        border.setFrame(-0.62, 0.62, -0.17, 0.17)
-        border_node = post_node.attachNewNode(border.generate())
-        border_node.setPos(0, -0.01, 2.5)
-        border_node.setP(-90)
-        border_node.setColor(0.95, 0.95, 0.98, 1.0)  # Reflective white
-
-        # Mounting brackets
-        for bracket_z in [2.35, 2.65]:
-            bracket = CardMaker("bracket")
-            bracket.setFrame(-0.08, 0.08, -0.03, 0.03)
-            bracket_node = post_node.attachNewNode(bracket.generate())
-            bracket_node.setPos(0, 0, bracket_z)
-            bracket_node.setP(-90)
-            bracket_node.setColor(0.25, 0.25, 0.28, 1.0)
+        sign = parent.attachNewNode("street_sign")
+        sign.setPos(*position)
+        _prop_template("street_sign", _build_street_sign_template).instanceTo(sign)
 
     @staticmethod
     def add_overflowing_trash_can(parent: NodePath, position: Tuple[float, float, float]):
@@ -464,85 +697,34 @@ class EnvironmentalDetailEnhancer:
         x, y, z = position
 
         # Main can body (cylindrical)
-        can = CardMaker("trash_can")
-        can.setFrame(-0.3, 0.3, 0, 0.8)
-        can_node = parent.attachNewNode(can.generate())
-        can_node.setPos(x, y, z)
-        can_node.setP(-90)
+        _CARD.setFrame(-0.3, 0.3, 0, 0.8)
+        can_node = parent.attachNewNode(_CARD.generate())
+        can_node.node().setFinal(True)
+        can_node.setTransform(TransformState.makePosHpr((x, y, z), (0, -90, 0)))
         can_node.setColor(0.25, 0.50, 0.25, 1.0)  # Dark green
 
         # Lid (slightly open)
-        lid = CardMaker("trash_lid")
-        lid.setFrame(-0.32, 0.32, -0.32, 0.32)
-        lid_node = can_node.attachNewNode(lid.generate())
-        lid_node.setPos(0, 0, 0.82)
-        lid_node.setH(15)  # Tilted open
+        _CARD.setFrame(-0.32, 0.32, -0.32, 0.32)
+        lid_node = can_node.attachNewNode(_CARD.generate())
+        lid_node.setTransform(TransformState.makePosHpr((0, 0, 0.82), (15, 0, 0)))  # Tilted open
         lid_node.setColor(0.20, 0.45, 0.20, 1.0)
 
-        # Overflow trash (crumpled paper)
+        # Overflow trash (crumpled paper), all random draws made up front
+        sizes = _rng.uniform(0.08, 0.15, 3).tolist()
+        offsets = _rng.uniform(-0.2, 0.2, (3, 2)).tolist()
+        headings = _rng.uniform(0, 360, 3).tolist()
         for i in range(3):
-            trash = CardMaker(f"trash_{i}")
-            size = np.random.uniform(0.08, 0.15)
-            trash.setFrame(-size, size, -size, size)
-            trash_node = can_node.attachNewNode(trash.generate())
-            offset_x = np.random.uniform(-0.2, 0.2)
-            offset_y = np.random.uniform(-0.2, 0.2)
-            trash_node.setPos(offset_x, offset_y, 0.75 + i * 0.1)
-            # Random trash colors (white paper, brown bags, etc.)
-            colors = [(0.95, 0.95, 0.98, 1.0), (0.65, 0.55, 0.45, 1.0), (0.85, 0.85, 0.88, 1.0)]
-            trash_node.setColor(*colors[i % 3])
-            trash_node.setH(np.random.uniform(0, 360))
+            size = sizes[i]
+            _CARD.setFrame(-size, size, -size, size)
+            trash_node = can_node.attachNewNode(_CARD.generate())
+            offset_x, offset_y = offsets[i]
+            trash_node.setTransform(TransformState.makePosHpr((offset_x, offset_y, 0.75 + i * 0.1),
+                                                              (headings[i], 0, 0)))
+            trash_node.setColor(_TRASH_COLORS[i % 3])
 
     @staticmethod
     def add_detailed_fire_hydrant(parent: NodePath, position: Tuple[float, float, float]):
         """Add detailed fire hydrant with chain"""
-        x, y, z = position
-
-        # Main body
-        body = CardMaker("hydrant_body")
-        body.setFrame(-0.15, 0.15, 0, 0.6)
-        body_node = parent.attachNewNode(body.generate())
-        body_node.setPos(x, y, z)
-        body_node.setP(-90)
-        body_node.setColor(0.85, 0.20, 0.15, 1.0)  # Fire engine red
-
-        # Top cap
-        cap = CardMaker("hydrant_cap")
-        cap.setFrame(-0.12, 0.12, -0.12, 0.12)
-        cap_node = body_node.attachNewNode(cap.generate())
-        cap_node.setPos(0, 0, 0.65)
-        cap_node.setColor(0.75, 0.18, 0.13, 1.0)
-
-        # Side nozzles (2)
-        for side in [-1, 1]:
-            nozzle = CardMaker(f"nozzle_{side}")
-            nozzle.setFrame(-0.06, 0.06, 0, 0.15)
-            nozzle_node = body_node.attachNewNode(nozzle.generate())
-            nozzle_node.setPos(side * 0.15, 0, 0.35)
-            nozzle_node.setH(side * 90)
-            nozzle_node.setP(-90)
-            nozzle_node.setColor(0.20, 0.20, 0.22, 1.0)  # Metal nozzle
-
-            # Nozzle cap with chain
-            cap_nozzle = CardMaker(f"nozzle_cap_{side}")
-            cap_nozzle.setFrame(-0.07, 0.07, -0.07, 0.07)
-            cap_nozzle_node = nozzle_node.attachNewNode(cap_nozzle.generate())
-            cap_nozzle_node.setPos(0, 0, 0.16)
-            cap_nozzle_node.setColor(0.75, 0.65, 0.20, 1.0)  # Brass
-
-            # Chain link (simplified)
-            chain = CardMaker(f"chain_{side}")
-            chain.setFrame(-0.02, 0.02, 0, 0.12)
-            chain_node = cap_nozzle_node.attachNewNode(chain.generate())
-            chain_node.setPos(0, 0.08, -0.08)
-            chain_node.setP(-45)
-            chain_node.setColor(0.60, 0.60, 0.62, 1.0)
-
-        # Base pentagonal nuts (realistic hydrant feature)
-        for nut_z in [0.15, 0.45]:
-            nut = CardMaker(f"nut_{nut_z}")
-            nut.setFrame(-0.18, 0.18, -0.05, 0.05)
-            nut_node = body_node.attachNewNode(nut.generate())
-            nut_node.setPos(0, 0, nut_z)
-            nut_node.setP(-90)
-            nut_node.setColor(0.20, 0.20, 0.22, 1.0)
+        hydrant = parent.attachNewNode("hydrant")
+        hydrant.setPos(*position)
+        _prop_template("hydrant", _build_hydrant_template).instanceTo(hydrant)
@@ -6,10 +6,258 @@ Copyright 2025 Intellegix
 Licensed under the Apache License, Version 2.0
 """
 from panda3d.core import *
+import functools
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Dict, Callable, Optional
 from enum import Enum
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when Numba is missing: run the kernel as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Module RNG for default seeds; each prop draws from its own generator
+_rng = np.random.default_rng()
+
+
+def set_seed(seed: Optional[int] = None):
+    """Reseed the module RNG that picks seeds for props created without one"""
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+
+# One CardMaker reused by every builder; setFrame() then generate() gives a
+# fresh Geom each time. Prop building happens on the main thread only.
+_CARD = CardMaker("prop_card")
+
+# Every prop mesh is static vertex+color data in this one shared format
+_FMT = GeomVertexFormat.getV3c4()
+_VERTEX_DTYPE = np.dtype([("vertex", np.float32, 3), ("color", np.uint8, 4)])
+_QUAD_INDICES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+
+# Shared prop palette
+_COL_METAL_GRAY = (0.35, 0.35, 0.38, 1.0)  # Light poles, shelter posts, racks
+_COL_METAL_DARK = (0.25, 0.25, 0.28, 1.0)  # Signal poles, bench legs, mailbox post
+_COL_POST = (0.30, 0.30, 0.33, 1.0)        # Sign and meter posts
+_COL_WHITE = (0.95, 0.95, 0.95, 1.0)
+_TRAFFIC_LIGHT_COLORS = (
+    (0.85, 0.08, 0.08, 1.0),  # Red (top)
+    (0.95, 0.85, 0.12, 1.0),  # Yellow (middle)
+    (0.12, 0.85, 0.25, 1.0),  # Green (bottom)
+)
+_FOLIAGE_COLORS = (
+    (0.25, 0.65, 0.30, 1.0),  # Bright green
+    (0.30, 0.55, 0.28, 1.0),  # Medium green
+    (0.35, 0.70, 0.35, 1.0),  # Light green
+)
+_NEWSPAPER_BOX_COLORS = (
+    (0.75, 0.15, 0.15, 1.0),  # Red
+    (0.15, 0.35, 0.75, 1.0),  # Blue
+)
+
+
+@njit(cache=True)
+def _cyl_vertices(radius, height, sides):
+    """Bottom ring then top ring of a sides-gon prism, seam vertex repeated"""
+    n = sides + 1
+    out = np.empty((2 * n, 3), dtype=np.float32)
+    for i in range(n):
+        a = 2.0 * np.pi * i / sides
+        x = radius * np.cos(a)
+        y = radius * np.sin(a)
+        out[i, 0] = x
+        out[i, 1] = y
+        out[i, 2] = 0.0
+        out[n + i, 0] = x
+        out[n + i, 1] = y
+        out[n + i, 2] = height
+    return out
+
+
+@functools.lru_cache(maxsize=32)
+def _cylinder_vertices(radius: float, height: float, sides: int) -> np.ndarray:
+    """Cached, read-only _cyl_vertices result for one prism size"""
+    verts = _cyl_vertices(radius, height, sides)
+    verts.setflags(write=False)
+    return verts
+
+
+def _build_cylinder_geom(parent: NodePath, radius: float, height: float,
+                         sides: int, color: Tuple[float, float, float, float]) -> NodePath:
+    """Build an open-ended prism as one tristrip and attach it to parent
+
+    Vertices are the bottom ring followed by the top ring (sides+1 each, the
+    seam vertex repeated) so the strip can zigzag top/bottom around the ring.
+    """
+    verts = _cylinder_vertices(radius, height, sides)
+    ring = sides + 1
+
+    rows = np.empty(len(verts), dtype=_VERTEX_DTYPE)
+    rows["vertex"] = verts
+    rows["color"] = np.rint(np.asarray(color) * 255).astype(np.uint8)
+    vdata = GeomVertexData("cylinder", _FMT, Geom.UHStatic)
+    vdata.uncleanSetNumRows(len(rows))
+    vdata.modifyArrayHandle(0).copyDataFrom(rows)
+
+    strip = GeomTristrips(Geom.UHStatic)
+    for i in range(ring):
+        strip.addVertices(ring + i, i)
+    strip.closePrimitive()
+
+    geom = Geom(vdata)
+    geom.addPrimitive(strip)
+    geom_node = GeomNode("cylinder")
+    geom_node.addGeom(geom)
+    return parent.attachNewNode(geom_node)
+
+
+def _build_posts(parent: NodePath, positions: List[Tuple[float, float]], halfwidth: float,
+                 height: float, color: Tuple[float, float, float, float]) -> NodePath:
+    """Build identical upright quads (posts, legs) at each (x, y) as one GeomNode
+
+    Each quad spans -halfwidth..halfwidth on X and 0..height on Z and faces -Y,
+    matching the CardMaker cards they replace.
+    """
+    xy = np.asarray(positions, dtype=np.float32)
+    num_posts = len(xy)
+    corner_x = np.array([-halfwidth, halfwidth, halfwidth, -halfwidth], dtype=np.float32)
+    corner_z = np.array([0.0, 0.0, height, height], dtype=np.float32)
+
+    verts = np.empty((num_posts, 4, 3), dtype=np.float32)
+    verts[:, :, 0] = xy[:, 0:1] + corner_x
+    verts[:, :, 1] = xy[:, 1:2]
+    verts[:, :, 2] = corner_z
+
+    rows = np.empty(num_posts * 4, dtype=_VERTEX_DTYPE)
+    rows["vertex"] = verts.reshape(-1, 3)
+    rows["color"] = np.rint(np.asarray(color) * 255).astype(np.uint8)
+    vdata = GeomVertexData("posts", _FMT, Geom.UHStatic)
+    vdata.uncleanSetNumRows(len(rows))
+    vdata.modifyArrayHandle(0).copyDataFrom(rows)
+
+    indices = (np.arange(num_posts, dtype=np.uint32)[:, None] * 4 + _QUAD_INDICES).ravel()
+    triangles = GeomTriangles(Geom.UHStatic)
+    triangles.setIndexType(Geom.NTUint32)
+    index_array = triangles.modifyVertices()
+    index_array.uncleanSetNumRows(len(indices))
+    index_array.modifyHandle().copyDataFrom(indices)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(triangles)
+    geom_node = GeomNode("posts")
+    geom_node.addGeom(geom)
+    return parent.attachNewNode(geom_node)
+
+
+# Box corners are indexed x + 2*y + 4*z (0 = min side, 1 = max side); each
+# face lists its corners counter-clockwise as seen from outside
+_BOX_FACES = (
+    (0, 1, 5, 4),  # Front (-Y)
+    (3, 2, 6, 7),  # Back (+Y)
+    (2, 0, 4, 6),  # Left (-X)
+    (1, 3, 7, 5),  # Right (+X)
+    (4, 5, 7, 6),  # Top
+    (0, 2, 3, 1),  # Bottom
+)
+
+
+def _build_box(w: float, d: float, h: float,
+               color: Tuple[float, float, float, float]) -> NodePath:
+    """Build a closed box (24 vertices, 12 triangles) as one GeomNode
+
+    The box is centered on X/Y and spans 0..h on Z, so callers only need to
+    set its base position.
+    """
+    corners = [((w / 2) * (1 if c & 1 else -1),
+                (d / 2) * (1 if c & 2 else -1),
+                h if c & 4 else 0.0) for c in range(8)]
+
+    vdata = GeomVertexData("box", _FMT, Geom.UHStatic)
+    vdata.setNumRows(4 * len(_BOX_FACES))
+    vertex = GeomVertexWriter(vdata, "vertex")
+    col = GeomVertexWriter(vdata, "color")
+    tris = GeomTriangles(Geom.UHStatic)
+    for i, face in enumerate(_BOX_FACES):
+        for c in face:
+            vertex.addData3(*corners[c])
+            col.addData4(*color)
+        tris.addVertices(4 * i, 4 * i + 1, 4 * i + 2)
+        tris.addVertices(4 * i, 4 * i + 2, 4 * i + 3)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(tris)
+    geom_node = GeomNode("box")
+    geom_node.addGeom(geom)
+    return NodePath(geom_node)
+
+
+# Icosahedron faces, counter-clockwise as seen from outside
+_ICOSA_FACES = (
+    (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+    (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+    (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+    (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1),
+)
+
+
+def _build_icosahedron(radius: float, color: Tuple[float, float, float, float]) -> NodePath:
+    """Build a 20-triangle sphere stand-in as one vertex-colored GeomNode"""
+    t = (1.0 + np.sqrt(5.0)) / 2.0
+    verts = np.array([
+        (-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0),
+        (0, -1, t), (0, 1, t), (0, -1, -t), (0, 1, -t),
+        (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1),
+    ])
+    verts *= radius / np.linalg.norm(verts[0])
+
+    vdata = GeomVertexData("icosahedron", _FMT, Geom.UHStatic)
+    vdata.setNumRows(len(verts))
+    vertex = GeomVertexWriter(vdata, "vertex")
+    col = GeomVertexWriter(vdata, "color")
+    for x, y, z in verts.tolist():
+        vertex.addData3(x, y, z)
+        col.addData4(*color)
+
+    tris = GeomTriangles(Geom.UHStatic)
+    for face in _ICOSA_FACES:
+        tris.addVertices(*face)
+
+    geom = Geom(vdata)
+    geom.addPrimitive(tris)
+    geom_node = GeomNode("icosahedron")
+    geom_node.addGeom(geom)
+    return NodePath(geom_node)
+
+
+# Unit foliage balls, one per foliage green; trees scale a copy to their radius
+_FOLIAGE_GEOMS = tuple(_build_icosahedron(1.0, color) for color in _FOLIAGE_COLORS)
+
+
+def _bake_flat_colors(root: NodePath):
+    """Move any flat ColorAttrib left on a Geom into a vertex color column
+
+    flattenStrong keeps a single-colored Geom's color as render state rather
+    than per-vertex data; baking it lets differently colored props share one
+    state and batch together.
+    """
+    for geom_np in root.findAllMatches("**/+GeomNode"):
+        geom_node = geom_np.node()
+        for i in range(geom_node.getNumGeoms()):
+            state = geom_node.getGeomState(i)
+            attrib = state.getAttrib(ColorAttrib)
+            if attrib and attrib.getColorType() == ColorAttrib.TFlat:
+                geom = geom_node.modifyGeom(i)
+                geom.setVertexData(geom.getVertexData().setColor(
+                    attrib.getColor(), 4, Geom.NTUint8, Geom.CColor))
+                geom_node.setGeomState(i, state.setAttrib(ColorAttrib.makeVertex()))
+
 
 class PropType(Enum):
     """Types of environmental props"""
@@ -27,6 +275,25 @@ class PropType(Enum):
     NEWSPAPER_BOX = 11
 
 
+# Prop types whose builders randomize sizes/colors get a few prebuilt variants
+_PROP_VARIANTS = {
+    PropType.TREE: 8,
+    PropType.NEWSPAPER_BOX: 2,
+}
+
+# Random furniture dropped along roads by PropManager.place_street_props
+_STREET_PROP_TYPES = (
+    PropType.TRASH_CAN,
+    PropType.BENCH,
+    PropType.MAILBOX,
+    PropType.PARKING_METER,
+)
+
+# One shared model per (prop type, variant); placements instance these
+_PROTOTYPE_ROOT = NodePath("prototypes")
+_PROTOTYPES: Dict[Tuple[PropType, int], NodePath] = {}
+
+
 class EnvironmentalProp:
     """
     Environmental prop generator for city details.
@@ -46,64 +313,84 @@ class EnvironmentalProp:
     - Newspaper boxes
     """
 
+    __slots__ = ('prop_type', 'seed', 'rng')
+
+    # Placement node name per prop type
+    _NAME_CACHE = {prop_type: f"prop_{prop_type.name}" for prop_type in PropType}
+
     def __init__(self, prop_type: PropType, seed: int = None):
         """Initialize prop generator"""
         self.prop_type = prop_type
-        self.seed = seed or np.random.randint(0, 1000000)
-        np.random.seed(self.seed)
+        self.seed = seed or int(_rng.integers(0, 1000000))
+        self.rng = np.random.default_rng(self.seed)
 
     def create_3d_model(self, parent_node: NodePath, position: Tuple[float, float, float],
                        heading: float = 0) -> NodePath:
-        """Create prop 3D model"""
-        prop_node = parent_node.attachNewNode(f"prop_{self.prop_type.name}_{self.seed}")
+        """Create prop 3D model
+
+        The placement node only carries the transform; the geometry is an
+        instance of the cached prototype for this prop type.
+        """
+        prop_node = parent_node.attachNewNode(self._NAME_CACHE[self.prop_type])
         prop_node.setPos(*position)
         prop_node.setH(heading)
 
-        # Create appropriate prop
-        if self.prop_type == PropType.STREET_LIGHT:
-            self._create_street_light(prop_node)
-        elif self.prop_type == PropType.TRAFFIC_LIGHT:
-            self._create_traffic_light(prop_node)
-        elif self.prop_type == PropType.BENCH:
-            self._create_bench(prop_node)
-        elif self.prop_type == PropType.TRASH_CAN:
-            self._create_trash_can(prop_node)
-        elif self.prop_type == PropType.MAILBOX:
-            self._create_mailbox(prop_node)
-        elif self.prop_type == PropType.FIRE_HYDRANT:
-            self._create_fire_hydrant(prop_node)
-        elif self.prop_type == PropType.BUS_STOP:
-            self._create_bus_stop(prop_node)
-        elif self.prop_type == PropType.TREE:
-            self._create_tree(prop_node)
-        elif self.prop_type == PropType.STREET_SIGN:
-            self._create_street_sign(prop_node)
-        elif self.prop_type == PropType.PARKING_METER:
-            self._create_parking_meter(prop_node)
-        elif self.prop_type == PropType.BIKE_RACK:
-            self._create_bike_rack(prop_node)
-        elif self.prop_type == PropType.NEWSPAPER_BOX:
-            self._create_newspaper_box(prop_node)
+        variant = int(self.rng.integers(0, _PROP_VARIANTS.get(self.prop_type, 1)))
+        self._get_prototype(self.prop_type, variant).instanceTo(prop_node)
 
         return prop_node
 
+    @classmethod
+    def _get_prototype(cls, prop_type: PropType, variant: int = 0) -> NodePath:
+        """Return the shared model for a prop type, building it on first use"""
+        key = (prop_type, variant)
+        prototype = _PROTOTYPES.get(key)
+        if prototype is None:
+            # Seeding by variant keeps each variant's random sizes/colors fixed
+            prop = cls(prop_type, seed=variant + 1)
+            prototype = _PROTOTYPE_ROOT.attachNewNode(f"proto_{prop_type.name}_{variant}")
+            prop._build_model(prototype)
+            # Bake the per-card colors and transforms into as few Geoms as possible
+            prototype.flattenStrong()
+            _bake_flat_colors(prototype)
+            prototype.setColorOff(1)
+            _PROTOTYPES[key] = prototype
+        return prototype
+
+    @classmethod
+    def prepare_prototypes(cls, gsg: GraphicsStateGuardianBase):
+        """Build every prototype variant and upload it to the GPU up front
+
+        Call once after the window opens (e.g. with base.win.getGsg()) so the
+        first frames showing props don't stall on munging and VBO uploads.
+        """
+        for prop_type in PropType:
+            for variant in range(_PROP_VARIANTS.get(prop_type, 1)):
+                cls._get_prototype(prop_type, variant)
+        _PROTOTYPE_ROOT.premungeScene(gsg)
+        _PROTOTYPE_ROOT.prepareScene(gsg)
+
+    def _build_model(self, parent: NodePath):
+        """Build the geometry for this prop type under parent"""
+        builder = self._BUILDERS.get(self.prop_type)
+        if builder:
+            builder(self, parent)
+
     def _create_street_light(self, parent: NodePath):
         """Create street light pole with lamp"""
-        card_maker = CardMaker("street_light")
-
         # Pole (metal gray)
-        pole_color = (0.35, 0.35, 0.38, 1.0)
+        pole_color = _COL_METAL_GRAY
         pole_height = 6.0
         pole_width = 0.15
 
-        card_maker.setFrame(-pole_width/2, pole_width/2, 0, pole_height)
-        pole = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-pole_width/2, pole_width/2, 0, pole_height)
+        pole = parent.attachNewNode(_CARD.generate())
         pole.setColor(pole_color)
 
         # Horizontal arm extending out
         arm_length = 1.2
-        card_maker.setFrame(0, arm_length, -pole_width/2, pole_width/2)
-        arm = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(0, arm_length, -pole_width/2, pole_width/2)
+        arm = parent.attachNewNode(_CARD.generate())
         arm.setPos(0, 0, pole_height - 0.3)
         arm.setH(90)
         arm.setColor(pole_color)
@@ -112,38 +399,36 @@ class EnvironmentalProp:
         lamp_color = (0.95, 0.95, 0.88, 1.0)  # Warm white when lit
         lamp_size = 0.4
 
-        card_maker.setFrame(-lamp_size/2, lamp_size/2, -lamp_size/2, 0)
-        lamp = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-lamp_size/2, lamp_size/2, -lamp_size/2, 0)
+        lamp = parent.attachNewNode(_CARD.generate())
         lamp.setPos(arm_length - 0.2, 0, pole_height - 0.3)
         lamp.setColor(lamp_color)
 
         # Lamp housing (dark)
         housing_color = (0.15, 0.15, 0.18, 1.0)
-        card_maker.setFrame(-lamp_size/2 - 0.05, lamp_size/2 + 0.05,
-                           -lamp_size, -lamp_size/2)
-        housing = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-lamp_size/2 - 0.05, lamp_size/2 + 0.05,
+                       -lamp_size, -lamp_size/2)
+        housing = parent.attachNewNode(_CARD.generate())
         housing.setPos(arm_length - 0.2, 0, pole_height - 0.3)
         housing.setColor(housing_color)
 
         # Base
         base_size = 0.5
-        card_maker.setFrame(-base_size/2, base_size/2, -base_size/2, base_size/2)
-        base = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-base_size/2, base_size/2, -base_size/2, base_size/2)
+        base = parent.attachNewNode(_CARD.generate())
         base.setZ(0.1)
         base.setP(-90)
         base.setColor(pole_color)
 
     def _create_traffic_light(self, parent: NodePath):
         """Create traffic light with colored lights"""
-        card_maker = CardMaker("traffic_light")
-
         # Pole
-        pole_color = (0.25, 0.25, 0.28, 1.0)
+        pole_color = _COL_METAL_DARK
         pole_height = 5.0
         pole_width = 0.15
 
-        card_maker.setFrame(-pole_width/2, pole_width/2, 0, pole_height)
-        pole = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-pole_width/2, pole_width/2, 0, pole_height)
+        pole = parent.attachNewNode(_CARD.generate())
         pole.setColor(pole_color)
 
         # Light housing (hanging)
@@ -153,42 +438,36 @@ class EnvironmentalProp:
         housing_depth = 0.35
 
         # Front of housing
-        card_maker.setFrame(-housing_width/2, housing_width/2, 0, housing_height)
-        housing_front = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-housing_width/2, housing_width/2, 0, housing_height)
+        housing_front = parent.attachNewNode(_CARD.generate())
         housing_front.setPos(0, -housing_depth/2, pole_height - housing_height - 0.3)
         housing_front.setColor(housing_color)
 
         # Traffic lights (red, yellow, green)
         light_radius = 0.15
-        lights = [
-            (pole_height - 0.5, (0.85, 0.08, 0.08, 1.0)),    # Red (top)
-            (pole_height - 0.9, (0.95, 0.85, 0.12, 1.0)),    # Yellow (middle)
-            (pole_height - 1.3, (0.12, 0.85, 0.25, 1.0)),    # Green (bottom)
-        ]
+        lights = tuple(zip((pole_height - 0.5, pole_height - 0.9, pole_height - 1.3),
+                           _TRAFFIC_LIGHT_COLORS))
 
+        _CARD.setFrame(-light_radius, light_radius, -light_radius, light_radius)
         for light_z, light_color in lights:
-            card_maker.setFrame(-light_radius, light_radius, -light_radius, light_radius)
-            light = parent.attachNewNode(card_maker.generate())
+            light = parent.attachNewNode(_CARD.generate())
             light.setPos(0, -housing_depth/2 - 0.02, light_z)
             light.setColor(light_color)
 
         # Visor above each light (sun shade)
         visor_color = (0.10, 0.10, 0.12, 1.0)
+        _CARD.setFrame(-housing_width/2, housing_width/2, -0.08, 0)
         for light_z, _ in lights:
-            card_maker.setFrame(-housing_width/2, housing_width/2,
-                               -0.08, 0)
-            visor = parent.attachNewNode(card_maker.generate())
+            visor = parent.attachNewNode(_CARD.generate())
             visor.setPos(0, -housing_depth/2 - 0.1, light_z + light_radius + 0.02)
             visor.setP(-20)
             visor.setColor(visor_color)
 
     def _create_bench(self, parent: NodePath):
         """Create park bench"""
-        card_maker = CardMaker("bench")
-
         # Bench colors
         wood_color = (0.55, 0.42, 0.28, 1.0)  # Wood
-        metal_color = (0.25, 0.25, 0.28, 1.0)  # Dark metal
+        metal_color = _COL_METAL_DARK
 
         # Seat (wood slats)
         seat_width = 1.5
@@ -196,16 +475,16 @@ class EnvironmentalProp:
         seat_height = 0.45
 
         # Seat surface
-        card_maker.setFrame(-seat_width/2, seat_width/2, -seat_depth/2, seat_depth/2)
-        seat = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-seat_width/2, seat_width/2, -seat_depth/2, seat_depth/2)
+        seat = parent.attachNewNode(_CARD.generate())
         seat.setZ(seat_height)
         seat.setP(-90)
         seat.setColor(wood_color)
 
         # Backrest
         backrest_height = 0.5
-        card_maker.setFrame(-seat_width/2, seat_width/2, 0, backrest_height)
-        backrest = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-seat_width/2, seat_width/2, 0, backrest_height)
+        backrest = parent.attachNewNode(_CARD.generate())
         backrest.setPos(0, -seat_depth/2, seat_height)
         backrest.setP(-10)  # Slight angle for comfort
         backrest.setColor(wood_color)
@@ -218,67 +497,43 @@ class EnvironmentalProp:
             (seat_width/2 - 0.1, seat_depth/2 - 0.1),
         ]
 
-        for leg_x, leg_y in leg_positions:
-            card_maker.setFrame(-0.05, 0.05, 0, seat_height)
-            leg = parent.attachNewNode(card_maker.generate())
-            leg.setPos(leg_x, leg_y, 0)
-            leg.setColor(metal_color)
+        _build_posts(parent, leg_positions, 0.05, seat_height, metal_color)
 
         # Armrests
         for x in [-seat_width/2, seat_width/2]:
-            card_maker.setFrame(-0.08, 0.08, -seat_depth/2, seat_depth/2)
-            armrest = parent.attachNewNode(card_maker.generate())
+            _CARD.setFrame(-0.08, 0.08, -seat_depth/2, seat_depth/2)
+            armrest = parent.attachNewNode(_CARD.generate())
             armrest.setPos(x, 0, seat_height + 0.15)
             armrest.setH(90)
             armrest.setColor(wood_color)
 
     def _create_trash_can(self, parent: NodePath):
         """Create trash can"""
-        card_maker = CardMaker("trash_can")
-
         # Trash can (cylindrical - represented as octagon)
         can_color = (0.25, 0.55, 0.30, 1.0)  # Green
         can_radius = 0.35
         can_height = 0.90
 
-        sides = 8
-        for i in range(sides):
-            angle1 = (i / sides) * 360
-            angle2 = ((i + 1) / sides) * 360
-
-            x1 = can_radius * np.cos(np.radians(angle1))
-            y1 = can_radius * np.sin(np.radians(angle1))
-            x2 = can_radius * np.cos(np.radians(angle2))
-            y2 = can_radius * np.sin(np.radians(angle2))
-
-            side_width = np.sqrt((x2-x1)**2 + (y2-y1)**2)
-
-            card_maker.setFrame(0, side_width, 0, can_height)
-            side = parent.attachNewNode(card_maker.generate())
-            side.setPos(x1, y1, 0)
-            side.setH(angle1)
-            side.setColor(can_color)
+        _build_cylinder_geom(parent, can_radius, can_height, 8, can_color)
 
         # Lid
         lid_color = (0.20, 0.20, 0.22, 1.0)  # Dark lid
-        card_maker.setFrame(-can_radius, can_radius, -can_radius, can_radius)
-        lid = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-can_radius, can_radius, -can_radius, can_radius)
+        lid = parent.attachNewNode(_CARD.generate())
         lid.setZ(can_height)
         lid.setP(-90)
         lid.setColor(lid_color)
 
         # Lid dome (slightly raised)
         dome_radius = can_radius * 0.7
-        card_maker.setFrame(-dome_radius, dome_radius, -dome_radius, dome_radius)
-        dome = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-dome_radius, dome_radius, -dome_radius, dome_radius)
+        dome = parent.attachNewNode(_CARD.generate())
         dome.setZ(can_height + 0.1)
         dome.setP(-90)
         dome.setColor(lid_color)
 
     def _create_mailbox(self, parent: NodePath):
         """Create USPS-style mailbox"""
-        card_maker = CardMaker("mailbox")
-
         # Mailbox (blue USPS color)
         box_color = (0.15, 0.35, 0.65, 1.0)  # Blue
         box_width = 0.4
@@ -287,54 +542,32 @@ class EnvironmentalProp:
         box_z = 1.0
 
         # Post
-        post_color = (0.25, 0.25, 0.28, 1.0)
-        card_maker.setFrame(-0.08, 0.08, 0, box_z)
-        post = parent.attachNewNode(card_maker.generate())
+        post_color = _COL_METAL_DARK
+        _CARD.setFrame(-0.08, 0.08, 0, box_z)
+        post = parent.attachNewNode(_CARD.generate())
         post.setColor(post_color)
 
         # Box body
-        # Front
-        card_maker.setFrame(-box_width/2, box_width/2, 0, box_height)
-        front = parent.attachNewNode(card_maker.generate())
-        front.setPos(0, -box_depth/2, box_z)
-        front.setColor(box_color)
-
-        # Back
-        back = parent.attachNewNode(card_maker.generate())
-        back.setPos(0, box_depth/2, box_z)
-        back.setH(180)
-        back.setColor(box_color)
-
-        # Sides
-        card_maker.setFrame(-box_depth/2, box_depth/2, 0, box_height)
-        left = parent.attachNewNode(card_maker.generate())
-        left.setPos(-box_width/2, 0, box_z)
-        left.setH(90)
-        left.setColor(box_color)
-
-        right = parent.attachNewNode(card_maker.generate())
-        right.setPos(box_width/2, 0, box_z)
-        right.setH(-90)
-        right.setColor(box_color)
+        box = _build_box(box_width, box_depth, box_height, box_color)
+        box.reparentTo(parent)
+        box.setPos(0, 0, box_z)
 
         # Top (slanted)
-        card_maker.setFrame(-box_width/2, box_width/2, -box_depth/2, box_depth/2)
-        top = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-box_width/2, box_width/2, -box_depth/2, box_depth/2)
+        top = parent.attachNewNode(_CARD.generate())
         top.setZ(box_z + box_height)
         top.setP(-85)
         top.setColor(box_color)
 
         # Mail slot (white/silver)
         slot_color = (0.85, 0.85, 0.88, 1.0)
-        card_maker.setFrame(-box_width/3, box_width/3, -0.05, 0.05)
-        slot = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-box_width/3, box_width/3, -0.05, 0.05)
+        slot = parent.attachNewNode(_CARD.generate())
         slot.setPos(0, -box_depth/2 - 0.01, box_z + box_height/2)
         slot.setColor(slot_color)
 
     def _create_fire_hydrant(self, parent: NodePath):
         """Create fire hydrant"""
-        card_maker = CardMaker("hydrant")
-
         # Hydrant (red/yellow)
         hydrant_color = (0.85, 0.15, 0.15, 1.0)  # Red
         cap_color = (0.95, 0.88, 0.15, 1.0)  # Yellow caps
@@ -343,27 +576,11 @@ class EnvironmentalProp:
         body_radius = 0.25
         body_height = 0.80
 
-        sides = 8
-        for i in range(sides):
-            angle1 = (i / sides) * 360
-            angle2 = ((i + 1) / sides) * 360
-
-            x1 = body_radius * np.cos(np.radians(angle1))
-            y1 = body_radius * np.sin(np.radians(angle1))
-            x2 = body_radius * np.cos(np.radians(angle2))
-            y2 = body_radius * np.sin(np.radians(angle2))
-
-            side_width = np.sqrt((x2-x1)**2 + (y2-y1)**2)
-
-            card_maker.setFrame(0, side_width, 0, body_height)
-            side = parent.attachNewNode(card_maker.generate())
-            side.setPos(x1, y1, 0)
-            side.setH(angle1)
-            side.setColor(hydrant_color)
+        _build_cylinder_geom(parent, body_radius, body_height, 8, hydrant_color)
 
         # Top cap
-        card_maker.setFrame(-body_radius, body_radius, -body_radius, body_radius)
-        top = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-body_radius, body_radius, -body_radius, body_radius)
+        top = parent.attachNewNode(_CARD.generate())
         top.setZ(body_height)
         top.setP(-90)
         top.setColor(cap_color)
@@ -372,38 +589,40 @@ class EnvironmentalProp:
         nozzle_radius = 0.08
         nozzle_length = 0.20
 
-        for angle in [90, -90]:  # Left and right
-            x_pos = body_radius * np.cos(np.radians(angle))
-            y_pos = body_radius * np.sin(np.radians(angle))
-
-            card_maker.setFrame(-nozzle_radius, nozzle_radius,
-                               -nozzle_radius, nozzle_radius)
-            nozzle = parent.attachNewNode(card_maker.generate())
+        nozzle_angles = np.array([90.0, -90.0])  # Left and right
+        nozzle_rad = np.radians(nozzle_angles)
+        for angle, cos_a, sin_a in zip(nozzle_angles.tolist(),
+                                       np.cos(nozzle_rad).tolist(),
+                                       np.sin(nozzle_rad).tolist()):
+            x_pos = body_radius * cos_a
+            y_pos = body_radius * sin_a
+
+            _CARD.setFrame(-nozzle_radius, nozzle_radius,
+                           -nozzle_radius, nozzle_radius)
+            nozzle = parent.attachNewNode(_CARD.generate())
             nozzle.setPos(x_pos, y_pos, body_height * 0.6)
             nozzle.setH(angle)
             nozzle.setColor(hydrant_color)
 
             # Nozzle cap
-            card_maker.setFrame(-nozzle_radius * 1.2, nozzle_radius * 1.2,
-                               -nozzle_radius * 1.2, nozzle_radius * 1.2)
-            cap = parent.attachNewNode(card_maker.generate())
-            cap.setPos(x_pos + nozzle_length * np.cos(np.radians(angle)),
-                      y_pos + nozzle_length * np.sin(np.radians(angle)),
+            _CARD.setFrame(-nozzle_radius * 1.2, nozzle_radius * 1.2,
+                           -nozzle_radius * 1.2, nozzle_radius * 1.2)
+            cap = parent.attachNewNode(_CARD.generate())
+            cap.setPos(x_pos + nozzle_length * cos_a,
+                      y_pos + nozzle_length * sin_a,
                       body_height * 0.6)
             cap.setH(angle)
             cap.setColor(cap_color)
 
     def _create_bus_stop(self, parent: NodePath):
         """Create bus stop with shelter"""
-        card_maker = CardMaker("bus_stop")
-
         # Shelter structure
         shelter_width = 2.5
         shelter_depth = 1.2
         shelter_height = 2.5
 
         # Support posts (4 corners)
-        post_color = (0.35, 0.35, 0.38, 1.0)  # Metal gray
+        post_color = _COL_METAL_GRAY
         post_width = 0.12
 
         posts = [
@@ -413,25 +632,21 @@ class EnvironmentalProp:
             (shelter_width/2, shelter_depth/2),
         ]
 
-        for px, py in posts:
-            card_maker.setFrame(-post_width/2, post_width/2, 0, shelter_height)
-            post = parent.attachNewNode(card_maker.generate())
-            post.setPos(px, py, 0)
-            post.setColor(post_color)
+        _build_posts(parent, posts, post_width/2, shelter_height, post_color)
 
         # Roof
         roof_color = (0.65, 0.65, 0.70, 1.0)  # Light gray
-        card_maker.setFrame(-shelter_width/2 - 0.1, shelter_width/2 + 0.1,
-                           -shelter_depth/2 - 0.1, shelter_depth/2 + 0.1)
-        roof = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-shelter_width/2 - 0.1, shelter_width/2 + 0.1,
+                       -shelter_depth/2 - 0.1, shelter_depth/2 + 0.1)
+        roof = parent.attachNewNode(_CARD.generate())
         roof.setZ(shelter_height)
         roof.setP(-90)
         roof.setColor(roof_color)
 
         # Back wall (glass/plastic)
         wall_color = (0.70, 0.75, 0.80, 0.5)  # Translucent
-        card_maker.setFrame(-shelter_width/2, shelter_width/2, 0, shelter_height - 0.3)
-        back_wall = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-shelter_width/2, shelter_width/2, 0, shelter_height - 0.3)
+        back_wall = parent.attachNewNode(_CARD.generate())
         back_wall.setPos(0, shelter_depth/2, 0.15)
         back_wall.setH(180)
         back_wall.setColor(wall_color)
@@ -443,89 +658,55 @@ class EnvironmentalProp:
         bench_height = 0.45
         bench_color = (0.45, 0.45, 0.48, 1.0)
 
-        card_maker.setFrame(-bench_width/2, bench_width/2, -bench_depth/2, bench_depth/2)
-        bench = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-bench_width/2, bench_width/2, -bench_depth/2, bench_depth/2)
+        bench = parent.attachNewNode(_CARD.generate())
         bench.setPos(0, shelter_depth/4, bench_height)
         bench.setP(-90)
         bench.setColor(bench_color)
 
         # Bus stop sign
-        sign_color = (0.95, 0.95, 0.95, 1.0)  # White
+        sign_color = _COL_WHITE
         sign_width = 0.5
         sign_height = 0.6
 
-        card_maker.setFrame(-sign_width/2, sign_width/2, 0, sign_height)
-        sign = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-sign_width/2, sign_width/2, 0, sign_height)
+        sign = parent.attachNewNode(_CARD.generate())
         sign.setPos(-shelter_width/2 - 0.3, 0, 1.8)
         sign.setColor(sign_color)
 
         # Sign post
-        card_maker.setFrame(-0.05, 0.05, 0, 1.8)
-        sign_post = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-0.05, 0.05, 0, 1.8)
+        sign_post = parent.attachNewNode(_CARD.generate())
         sign_post.setPos(-shelter_width/2 - 0.3, 0, 0)
         sign_post.setColor(post_color)
 
     def _create_tree(self, parent: NodePath):
         """Create tree with trunk and foliage"""
-        card_maker = CardMaker("tree")
-
         # Trunk (brown)
         trunk_color = (0.45, 0.32, 0.22, 1.0)
         trunk_radius = 0.3
-        trunk_height = np.random.uniform(3.5, 5.5)
+        trunk_height = self.rng.uniform(3.5, 5.5)
 
         # Trunk (octagonal)
-        sides = 8
-        for i in range(sides):
-            angle1 = (i / sides) * 360
-            angle2 = ((i + 1) / sides) * 360
-
-            x1 = trunk_radius * np.cos(np.radians(angle1))
-            y1 = trunk_radius * np.sin(np.radians(angle1))
-            x2 = trunk_radius * np.cos(np.radians(angle2))
-            y2 = trunk_radius * np.sin(np.radians(angle2))
-
-            side_width = np.sqrt((x2-x1)**2 + (y2-y1)**2)
-
-            card_maker.setFrame(0, side_width, 0, trunk_height)
-            side = parent.attachNewNode(card_maker.generate())
-            side.setPos(x1, y1, 0)
-            side.setH(angle1)
-            side.setColor(trunk_color)
-
-        # Foliage (green, spherical - represented as multiple layers)
-        foliage_colors = [
-            (0.25, 0.65, 0.30, 1.0),  # Bright green
-            (0.30, 0.55, 0.28, 1.0),  # Medium green
-            (0.35, 0.70, 0.35, 1.0),  # Light green
-        ]
-        foliage_color = foliage_colors[np.random.randint(0, len(foliage_colors))]
+        _build_cylinder_geom(parent, trunk_radius, trunk_height, 8, trunk_color)
 
-        foliage_radius = np.random.uniform(1.5, 2.5)
-        foliage_z = trunk_height
+        # Foliage (green, spherical - one shared icosahedron)
+        foliage_geom = _FOLIAGE_GEOMS[self.rng.integers(0, len(_FOLIAGE_GEOMS))]
+        foliage_radius = self.rng.uniform(1.5, 2.5)
 
-        # Create foliage as layered discs (simplified)
-        for layer in range(5):
-            layer_z = foliage_z + layer * 0.5
-            layer_radius = foliage_radius * (1.0 - abs(layer - 2) * 0.2)
-
-            card_maker.setFrame(-layer_radius, layer_radius, -layer_radius, layer_radius)
-            foliage_layer = parent.attachNewNode(card_maker.generate())
-            foliage_layer.setZ(layer_z)
-            foliage_layer.setP(-90)
-            foliage_layer.setColor(foliage_color)
+        foliage = foliage_geom.copyTo(parent)
+        foliage.setZ(trunk_height + foliage_radius * 0.5)
+        foliage.setScale(foliage_radius)
 
     def _create_street_sign(self, parent: NodePath):
         """Create street sign"""
-        card_maker = CardMaker("street_sign")
-
         # Post
-        post_color = (0.30, 0.30, 0.33, 1.0)
+        post_color = _COL_POST
         post_height = 2.5
         post_width = 0.08
 
-        card_maker.setFrame(-post_width/2, post_width/2, 0, post_height)
-        post = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-post_width/2, post_width/2, 0, post_height)
+        post = parent.attachNewNode(_CARD.generate())
         post.setColor(post_color)
 
         # Sign (green street name sign)
@@ -533,32 +714,30 @@ class EnvironmentalProp:
         sign_width = 1.2
         sign_height = 0.25
 
-        card_maker.setFrame(-sign_width/2, sign_width/2, -sign_height/2, sign_height/2)
-        sign = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-sign_width/2, sign_width/2, -sign_height/2, sign_height/2)
+        sign = parent.attachNewNode(_CARD.generate())
         sign.setPos(0, 0, post_height - 0.3)
         sign.setColor(sign_color)
 
         # Sign border (white)
-        border_color = (0.95, 0.95, 0.95, 1.0)
+        border_color = _COL_WHITE
         border_width = 0.03
 
         # Top border
-        card_maker.setFrame(-sign_width/2, sign_width/2, sign_height/2 - border_width, sign_height/2)
-        top_border = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-sign_width/2, sign_width/2, sign_height/2 - border_width, sign_height/2)
+        top_border = parent.attachNewNode(_CARD.generate())
         top_border.setPos(0, -0.01, post_height - 0.3)
         top_border.setColor(border_color)
 
     def _create_parking_meter(self, parent: NodePath):
         """Create parking meter"""
-        card_maker = CardMaker("parking_meter")
-
         # Post
-        post_color = (0.30, 0.30, 0.33, 1.0)
+        post_color = _COL_POST
         post_height = 1.3
         post_width = 0.06
 
-        card_maker.setFrame(-post_width/2, post_width/2, 0, post_height)
-        post = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-post_width/2, post_width/2, 0, post_height)
+        post = parent.attachNewNode(_CARD.generate())
         post.setColor(post_color)
 
         # Meter head
@@ -567,31 +746,21 @@ class EnvironmentalProp:
         meter_height = 0.35
         meter_depth = 0.15
 
-        # Front
-        card_maker.setFrame(-meter_width/2, meter_width/2, 0, meter_height)
-        meter_front = parent.attachNewNode(card_maker.generate())
-        meter_front.setPos(0, -meter_depth/2, post_height)
-        meter_front.setColor(meter_color)
-
-        # Back
-        meter_back = parent.attachNewNode(card_maker.generate())
-        meter_back.setPos(0, meter_depth/2, post_height)
-        meter_back.setH(180)
-        meter_back.setColor(meter_color)
+        meter = _build_box(meter_width, meter_depth, meter_height, meter_color)
+        meter.reparentTo(parent)
+        meter.setPos(0, 0, post_height)
 
         # Display screen (digital)
         screen_color = (0.15, 0.20, 0.15, 1.0)  # Dark green LCD
-        card_maker.setFrame(-meter_width/3, meter_width/3, -meter_height/4, meter_height/4)
-        screen = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-meter_width/3, meter_width/3, -meter_height/4, meter_height/4)
+        screen = parent.attachNewNode(_CARD.generate())
         screen.setPos(0, -meter_depth/2 - 0.01, post_height + meter_height * 0.6)
         screen.setColor(screen_color)
 
     def _create_bike_rack(self, parent: NodePath):
         """Create bike rack"""
-        card_maker = CardMaker("bike_rack")
-
         # Rack (metal)
-        rack_color = (0.35, 0.35, 0.38, 1.0)
+        rack_color = _COL_METAL_GRAY
         num_loops = 5
         loop_width = 0.5
         loop_height = 0.80
@@ -602,103 +771,121 @@ class EnvironmentalProp:
 
             # Vertical posts (2 per loop)
             post_radius = 0.04
-            card_maker.setFrame(-post_radius, post_radius, 0, loop_height)
+            _CARD.setFrame(-post_radius, post_radius, 0, loop_height)
 
-            left_post = parent.attachNewNode(card_maker.generate())
+            left_post = parent.attachNewNode(_CARD.generate())
             left_post.setPos(x_pos - loop_width/2, 0, 0)
             left_post.setColor(rack_color)
 
-            right_post = parent.attachNewNode(card_maker.generate())
+            right_post = parent.attachNewNode(_CARD.generate())
             right_post.setPos(x_pos + loop_width/2, 0, 0)
             right_post.setColor(rack_color)
 
             # Horizontal bar (top of loop)
-            card_maker.setFrame(x_pos - loop_width/2, x_pos + loop_width/2,
-                               -post_radius, post_radius)
-            top_bar = parent.attachNewNode(card_maker.generate())
+            _CARD.setFrame(x_pos - loop_width/2, x_pos + loop_width/2,
+                           -post_radius, post_radius)
+            top_bar = parent.attachNewNode(_CARD.generate())
             top_bar.setZ(loop_height)
             top_bar.setP(-90)
             top_bar.setColor(rack_color)
 
     def _create_newspaper_box(self, parent: NodePath):
         """Create newspaper vending box"""
-        card_maker = CardMaker("newspaper_box")
-
         # Box (typically red or blue)
-        box_colors = [
-            (0.75, 0.15, 0.15, 1.0),  # Red
-            (0.15, 0.35, 0.75, 1.0),  # Blue
-        ]
-        box_color = box_colors[np.random.randint(0, len(box_colors))]
+        box_color = _NEWSPAPER_BOX_COLORS[self.rng.integers(0, len(_NEWSPAPER_BOX_COLORS))]
         box_width = 0.55
         box_depth = 0.45
         box_height = 1.1
 
-        # Front (with window)
-        card_maker.setFrame(-box_width/2, box_width/2, 0, box_height)
-        front = parent.attachNewNode(card_maker.generate())
-        front.setPos(0, -box_depth/2, 0)
-        front.setColor(box_color)
+        # Box body
+        box = _build_box(box_width, box_depth, box_height, box_color)
+        box.reparentTo(parent)
 
         # Window (to see newspapers)
         window_color = (0.70, 0.75, 0.80, 0.6)  # Translucent
-        card_maker.setFrame(-box_width/2 + 0.1, box_width/2 - 0.1, box_height * 0.3, box_height * 0.7)
-        window = parent.attachNewNode(card_maker.generate())
+        _CARD.setFrame(-box_width/2 + 0.1, box_width/2 - 0.1, box_height * 0.3, box_height * 0.7)
+        window = parent.attachNewNode(_CARD.generate())
         window.setPos(0, -box_depth/2 - 0.01, 0)
         window.setColor(window_color)
         window.setTransparency(TransparencyAttrib.MAlpha)
 
-        # Back
-        card_maker.setFrame(-box_width/2, box_width/2, 0, box_height)
-        back = parent.attachNewNode(card_maker.generate())
-        back.setPos(0, box_depth/2, 0)
-        back.setH(180)
-        back.setColor(box_color)
-
-        # Sides
-        card_maker.setFrame(-box_depth/2, box_depth/2, 0, box_height)
-        left = parent.attachNewNode(card_maker.generate())
-        left.setPos(-box_width/2, 0, 0)
-        left.setH(90)
-        left.setColor(box_color)
-
-        right = parent.attachNewNode(card_maker.generate())
-        right.setPos(box_width/2, 0, 0)
-        right.setH(-90)
-        right.setColor(box_color)
+    # Geometry builder per prop type
+    _BUILDERS: Dict[PropType, Callable] = {
+        PropType.STREET_LIGHT: _create_street_light,
+        PropType.TRAFFIC_LIGHT: _create_traffic_light,
+        PropType.BENCH: _create_bench,
+        PropType.TRASH_CAN: _create_trash_can,
+        PropType.MAILBOX: _create_mailbox,
+        PropType.FIRE_HYDRANT: _create_fire_hydrant,
+        PropType.BUS_STOP: _create_bus_stop,
+        PropType.TREE: _create_tree,
+        PropType.STREET_SIGN: _create_street_sign,
+        PropType.PARKING_METER: _create_parking_meter,
+        PropType.BIKE_RACK: _create_bike_rack,
+        PropType.NEWSPAPER_BOX: _create_newspaper_box,
+    }
 
 
 class PropManager:
     """Manages placement of environmental props in the city"""
 
-    def __init__(self):
-        """Initialize prop manager"""
-        pass
+    __slots__ = ('rng', '_placed', '_cull_nodes', '_cull_pad', '_cull_tree')
+
+    def __init__(self, seed: Optional[int] = None):
+        """Initialize prop manager
+
+        Args:
+            seed: Seed for placement and for every placed prop's own seed;
+                None draws fresh entropy
+        """
+        self.rng = np.random.default_rng(seed)
+        self._placed: List[NodePath] = []
+
+        # Units stashed/unstashed by cull_to_view: the props themselves until
+        # finalize() groups them into tiles; pad is the unit's own extent
+        self._cull_nodes: List[NodePath] = self._placed
+        self._cull_pad = 0.0
+        self._cull_tree = None
 
     def place_street_props(self, parent_node: NodePath, road_positions: List[Tuple[float, float]],
                           density: float = 1.0):
         """Place street furniture along roads"""
+        positions, types, headings = self._plan_street_props(road_positions, density)
+        return self._realize(parent_node, positions, types, headings)
+
+    def _plan_street_props(self, road_positions: List[Tuple[float, float]],
+                           density: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Plan street furniture along roads without touching the scene graph
+
+        Returns:
+            (positions (N, 3), PropType values (N,), headings (N,))
+        """
+        roads = np.asarray(road_positions, dtype=np.float64).reshape(-1, 2)
+
+        # Street lights every 20m
+        light_xy = roads[::4] + (3.0, 0.0)
+
+        # Random other props: one roll per segment, then a type for each hit
+        hit_xy = roads[self.rng.random(len(roads)) < density * 0.1] + (2.5, 1.0)
+        type_values = np.array([prop_type.value for prop_type in _STREET_PROP_TYPES])
+        hit_types = type_values[self.rng.integers(0, len(type_values), size=len(hit_xy))]
+
+        positions = np.zeros((len(light_xy) + len(hit_xy), 3))
+        positions[:, :2] = np.concatenate([light_xy, hit_xy])
+        types = np.concatenate([np.full(len(light_xy), PropType.STREET_LIGHT.value), hit_types])
+        return positions, types, np.zeros(len(positions))
+
+    def _realize(self, parent_node: NodePath, positions: np.ndarray, types: np.ndarray,
+                 headings: np.ndarray) -> List[NodePath]:
+        """Instance planned props under parent_node, one placement node each"""
         props_placed = []
-
-        for i, (x, z) in enumerate(road_positions):
-            # Street lights every 20m
-            if i % 4 == 0:
-                light = EnvironmentalProp(PropType.STREET_LIGHT)
-                light_node = light.create_3d_model(parent_node, (x + 3, z, 0), heading=0)
-                props_placed.append(light_node)
-
-            # Random other props
-            if np.random.random() < density * 0.1:
-                prop_type = np.random.choice([
-                    PropType.TRASH_CAN,
-                    PropType.BENCH,
-                    PropType.MAILBOX,
-                    PropType.PARKING_METER,
-                ])
-                prop = EnvironmentalProp(prop_type)
-                prop_node = prop.create_3d_model(parent_node, (x + 2.5, z + 1, 0))
-                props_placed.append(prop_node)
-
+        seeds = self.rng.integers(1, 1000000, len(positions)).tolist()
+        for position, type_value, heading, seed in zip(positions.tolist(), types.tolist(),
+                                                       headings.tolist(), seeds):
+            prop = EnvironmentalProp(PropType(type_value), seed)
+            props_placed.append(prop.create_3d_model(parent_node, position, heading))
+        self._placed.extend(props_placed)
+        self._cull_tree = None
         return props_placed
 
     def place_intersection_props(self, parent_node: NodePath, intersection_pos: Tuple[float, float]):
@@ -708,37 +895,97 @@ class PropManager:
 
         # Traffic lights at each corner
         for corner_x, corner_z in [(x+5, z+5), (x-5, z+5), (x+5, z-5), (x-5, z-5)]:
-            traffic_light = EnvironmentalProp(PropType.TRAFFIC_LIGHT)
+            traffic_light = EnvironmentalProp(PropType.TRAFFIC_LIGHT, int(self.rng.integers(1, 1000000)))
             light_node = traffic_light.create_3d_model(parent_node, (corner_x, corner_z, 0))
             props_placed.append(light_node)
 
+        self._placed.extend(props_placed)
+        self._cull_tree = None
         return props_placed
 
     def place_park_props(self, parent_node: NodePath, park_area: Tuple[float, float, float, float]):
         """Place props in park areas"""
         x_min, z_min, x_max, z_max = park_area
-        props_placed = []
 
         # Trees
-        num_trees = np.random.randint(5, 15)
-        for _ in range(num_trees):
-            tree_x = np.random.uniform(x_min, x_max)
-            tree_z = np.random.uniform(z_min, z_max)
-            tree = EnvironmentalProp(PropType.TREE)
-            tree_node = tree.create_3d_model(parent_node, (tree_x, tree_z, 0))
-            props_placed.append(tree_node)
+        num_trees = int(self.rng.integers(5, 15))
+        tree_xs = self.rng.uniform(x_min, x_max, num_trees)
+        tree_zs = self.rng.uniform(z_min, z_max, num_trees)
 
         # Benches
-        num_benches = np.random.randint(3, 8)
-        for _ in range(num_benches):
-            bench_x = np.random.uniform(x_min, x_max)
-            bench_z = np.random.uniform(z_min, z_max)
-            bench = EnvironmentalProp(PropType.BENCH)
-            bench_node = bench.create_3d_model(parent_node, (bench_x, bench_z, 0),
-                                              heading=np.random.uniform(0, 360))
-            props_placed.append(bench_node)
-
-        return props_placed
+        num_benches = int(self.rng.integers(3, 8))
+        bench_xs = self.rng.uniform(x_min, x_max, num_benches)
+        bench_zs = self.rng.uniform(z_min, z_max, num_benches)
+        bench_headings = self.rng.uniform(0, 360, num_benches)
+
+        positions = np.zeros((num_trees + num_benches, 3))
+        positions[:, 0] = np.concatenate([tree_xs, bench_xs])
+        positions[:, 1] = np.concatenate([tree_zs, bench_zs])
+        types = np.repeat([PropType.TREE.value, PropType.BENCH.value], [num_trees, num_benches])
+        headings = np.concatenate([np.zeros(num_trees), bench_headings])
+        return self._realize(parent_node, positions, types, headings)
+
+    def finalize(self, parent_node: NodePath, tile_size: float = 32.0) -> NodePath:
+        """Merge placed props into one RigidBodyCombiner per tile under parent_node
+
+        Call once after all place_* calls. Props never move after placement,
+        so each tile_size x tile_size tile renders as a single batched Geom,
+        and cull_to_view can then stash whole tiles instead of single props.
+
+        Returns:
+            NodePath holding the tile combiners
+        """
+        root = parent_node.attachNewNode("all_props")
+        tiles: Dict[Tuple[int, int], NodePath] = {}
+        for prop_node in self._placed:
+            pos = prop_node.getPos(root)
+            key = (int(pos[0] // tile_size), int(pos[1] // tile_size))
+            tile = tiles.get(key)
+            if tile is None:
+                tile = root.attachNewNode(RigidBodyCombiner(f"props_{key[0]}_{key[1]}"))
+                tile.setPos((key[0] + 0.5) * tile_size, (key[1] + 0.5) * tile_size, 0)
+                tiles[key] = tile
+            prop_node.wrtReparentTo(tile)
+
+        for tile in tiles.values():
+            tile.node().collect()
+
+        # Cull by tile center, padded by half the tile diagonal
+        self._cull_nodes = list(tiles.values())
+        self._cull_pad = tile_size * 0.5 * np.sqrt(2.0)
+        self._cull_tree = None
+        return root
+
+    def cull_to_view(self, camera_np: NodePath, radius: float) -> int:
+        """Stash props (or finalized tiles) farther than radius from the camera
+
+        Distance is measured on the ground plane (X/Y). The spatial index is
+        built on first use and rebuilt after new placements or finalize().
+
+        Returns:
+            Number of units left visible
+        """
+        nodes = self._cull_nodes
+        if not nodes:
+            return 0
+
+        if self._cull_tree is None:
+            from scipy.spatial import cKDTree
+            centers = np.array([tuple(node.getNetTransform().getPos())[:2] for node in nodes])
+            self._cull_tree = cKDTree(centers)
+
+        cam_pos = camera_np.getNetTransform().getPos()
+        visible = np.zeros(len(nodes), dtype=bool)
+        visible[self._cull_tree.query_ball_point((cam_pos[0], cam_pos[1]),
+                                                 radius + self._cull_pad)] = True
+
+        for node, show in zip(nodes, visible.tolist()):
+            if show == node.isStashed():
+                if show:
+                    node.unstash()
+                else:
+                    node.stash()
+        return int(visible.sum())
 
 
 if __name__ == "__main__":
@@ -4,8 +4,10 @@ Advanced visual effects, shading, and textures
 """
 import pygame
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict
 import colorsys
+import functools
+import math
 
 
 class ColorPalette:
@@ -57,12 +59,40 @@ class ColorPalette:
     STREET_LIGHT = (255, 220, 180)
 
 
+def _to_colors(values: np.ndarray) -> np.ndarray:
+    """Clamp shaded channel values to 0-255 and truncate to uint8."""
+    return np.clip(values, 0, 255).astype(np.uint8)
+
+
 class RealisticShader:
     """
     Shader system for realistic lighting and shadows.
     Simulates ambient occlusion, directional lighting, and atmospheric effects.
+
+    Each effect has an ``*_array`` form that shades a whole ``(..., 3)``
+    color array at once; per-pixel inputs (occlusion, normals, distance)
+    broadcast against the leading dimensions. The tuple forms do the same
+    math in plain Python for single colors, with the same 0-255 clamping.
     """
 
+    @staticmethod
+    def apply_ambient_occlusion_array(
+        colors: np.ndarray,
+        occlusion: np.ndarray
+    ) -> np.ndarray:
+        """
+        Apply ambient occlusion darkening to an array of colors.
+
+        Args:
+            colors: (..., 3) RGB colors
+            occlusion: 0.0 (full light) to 1.0 (full shadow), shape (...)
+
+        Returns:
+            Darkened (..., 3) uint8 colors
+        """
+        factor = 1.0 - (np.asarray(occlusion) * 0.6)  # Max 60% darkening
+        return _to_colors(np.asarray(colors, dtype=np.float64) * factor[..., None])
+
     @staticmethod
     def apply_ambient_occlusion(
         base_color: Tuple[int, int, int],
@@ -80,11 +110,42 @@ class RealisticShader:
         """
         factor = 1.0 - (occlusion * 0.6)  # Max 60% darkening
         return (
-            int(base_color[0] * factor),
-            int(base_color[1] * factor),
-            int(base_color[2] * factor)
+            min(255, max(0, int(base_color[0] * factor))),
+            min(255, max(0, int(base_color[1] * factor))),
+            min(255, max(0, int(base_color[2] * factor)))
         )
 
+    @staticmethod
+    def apply_directional_light_array(
+        colors: np.ndarray,
+        normals: np.ndarray,
+        light_dir: Tuple[float, float] = (0.7, -0.7)
+    ) -> np.ndarray:
+        """
+        Apply directional lighting (sun) to an array of colors.
+
+        Args:
+            colors: (..., 3) RGB colors
+            normals: (..., 2) surface normals
+            light_dir: Light direction vector
+
+        Returns:
+            Lit (..., 3) uint8 colors
+        """
+        normals = np.asarray(normals, dtype=np.float64)
+
+        # Calculate dot product (lambert shading)
+        dot = np.maximum(
+            0, normals[..., 0] * light_dir[0] + normals[..., 1] * light_dir[1]
+        )
+
+        # Apply lighting with ambient term
+        ambient = 0.4
+        diffuse = 0.6
+        intensity = ambient + diffuse * dot
+
+        return _to_colors(np.asarray(colors, dtype=np.float64) * intensity[..., None])
+
     @staticmethod
     def apply_directional_light(
         base_color: Tuple[int, int, int],
@@ -111,10 +172,44 @@ class RealisticShader:
         intensity = ambient + diffuse * dot
 
         return (
-            min(255, int(base_color[0] * intensity)),
-            min(255, int(base_color[1] * intensity)),
-            min(255, int(base_color[2] * intensity))
+            min(255, max(0, int(base_color[0] * intensity))),
+            min(255, max(0, int(base_color[1] * intensity))),
+            min(255, max(0, int(base_color[2] * intensity)))
+        )
+
+    @staticmethod
+    def apply_distance_fog_array(
+        colors: np.ndarray,
+        distance: np.ndarray,
+        fog_start: float = 200.0,
+        fog_end: float = 500.0,
+        fog_color: Tuple[int, int, int] = (200, 210, 220)
+    ) -> np.ndarray:
+        """
+        Apply atmospheric fog to an array of colors based on distance.
+
+        Args:
+            colors: (..., 3) RGB colors
+            distance: Distance from camera, shape (...)
+            fog_start: Distance where fog begins
+            fog_end: Distance where fog is maximum
+            fog_color: Color of fog
+
+        Returns:
+            Fogged (..., 3) uint8 colors
+        """
+        # Calculate fog factor (zero before fog_start, so those colors pass through)
+        fog_factor = np.clip(
+            (np.asarray(distance, dtype=np.float64) - fog_start) / (fog_end - fog_start),
+            0.0, 1.0
+        )[..., None]
+
+        # Blend base color with fog color
+        blended = (
+            np.asarray(colors, dtype=np.float64) * (1 - fog_factor)
+            + np.asarray(fog_color, dtype=np.float64) * fog_factor
         )
+        return _to_colors(blended)
 
     @staticmethod
     def apply_distance_fog(
@@ -145,11 +240,50 @@ class RealisticShader:
 
         # Blend base color with fog color
         return (
-            int(base_color[0] * (1 - fog_factor) + fog_color[0] * fog_factor),
-            int(base_color[1] * (1 - fog_factor) + fog_color[1] * fog_factor),
-            int(base_color[2] * (1 - fog_factor) + fog_color[2] * fog_factor)
+            min(255, max(0, int(base_color[0] * (1 - fog_factor) + fog_color[0] * fog_factor))),
+            min(255, max(0, int(base_color[1] * (1 - fog_factor) + fog_color[1] * fog_factor))),
+            min(255, max(0, int(base_color[2] * (1 - fog_factor) + fog_color[2] * fog_factor)))
         )
 
+    @staticmethod
+    def add_specular_highlight_array(
+        colors: np.ndarray,
+        view_dir: np.ndarray,
+        normals: np.ndarray,
+        light_dir: Tuple[float, float],
+        shininess: float = 32.0
+    ) -> np.ndarray:
+        """
+        Add specular highlights (Blinn-Phong) to an array of colors.
+
+        Args:
+            colors: (..., 3) RGB colors
+            view_dir: (..., 2) view direction vectors, or a single (2,) vector
+            normals: (..., 2) surface normals
+            light_dir: Light direction
+            shininess: Specular exponent
+
+        Returns:
+            (..., 3) uint8 colors with specular highlight
+        """
+        view_dir = np.asarray(view_dir, dtype=np.float64)
+        normals = np.asarray(normals, dtype=np.float64)
+
+        # Calculate halfway vector
+        h_x = (view_dir[..., 0] + light_dir[0]) / 2
+        h_y = (view_dir[..., 1] + light_dir[1]) / 2
+        h_len = np.sqrt(h_x**2 + h_y**2)
+        nonzero = h_len > 0
+        h_x = np.divide(h_x, h_len, out=np.array(h_x, dtype=np.float64), where=nonzero)
+        h_y = np.divide(h_y, h_len, out=np.array(h_y, dtype=np.float64), where=nonzero)
+
+        # Calculate specular term
+        spec = np.maximum(0, normals[..., 0] * h_x + normals[..., 1] * h_y)
+        spec = spec ** shininess
+
+        # Add specular highlight
+        return _to_colors(np.asarray(colors, dtype=np.float64) + (spec * 50)[..., None])
+
     @staticmethod
     def add_specular_highlight(
         base_color: Tuple[int, int, int],
@@ -174,7 +308,7 @@ class RealisticShader:
         # Calculate halfway vector
         h_x = (view_dir[0] + light_dir[0]) / 2
         h_y = (view_dir[1] + light_dir[1]) / 2
-        h_len = np.sqrt(h_x**2 + h_y**2)
+        h_len = math.sqrt(h_x**2 + h_y**2)
         if h_len > 0:
             h_x /= h_len
             h_y /= h_len
@@ -185,12 +319,43 @@ class RealisticShader:
 
         # Add specular highlight
         return (
-            min(255, int(base_color[0] + spec * 50)),
-            min(255, int(base_color[1] + spec * 50)),
-            min(255, int(base_color[2] + spec * 50))
+            min(255, max(0, int(base_color[0] + spec * 50))),
+            min(255, max(0, int(base_color[1] + spec * 50))),
+            min(255, max(0, int(base_color[2] + spec * 50)))
         )
 
 
+def _blur_121(arr: np.ndarray, axis: int) -> np.ndarray:
+    """Separable [1, 2, 1] / 4 blur along one axis; edge rows are kept."""
+    src = np.moveaxis(arr, axis, 0)
+    out = src.copy()
+    mid = out[1:-1]
+    np.add(src[:-2], src[2:], out=mid)
+    mid += src[1:-1]
+    mid += src[1:-1]
+    mid *= 0.25
+    return np.moveaxis(out, 0, axis)
+
+
+@functools.lru_cache(maxsize=32)
+def _noise_texture(width: int, height: int, scale: float, seed: int) -> np.ndarray:
+    """Cached noise for generate_noise_texture; returned array is read-only."""
+    noise = np.random.RandomState(seed).rand(height // 4, width // 4)
+
+    # Fixed 4x upscale: replicate cells, then smooth the block edges. The
+    # horizontal pass runs before the row repeat, on a quarter of the data.
+    noise = _blur_121(np.repeat(noise, 4, axis=1), 1)
+    noise = _blur_121(np.repeat(noise, 4, axis=0), 0)
+
+    # Normalize
+    noise -= noise.min()
+    noise /= noise.max()
+
+    noise = noise[:height, :width]
+    noise.flags.writeable = False
+    return noise
+
+
 class ProceduralTexture:
     """
     Procedural texture generation for realistic surfaces.
@@ -204,17 +369,29 @@ class ProceduralTexture:
         seed: int = 0
     ) -> np.ndarray:
         """Generate Perlin-like noise texture"""
-        np.random.seed(seed)
-        noise = np.random.rand(height // 4, width // 4)
+        return _noise_texture(width, height, scale, seed).copy()
 
-        # Upscale with bilinear interpolation
-        from scipy.ndimage import zoom
-        noise = zoom(noise, 4, order=1)
+    @staticmethod
+    def apply_texture_variation_array(
+        colors: np.ndarray,
+        noise: np.ndarray,
+        variation: float = 0.15
+    ) -> np.ndarray:
+        """
+        Apply texture variation to an array of colors.
 
-        # Normalize
-        noise = (noise - noise.min()) / (noise.max() - noise.min())
+        Args:
+            colors: (..., 3) base RGB colors
+            noise: Noise values 0-1, shape (...)
+            variation: Amount of variation (0-1)
+
+        Returns:
+            Varied (..., 3) uint8 colors
+        """
+        # Convert noise to variation factor (-variation to +variation)
+        factor = 1.0 + (np.asarray(noise) - 0.5) * variation * 2
 
-        return noise[:height, :width]
+        return _to_colors(np.asarray(colors, dtype=np.float64) * factor[..., None])
 
     @staticmethod
     def apply_texture_variation(
@@ -248,6 +425,29 @@ class RealisticBuildingRenderer:
     Advanced building renderer with realistic details.
     """
 
+    # (base_color, lighting_dir) -> (front, right, top) face colors
+    _face_color_cache: Dict[tuple, tuple] = {}
+
+    @staticmethod
+    def _face_colors(
+        base_color: Tuple[int, int, int],
+        lighting_dir: Tuple[float, float]
+    ) -> tuple:
+        """Look up (or compute once) the shaded front, right and top colors"""
+        key = (tuple(base_color), tuple(lighting_dir))
+        colors = RealisticBuildingRenderer._face_color_cache.get(key)
+        if colors is None:
+            front_color = RealisticShader.apply_directional_light(
+                key[0],
+                (0, 1),  # Normal facing down-right
+                key[1]
+            )
+            right_color = tuple(int(c * 0.7) for c in key[0])
+            top_color = tuple(int(c * 0.85) for c in key[0])
+            colors = (front_color, right_color, top_color)
+            RealisticBuildingRenderer._face_color_cache[key] = colors
+        return colors
+
     @staticmethod
     def draw_building_3d(
         surface: pygame.Surface,
@@ -289,16 +489,13 @@ class RealisticBuildingRenderer:
         ]
         pygame.draw.polygon(surface, (50, 50, 50), shadow_points)
 
+        front_color, right_color, top_color = \
+            RealisticBuildingRenderer._face_colors(base_color, lighting_dir)
+
         # Front face (lighter)
-        front_color = RealisticShader.apply_directional_light(
-            base_color,
-            (0, 1),  # Normal facing down-right
-            lighting_dir
-        )
         pygame.draw.rect(surface, front_color, (x, y, width, height))
 
         # Right face (darker)
-        right_color = tuple(int(c * 0.7) for c in base_color)
         right_points = [
             (x + width, y),
             (x + width + iso_offset_x, y - iso_offset_y),
@@ -309,7 +506,6 @@ class RealisticBuildingRenderer:
             pygame.draw.polygon(surface, right_color, right_points)
 
         # Top face (medium)
-        top_color = tuple(int(c * 0.85) for c in base_color)
         top_points = [
             (x, y),
             (x + iso_offset_x, y - iso_offset_y),
@@ -373,39 +569,74 @@ class ParticleSystem:
     Particle system for ambient effects (birds, leaves, etc.)
     """
 
-    def __init__(self):
-        self.particles = []
+    PARTICLE_LIFE = 100
+
+    def __init__(self, capacity: int = 256):
+        # Structure-of-arrays storage; live particles occupy [0, count)
+        self.count = 0
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.vx = np.empty(capacity, dtype=np.float32)
+        self.vy = np.empty(capacity, dtype=np.float32)
+        self.life = np.empty(capacity, dtype=np.int32)
+        self.types = np.empty(capacity, dtype=object)
+
+    def _grow(self):
+        """Double the capacity of every particle array"""
+        capacity = max(1, 2 * len(self.x))
+        for name in ('x', 'y', 'vx', 'vy', 'life', 'types'):
+            setattr(self, name, np.resize(getattr(self, name), capacity))
 
     def emit(self, x: float, y: float, particle_type: str = "ambient"):
         """Emit a particle"""
-        self.particles.append({
-            'x': x,
-            'y': y,
-            'vx': np.random.uniform(-0.5, 0.5),
-            'vy': np.random.uniform(-0.5, 0.5),
-            'life': 100,
-            'type': particle_type
-        })
+        if self.count == len(self.x):
+            self._grow()
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = np.random.uniform(-0.5, 0.5)
+        self.vy[i] = np.random.uniform(-0.5, 0.5)
+        self.life[i] = self.PARTICLE_LIFE
+        self.types[i] = particle_type
+        self.count = i + 1
 
     def update(self, dt: float):
         """Update all particles"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
 
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        # Compact the survivors to the front, preserving emission order
+        alive = self.life[:n] > 0
+        new_n = int(np.count_nonzero(alive))
+        if new_n < n:
+            for arr in (self.x, self.y, self.vx, self.vy, self.life, self.types):
+                arr[:new_n] = arr[:n][alive]
+        self.count = new_n
 
     def render(self, surface: pygame.Surface, camera):
         """Render particles"""
-        for particle in self.particles:
-            screen_x, screen_y = camera.world_to_screen(particle['x'], particle['y'])
+        n = self.count
+        color = (200, 200, 200)
+        for x, y in zip(self.x[:n].tolist(), self.y[:n].tolist()):
+            screen_x, screen_y = camera.world_to_screen(x, y)
+            pygame.draw.circle(surface, color, (screen_x, screen_y), 1)
 
-            alpha = int((particle['life'] / 100) * 255)
-            color = (200, 200, 200, alpha)
 
-            pygame.draw.circle(surface, color[:3], (screen_x, screen_y), 1)
+# Terrain colors indexed by [biome, variant]. Water and mountain variants step
+# up with elevation, the rest with moisture.
+_TERRAIN_PALETTE = np.array([
+    [ColorPalette.DEEP_WATER, ColorPalette.SHALLOW_WATER, ColorPalette.WATER_HIGHLIGHT],
+    [ColorPalette.SAND_SHADOW, ColorPalette.BEACH_SAND, ColorPalette.BEACH_SAND],
+    [ColorPalette.GRASS_HIGHLIGHT, ColorPalette.GRASS_LIGHT, ColorPalette.GRASS_DARK],
+    [ColorPalette.FOREST_MID, ColorPalette.FOREST_DARK, ColorPalette.FOREST_DARK],
+    [ColorPalette.MOUNTAIN_DARK, ColorPalette.MOUNTAIN_MID, ColorPalette.MOUNTAIN_SNOW],
+], dtype=np.float64)
 
 
 def generate_height_shading(heightmap: np.ndarray) -> np.ndarray:
@@ -418,19 +649,21 @@ def generate_height_shading(heightmap: np.ndarray) -> np.ndarray:
     Returns:
         Shading intensity map
     """
-    # Calculate gradients (surface normals)
-    gradient_x = np.zeros_like(heightmap)
-    gradient_y = np.zeros_like(heightmap)
-
-    gradient_x[:, :-1] = heightmap[:, 1:] - heightmap[:, :-1]
-    gradient_y[:-1, :] = heightmap[1:, :] - heightmap[:-1, :]
-
-    # Calculate lighting intensity
-    light_dir = np.array([0.7, 0.7])  # 45-degree light
-    intensity = gradient_x * light_dir[0] + gradient_y * light_dir[1]
-
-    # Normalize and apply
-    intensity = (intensity - intensity.min()) / (intensity.max() - intensity.min() + 0.001)
+    # Accumulate the light-weighted gradients (surface normals) in place;
+    # the last column/row has no forward difference and keeps a zero term
+    light_dir = (0.7, 0.7)  # 45-degree light
+    intensity = np.empty(heightmap.shape, dtype=np.result_type(heightmap, np.float32))
+    np.subtract(heightmap[:, 1:], heightmap[:, :-1], out=intensity[:, :-1], dtype=intensity.dtype)
+    intensity[:, :-1] *= light_dir[0]
+    intensity[:, -1] = 0.0
+
+    gradient_y = np.subtract(heightmap[1:, :], heightmap[:-1, :], dtype=intensity.dtype)
+    gradient_y *= light_dir[1]
+    intensity[:-1, :] += gradient_y
+
+    # Normalize in place; the shifted maximum is the peak-to-peak range
+    intensity -= intensity.min()
+    intensity /= intensity.max() + 0.001
 
     return intensity
 
@@ -451,52 +684,24 @@ def apply_realistic_terrain_colors(
     Returns:
         RGB color array
     """
-    height, width = biome_map.shape
-    colors = np.zeros((height, width, 3), dtype=np.uint8)
-
-    # Generate lighting from heightmap
-    shading = generate_height_shading(heightmap)
-
-    for y in range(height):
-        for x in range(width):
-            biome = biome_map[y, x]
-            elevation = heightmap[y, x]
-            moisture = moisture_map[y, x]
-            shade = shading[y, x]
-
-            # Select base color based on biome
-            if biome == 0:  # Water
-                if elevation < 0.25:
-                    base_color = ColorPalette.DEEP_WATER
-                elif elevation < 0.28:
-                    base_color = ColorPalette.SHALLOW_WATER
-                else:
-                    base_color = ColorPalette.WATER_HIGHLIGHT
-            elif biome == 1:  # Sand
-                base_color = ColorPalette.BEACH_SAND if moisture > 0.4 else ColorPalette.SAND_SHADOW
-            elif biome == 2:  # Grass
-                if moisture > 0.6:
-                    base_color = ColorPalette.GRASS_DARK
-                elif moisture > 0.4:
-                    base_color = ColorPalette.GRASS_LIGHT
-                else:
-                    base_color = ColorPalette.GRASS_HIGHLIGHT
-            elif biome == 3:  # Forest
-                base_color = ColorPalette.FOREST_DARK if moisture > 0.5 else ColorPalette.FOREST_MID
-            else:  # Mountain
-                if elevation > 0.9:
-                    base_color = ColorPalette.MOUNTAIN_SNOW
-                elif elevation > 0.87:
-                    base_color = ColorPalette.MOUNTAIN_MID
-                else:
-                    base_color = ColorPalette.MOUNTAIN_DARK
-
-            # Apply shading
-            shade_factor = 0.7 + shade * 0.6  # Range: 0.7 to 1.3
-            colors[y, x] = [
-                min(255, int(base_color[0] * shade_factor)),
-                min(255, int(base_color[1] * shade_factor)),
-                min(255, int(base_color[2] * shade_factor))
-            ]
-
-    return colors
+    # Turn the heightmap lighting into the shade factor in its own buffer
+    shade_factor = generate_height_shading(heightmap)
+    shade_factor *= 0.6
+    shade_factor += 0.7  # Range: 0.7 to 1.3
+
+    # Pick each cell's palette variant from the factor its biome keys on
+    biome = np.clip(biome_map, 0, 4)
+    moisture_variant = np.digitize(moisture_map, (0.4, 0.6), right=True)
+    variant = np.select(
+        [biome == 0, biome == 3, biome == 4],
+        [np.digitize(heightmap, (0.25, 0.28)),
+         moisture_map > 0.5,
+         np.digitize(heightmap, (0.87, 0.9), right=True)],
+        moisture_variant
+    )
+
+    # Apply shading
+    colors = _TERRAIN_PALETTE[biome, variant] * shade_factor[..., None]
+    np.clip(colors, 0, 255, out=colors)
+
+    return colors.astype(np.uint8)
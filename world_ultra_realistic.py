@@ -612,6 +612,10 @@ class UltraRealisticWorld(ShowBase):
             (0.7, 0.4, 0.8),  # Purple shirt
         ]
 
+        # One card maker shared by every agent (frame never changes)
+        cm = CardMaker("agent")
+        cm.setFrame(-0.3, 0.3, -0.9, 0.9)  # Tall thin rectangle
+
         character_count = 0
         for i, road in enumerate(roads_to_use):
             if character_count >= max_characters:
@@ -629,8 +633,6 @@ class UltraRealisticWorld(ShowBase):
             char_node = self.world_root.attachNewNode(f"agent_{character_count}")
             char_node.setPos(x, z, 0.9)  # Half height above ground
 
-            cm = CardMaker("agent")
-            cm.setFrame(-0.3, 0.3, -0.9, 0.9)  # Tall thin rectangle
             char_card = char_node.attachNewNode(cm.generate())
             char_card.setColor(*agent_colors[character_count % len(agent_colors)], 1.0)
 